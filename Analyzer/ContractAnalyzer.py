@@ -1,37 +1,63 @@
 # SolidityGuardian/Analyzers/ContractAnalyzer.py
 from Utils.CFG import *
-from solcx import (
-    install_solc,
-    set_solc_version,
-    compile_source,
-    get_installed_solc_versions
-)
-from solcx.exceptions import SolcError
 from Domain.AddressSet import address_manager, AddressSet
 from Domain.Interval import IntegerInterval, UnsignedIntegerInterval, BoolInterval
+from Domain.IR import DebugDirective
 from Utils.Helper import *
 from Utils.Snapshot import *
+from Utils.SolcService import solc_service, SolcUnavailable
+from Utils.TokenStore import LineTokenStore
+from Utils.ScopeIndex import ScopeIndex, reduce_braces
+from Utils.LineStore import LineStore
 from Analyzer.DynamicCFGBuilder import DynamicCFGBuilder
 from Analyzer.RecordManager import RecordManager
 from Analyzer.StaticCFGFactory import StaticCFGFactory
+from Analyzer.Transaction import AnalyzerTransaction
 from Interpreter.Semantics.Evaluation import Evaluation
 from Interpreter.Semantics.Update import Update
 from Interpreter.Semantics.DebugInitializer import DebugInitializer
 from Interpreter.Semantics.Refine import Refine
+from Interpreter.Semantics.Summary import FunctionSummaries
 from Interpreter.Engine import Engine
 
 import re
 
 class ContractAnalyzer:
 
-    def __init__(self):
+    # delete 이벤트의 구문 검증 방식
+    #   "fast" : line_info 괄호 균형 + ANTLR sourceUnit 파싱 (프로세스 내, solc 불필요)
+    #   "solc" : fast 검사 후 solc_service 로 한 번 더 (solc 를 못 쓰면 알리고 fast 로 전환)
+    VALIDATION_MODES = ("fast", "solc")
+
+    # 구문 오류가 있는 fragment 는 visitor 를 돌리지 않음 → CFG 변경·재해석 생략
+    SKIP_BROKEN_FRAGMENTS = True
+
+    def __init__(self, parse_mode: str | None = None, delete_validation: str = "fast"):
+        # parse_mode : "ll" | "sll"  (None 이면 ParserHelpers 의 현재 설정 유지)
+        #   ParserHelpers 는 프로세스 전역이므로 마지막으로 지정한 모드가 적용된다.
+        if parse_mode is not None:
+            ParserHelpers.set_prediction_mode(parse_mode)
+        if delete_validation not in self.VALIDATION_MODES:
+            raise ValueError(f"unknown delete_validation '{delete_validation}' "
+                             f"(expected one of {self.VALIDATION_MODES})")
+        self.delete_validation = delete_validation
+
         self.addr_mgr = address_manager  # 싱글톤 AddressManager
         self.snapman = SnapshotManager()
         self._batch_targets: set[FunctionCFG] = set()  # 🔹추가
-
-        self.full_code = None
-        self.full_code_lines = {} # 라인별 코드를 저장하는 딕셔너리
-        self.line_info = {} # 각 라인에서 `{`와 `}`의 개수를 저장하는 딕셔너리
+        self._transactions: list[AnalyzerTransaction] = []  # 열린 트랜잭션 (안쪽이 뒤)
+
+        # 라인 저장소 – 라인 번호는 위치로 계산되어 삽입/삭제 시 뒤쪽 키를 옮기지 않는다.
+        # line_info / ledger / 토큰은 라인 핸들에 붙은 column 이라 라인과 함께 이동하고,
+        # CFGNode / Statement 의 src_line 도 self.lines.anchor() 로 만든 핸들이라 현재 번호로 해석된다.
+        self.lines = LineStore()
+        self.full_code_lines = self.lines # 라인별 코드 (dict 처럼 사용)
+        self.line_info = self.lines.column("info") # 각 라인에서 `{`와 `}`의 개수를 저장
+        self.line_tokens = LineTokenStore(self.lines.column("tokens"))  # 라인별 토큰 (증분 렉싱)
+        self.scope_index = ScopeIndex()      # 라인별 괄호로 만든 scope 트리 (find_*_context 용)
+        self._edit_range: tuple[int, int] | None = None  # 마지막 add/modify 가 쓴 라인 범위
+        self._parse_skip = {"fragments": 0, "skipped": 0, "errors": 0}
+        self.last_syntax_errors = []  # 마지막으로 건너뛴 fragment 의 SyntaxIssue 목록
 
         self.current_start_line = None
         self.current_end_line = None
@@ -55,8 +81,9 @@ class ContractAnalyzer:
         self.debug_initializer = DebugInitializer(self)
         self.refiner = Refine(self)
         self.engine = Engine(self)
+        self.summaries = FunctionSummaries(self)
         self.builder = DynamicCFGBuilder(self)
-        self.recorder = RecordManager()
+        self.recorder = RecordManager(self.lines.column("ledger", list), on_write=self.tx_touch_line)
 
         self.analysis_per_line = self.recorder.ledger
 
@@ -132,43 +159,6 @@ class ContractAnalyzer:
         # ⑥ succ부터 reinterpret
         self.engine.reinterpret_from(fcfg, succ)
 
-    def _shift_meta(self, old_ln: int, new_ln: int):
-        """
-        소스 라인 이동(old_ln → new_ln)에 맞춰
-        line_info / recorder.ledger / Statement.src_line / CFGNode.src_line 동기화
-        """
-        # ① line_info에 등록된 cfg_nodes들의 src_line 보정 (먼저 수행)
-        if old_ln in self.line_info:
-            info = self.line_info[old_ln]
-            if isinstance(info.get("cfg_nodes"), list):
-                for node in info["cfg_nodes"]:
-                    if hasattr(node, "src_line") and node.src_line == old_ln:
-                        node.src_line = new_ln
-
-        # ② line_info & recorder.ledger 이동
-        dicts_to_shift = (self.line_info, self.recorder.ledger)
-        for d in dicts_to_shift:
-            if old_ln in d:
-                # (간단버전) 덮어쓰기. 이미 new_ln 에 값이 있으면 합치고 싶다면 merge 로직을 쓰세요.
-                d[new_ln] = d.pop(old_ln)
-
-        # ③ 이미 생성된 CFG-Statement 들의 src_line 보정
-        stmt_count = 0
-        for ccf in self.contract_cfgs.values():
-            for fcfg in ccf.functions.values():
-                for blk in fcfg.graph.nodes:
-                    # CFGNode 자체의 src_line도 업데이트
-                    if getattr(blk, "src_line", None) == old_ln:
-                        blk.src_line = new_ln
-                    # Statement들의 src_line 업데이트
-                    for st in blk.statements:
-                        if getattr(st, "src_line", None) == old_ln:
-                            st.src_line = new_ln
-                            stmt_count += 1
-        if stmt_count > 0:
-            pass
-            # print(f"DEBUG _shift_meta: Shifted {stmt_count} statements from line {old_ln} to {new_ln}")
-
     def _insert_lines(self, start: int, new_lines: list[str]):
         new_lines = self.normalize_compound_control_lines(new_lines)
         offset = len(new_lines)
@@ -227,14 +217,16 @@ class ContractAnalyzer:
 
         # 뒤 라인 밀기 (skip_shift_at_start이면 start+1부터)
         shift_from = start + 1 if skip_shift_at_start else start
-        for old_ln in sorted([ln for ln in self.full_code_lines if ln >= shift_from], reverse=True):
-            self.full_code_lines[old_ln + offset] = self.full_code_lines.pop(old_ln)
-            self._shift_meta(old_ln, old_ln + offset)
+        #   (line_info / ledger / 토큰 / src_line 은 라인 핸들을 따라 함께 이동)
+        self.lines.insert_lines(shift_from, offset)
+        self.scope_index.insert_lines(shift_from, offset)
 
         # 삽입
+        self._edit_range = (start, start + offset - 1)
         for i, ln in enumerate(range(start, start + offset)):
             line = new_lines[i]
             self.full_code_lines[ln] = line
+            self.line_tokens.set_line(ln, line)
             self.update_brace_count(ln, line)  # ★ 항상 카운트
             if self._should_trigger_analysis(line):  # ★ 트리거 라인만 분석
                 self.analyze_context(ln, line)
@@ -282,44 +274,29 @@ class ContractAnalyzer:
                 return
 
             ln = start_line
+            self._edit_range = (start_line, start_line + len(norm_lines) - 1)
             for line in norm_lines:
                 self.full_code_lines[ln] = line
+                self.line_tokens.set_line(ln, line)  # 텍스트가 같으면 재렉싱 생략
                 self.update_brace_count(ln, line)  # ★ 추가
                 if self._should_trigger_analysis(line):  # ★ 추가
                     self.analyze_context(ln, line)
                 ln += 1
 
         elif event == "delete":
-            offset = end_line - start_line + 1
-
             # ① syntax validation: 삭제 후 코드가 유효한지 확인
-            candidate_lines = {ln: code for ln, code in self.full_code_lines.items()
-                               if ln < start_line or ln > end_line}
-            candidate_code = "\n".join(candidate_lines[ln] for ln in sorted(candidate_lines))
-            try:
-                compile_source(candidate_code)
-            except SolcError:
+            if not self._validate_deletion(start_line, end_line):
                 print(f"[err] Deletion of lines {start_line}-{end_line} produces invalid syntax")
                 return
 
             # ② CFG 노드 제거 및 엣지 재연결 (line_info pop 전에 수행)
             self._remove_cfg_nodes(start_line, end_line)
 
-            # ③ 기존 라인 제거
-            for ln in range(start_line, end_line + 1):
-                self.full_code_lines.pop(ln, None)
-                self.line_info.pop(ln, None)
-                self.recorder.ledger.pop(ln, None)
-
-            # ④ 뒤쪽 라인 당기기
-            keys_to_shift = sorted([ln for ln in self.full_code_lines if ln > end_line])
-            for old_ln in keys_to_shift:
-                new_ln = old_ln - offset
-                self.full_code_lines[new_ln] = self.full_code_lines.pop(old_ln)
-                self._shift_meta(old_ln, new_ln)
-
-        # full-code 재조합
-        self.full_code = "\n".join(self.full_code_lines[ln] for ln in sorted(self.full_code_lines))
+            # ③ 기존 라인 제거 + 뒤쪽 라인 당기기 (line_info / ledger / 토큰 포함)
+            self.lines.delete_lines(start_line, end_line)
+            self.line_tokens.delete(start_line, end_line)  # 블록 주석 경계만 재확인
+            self.scope_index.delete_lines(start_line, end_line)
+            self._edit_range = None
 
         # add/modify 후 전체 블록의 컨텍스트 설정
         # 여러 줄짜리 정의(함수/constructor/modifier 등)의 경우,
@@ -328,6 +305,56 @@ class ContractAnalyzer:
         if event in {"add", "modify"} and new_code.strip():
             self.analyze_context(start_line, new_code)
 
+    # ────────────────────────────────────────────────────────────────
+    #  delete 구문 검증
+    # ----------------------------------------------------------------
+    def _validate_deletion(self, start_line: int, end_line: int) -> bool:
+        """[start_line, end_line] 를 지운 코드가 구문상 유효한지 검사."""
+        # 삭제 구간 앞/뒤 라인 구간 view 로 후보 코드 조립 (full_code 캐시는 건드리지 않음)
+        # '// @' 디버그 주석 라인은 문법상 debug 토큰으로 렉싱되므로 sourceUnit 검사에서는
+        # 빈 줄로 바꾼다 (라인 번호는 유지)
+        candidate_code = "\n".join("" if t.lstrip().startswith("// @") else t
+                                   for part in (self.lines.range_items(1, start_line - 1),
+                                                self.lines.range_items(end_line + 1))
+                                   for _, t in part)
+
+        # ⓐ 괄호 균형 – line_info 에 이미 있는 카운트만 사용 (O(lines))
+        depth = 0
+        for part in (self.line_info.range_items(1, start_line - 1),
+                     self.line_info.range_items(end_line + 1)):
+            for _, info in part:
+                depth += info["open"] - info["close"]
+                if depth < 0:
+                    return False
+        if depth != 0:
+            return False
+
+        # ⓑ ANTLR 전체 파싱 (SLL 우선, 실패 시 LL 로 오류 수집)
+        errors = ParserHelpers.check_syntax(candidate_code, "sourceUnit")
+        for err in errors[:3]:
+            print(f"[err] {err.line}:{err.column} {err.msg}")
+        if errors:
+            return False
+
+        # ⓒ solc 모드 – fast 검사를 통과한 삭제만 solc 로 한 번 더 (결과는 solc_service 캐시)
+        if self.delete_validation == "solc":
+            ok = self._validate_with_solc(candidate_code)
+            if ok is not None:
+                return ok
+        return True
+
+    def _validate_with_solc(self, candidate_code: str) -> bool | None:
+        """
+        solc 엄격 검사 (solc_service 공유).  solc 를 쓸 수 없으면 한 번만 알리고
+        이 analyzer 를 "fast" 모드로 내린 뒤 None – 이후 삭제는 solc 를 다시 찾지 않는다.
+        """
+        try:
+            return solc_service.compile(candidate_code).ok
+        except (SolcUnavailable, OSError) as e:
+            print(f"[info] {e} – delete_validation falls back to 'fast'")
+            self.delete_validation = "fast"
+            return None
+
     def normalize_compound_control_lines(self, lines: list[str]) -> list[str]:
         """
         한 물리 라인에 '} else if', '} else', '} while' 이 붙어있는 경우
@@ -353,24 +380,19 @@ class ContractAnalyzer:
         return out
 
     def compile_check(self) -> None:
+        # 설치 버전 조회·실행 파일 경로는 solc_service 가 memoize,
+        # 같은 full_code 는 (sha256, 버전) 캐시에서 즉시 반환된다.
         wanted = '0.8.0'
-
-        # ① 아직 안 깔려 있으면 다운로드
-        if wanted not in get_installed_solc_versions():
-            print(f"[info] installing solc {wanted} …")
-            install_solc(wanted)  # 네트워크·권한 오류나면 여기서 예외 발생
-
-        # ② 방금(또는 이전에) 받은 버전을 active 로 지정
-        set_solc_version(wanted)
-
-        # ③ 실제 컴파일
         try:
-            compile_source(self.full_code)
-            print("[ok] solidity compiled successfully")
-        except SolcError as e:
-            print("[err] Solidity compiler reported:\n", e)
+            result = solc_service.compile(self.full_code or "", version=wanted, install=True)
         except Exception as e:
             print("[err] unexpected:", e)
+            return
+
+        if result.ok:
+            print("[ok] solidity compiled successfully")
+        else:
+            print("[err] Solidity compiler reported:\n", result.error_message())
 
     def update_brace_count(self, line_number, code):
         open_braces = code.count('{')
@@ -381,6 +403,7 @@ class ContractAnalyzer:
         info = self.line_info[line_number]
         info['open'] = open_braces
         info['close'] = close_braces
+        self.scope_index.set_counts(line_number, *reduce_braces(code))
 
     def analyze_context(self, start_line, new_code):
         stripped_code = (new_code or "").strip()
@@ -497,135 +520,88 @@ class ContractAnalyzer:
         if self.current_context_type == "simpleStatement" and not self.current_target_function:
             raise ValueError(f"Function context not found for simple statement at line {start_line}")
 
-    def find_parent_context(self, line_number):
-        close_brace_count = 0
-
-        # 위로 거슬러 올라가면서 `{`와 `}`의 짝을 찾기
-        for line in range(line_number - 1, 0, -1):
-            brace_info = self.line_info.get(line, {'open': 0, 'close': 0, 'cfg_nodes': []})
-            open_braces = brace_info['open']
-            close_braces = brace_info['close']
-
-            if close_brace_count > 0:
-                close_brace_count -= open_braces
-                if close_brace_count <= 0:
-                    close_brace_count = 0
-            else:
-                if open_braces > 0:
-                    return self.determine_top_level_context(self.full_code_lines[line])
-                close_brace_count += close_braces
+    # ────────────────────────────────────────────────────────────────
+    #  scope 조회 (ScopeIndex – O(log n))
+    # ----------------------------------------------------------------
+    _FUNC_HEADS = ("function ", "constructor", "modifier ", "fallback", "receive")
+    _NON_FUNC_HEADS = ("contract ", "library ", "interface ", "struct ", "enum ")
+
+    def _scope_header_line(self, opener: int) -> int:
+        """
+        scope 를 연 라인에서 여러 줄짜리 헤더의 첫 줄을 찾는다.
+        예: 'function f(' / 'uint a,' / ') public {'  →  'function f(' 라인
+        헤더에는 ';' '{' '}' 가 없으므로 그런 라인을 만나면 멈춘다 (헤더 길이만큼만 탐색).
+        """
+        code = self.full_code_lines.get(opener, "").strip()
+        if self.determine_top_level_context(code) != "simpleStatement":
+            return opener
+        ln = opener - 1
+        while ln > 0:
+            code = self.full_code_lines.get(ln, "").strip()
+            if code.startswith(self._FUNC_HEADS + self._NON_FUNC_HEADS):
+                return ln
+            if any(ch in code for ch in ";{}"):
+                break
+            ln -= 1
+        return opener
 
-        return "unknown"
+    def find_parent_context(self, line_number):
+        scope = self.scope_index.scope_at(line_number - 1)
+        if scope is None:
+            return "unknown"
+        return self.determine_top_level_context(self.full_code_lines[scope.line])
 
     def find_contract_context(self, line_number):
-        # 위로 거슬러 올라가면서 해당 라인이 속한 컨트랙트를 찾습니다.
-        close_brace_count = 0
-
-        for line in range(line_number, 0, -1):
-            brace_info = self.line_info.get(line, {'open': 0, 'close': 0, 'cfg_nodes': []})
-            open_braces = brace_info['open']
-            close_braces = brace_info['close']
-
-            # '}' 카운팅: 닫힌 괄호를 먼저 센다
-            if close_brace_count > 0:
-                close_brace_count -= open_braces
-                if close_brace_count <= 0:
-                    close_brace_count = 0
-            else:
-                # '{' 발견: 이 라인이 컨트랙트 선언인지 확인
-                if open_braces > 0:
-                    code_line = self.full_code_lines.get(line, '').strip()
-                    context_type = self.determine_top_level_context(code_line)
-                    if context_type in ["contract", "library", "interface", "abstract contract"]:
-                        # contract 이름 추출
-                        parts = code_line.split()
-                        # "abstract contract Name" or "contract Name" 형식
-                        if "contract" in parts:
-                            idx = parts.index("contract")
-                            if idx + 1 < len(parts):
-                                result = parts[idx + 1].split('{')[0].strip()
-                                return result
-                        elif "library" in parts:
-                            idx = parts.index("library")
-                            if idx + 1 < len(parts):
-                                result = parts[idx + 1].split('{')[0].strip()
-                                return result
-                        elif "interface" in parts:
-                            idx = parts.index("interface")
-                            if idx + 1 < len(parts):
-                                result = parts[idx + 1].split('{')[0].strip()
-                                return result
-                # 닫힌 괄호 누적
-                close_brace_count += close_braces
-
+        # 해당 라인을 감싸는 scope 를 안쪽부터 바깥쪽으로 따라가며 컨트랙트를 찾습니다.
+        for scope in self.scope_index.ancestors(line_number):
+            code_line = self.full_code_lines.get(scope.line, '').strip()
+            context_type = self.determine_top_level_context(code_line)
+            if context_type not in ["contract", "library", "interface", "abstract contract"]:
+                continue
+            # "abstract contract Name" or "contract Name" 형식
+            parts = code_line.split()
+            for kw in ("contract", "library", "interface"):
+                if kw in parts:
+                    idx = parts.index(kw)
+                    if idx + 1 < len(parts):
+                        return parts[idx + 1].split('{')[0].strip()
+                    break
         return None
 
     def find_function_context(self, line_number):
-        # 위로 거슬러 올라가면서 해당 라인이 속한 함수를 찾습니다.
-        # 방법 1: '{' 문자가 있는 라인을 찾고, 그 라인부터 위로 function 키워드를 찾는다
-
-        # 먼저 가장 가까운 '{' 문자가 있는 라인을 찾기
-        open_brace_line = None
-        close_brace_count = 0
-
-        for line in range(line_number, 0, -1):
-            brace_info = self.line_info.get(line, {'open': 0, 'close': 0, 'cfg_nodes': []})
-            open_braces = brace_info['open']
-            close_braces = brace_info['close']
-
-            if close_brace_count > 0:
-                close_brace_count -= open_braces
-                if close_brace_count <= 0:
-                    close_brace_count = 0
-            else:
-                if open_braces > 0:
-                    open_brace_line = line
-                    break
-                close_brace_count += close_braces
+        # 해당 라인을 감싸는 scope 중 가장 안쪽 function/constructor/modifier 를 찾습니다.
+        for scope in self.scope_index.ancestors(line_number):
+            code_line = self.full_code_lines.get(self._scope_header_line(scope.line), "").strip()
 
-        if open_brace_line is None:
-            return None
-
-        # '{' 문자가 있는 라인부터 위로 올라가면서 function/constructor/modifier 키워드를 찾기
-        for line in range(open_brace_line, 0, -1):
-            code_line = self.full_code_lines.get(line, "").strip()
-            if not code_line:
-                continue
-
-            # function, constructor, modifier 키워드를 찾으면 함수 이름 추출
             if code_line.startswith("function "):
-                # 함수 이름 추출
                 parts = code_line.split()
                 if len(parts) >= 2:
-                    function_name = parts[1].split('(')[0]
-                    return function_name
+                    return parts[1].split('(')[0]
             elif code_line.startswith("constructor"):
                 return "constructor"
             elif code_line.startswith("modifier "):
                 parts = code_line.split()
                 if len(parts) >= 2:
-                    modifier_name = parts[1].split('(')[0]
-                    return modifier_name
+                    return parts[1].split('(')[0]
             elif code_line.startswith("fallback"):
                 return "fallback"
             elif code_line.startswith("receive"):
                 return "receive"
 
             # contract/struct/interface 등을 만나면 함수가 아니므로 중단
-            if any(code_line.startswith(kw) for kw in ["contract ", "library ", "interface ", "struct ", "enum "]):
+            if code_line.startswith(self._NON_FUNC_HEADS):
                 break
-
         return None
 
     def find_struct_context(self, line_number):
-        # 위로 거슬러 올라가면서 해당 라인이 속한 함수를 찾습니다.
-        for line in range(line_number, 0, -1):
-            brace_info = self.line_info.get(line, {'open': 0, 'close': 0, 'cfg_nodes': []})
-            cfg_nodes = brace_info.get('cfg_nodes', [])
-            if brace_info['open'] > 0 and cfg_nodes:
-                context_type = self.determine_top_level_context(self.full_code_lines[line])
-                if context_type == "struct":
-                    return self.full_code_lines[line].split()[1]
+        # 해당 라인을 감싸는 struct 정의를 찾습니다.
+        for scope in self.scope_index.ancestors(line_number):
+            cfg_nodes = self.line_info.get(scope.line, {}).get('cfg_nodes', [])
+            if cfg_nodes and self.determine_top_level_context(self.full_code_lines[scope.line]) == "struct":
+                # 'struct Foo{' 처럼 붙어 있어도 이름만 얻도록 토큰 사용
+                texts = self.line_tokens.leading_texts(scope.line, 2)
+                return texts[1] if len(texts) == 2 else self.full_code_lines[scope.line].split()[1]
+        return None
 
     def determine_top_level_context(self, code_line):
         try:
@@ -685,9 +661,54 @@ class ContractAnalyzer:
             print(f"Error: {e}")
             return "unknown"
 
+    @property
+    def full_code(self) -> str:
+        """전체 소스 – 읽을 때만 조립하고 편집 전까지 캐시 (LineStore.text)"""
+        return self.lines.text()
+
+    def code_range(self, start: int, end: int | None = None) -> str:
+        """[start, end] 라인 구간의 소스 (전체 조립 없이 O(log n + k))"""
+        return self.lines.text(start, end)
+
     def get_full_code(self):
         return self.full_code
 
+    def accept_parse_tree(self, tree) -> bool:
+        """
+        visitor 진입 전 관문. 구문 오류가 있는 fragment 면 False (CFG 변경·재해석 스킵).
+        line_info / full_code_lines 갱신은 update_code 에서 이미 끝났으므로
+        사용자가 줄을 고치면 다음 modify 이벤트에서 정상 처리된다.
+        """
+        errors = ParserHelpers.syntax_errors(tree)
+        if getattr(tree, "lexed_from_store", False) and self._edit_range:
+            errors = self.line_tokens.fragment_errors(*self._edit_range) + errors
+        self._parse_skip["fragments"] += 1
+        if not errors or not self.SKIP_BROKEN_FRAGMENTS:
+            return True
+
+        self._parse_skip["skipped"] += 1
+        self._parse_skip["errors"] += len(errors)
+        self.last_syntax_errors = errors
+        first = errors[0]
+        print(f"[skip] {len(errors)} syntax error(s) – fragment {first.line}:"
+              f"{first.column}-{first.end_column} {first.msg}")
+        return False
+
+    def parse_skip_stats(self) -> dict[str, float]:
+        """fragments / skipped / errors 와 skip_rate(= skipped / fragments)."""
+        st = dict(self._parse_skip)
+        st["skip_rate"] = (st["skipped"] / st["fragments"]) if st["fragments"] else 0.0
+        return st
+
+    def edit_tokens(self) -> list | None:
+        """
+        마지막 add/modify 로 들어온 라인들의 토큰 (LineTokenStore 에서 복제).
+        ParserHelpers.generate_parse_tree(code, ctx, tokens=...) 에 넘기면 재렉싱을 건너뛴다.
+        """
+        if self._edit_range is None:
+            return None
+        return self.line_tokens.fragment_tokens(*self._edit_range)
+
     def get_current_context_type(self):
         return self.current_context_type
 
@@ -850,7 +871,8 @@ class ContractAnalyzer:
         self.register_var(variable_obj)
 
         # 4. 상태 변수를 ContractCFG에 추가
-        contract_cfg.add_state_variable(variable_obj, expr=init_expr, line_no=self.current_start_line)
+        contract_cfg.add_state_variable(variable_obj, expr=init_expr,
+                                      line_no=self.lines.anchor(self.current_start_line))
 
         # 5. ContractCFG에 있는 모든 FunctionCFG에 상태 변수 추가
         for function_cfg in contract_cfg.functions.values():
@@ -914,7 +936,8 @@ class ContractAnalyzer:
         self.register_var(variable_obj)
 
         # 3. ContractCFG 에 추가 (state 변수와 동일 API 사용)
-        contract_cfg.add_state_variable(variable_obj, expr=init_expr, line_no=self.current_start_line)
+        contract_cfg.add_state_variable(variable_obj, expr=init_expr,
+                                      line_no=self.lines.anchor(self.current_start_line))
 
         # 4. 이미 생성된 모든 FunctionCFG 에 read-only 변수로 연동
         for fn_cfg in contract_cfg.functions.values():
@@ -1810,7 +1833,7 @@ class ContractAnalyzer:
 
                 # CFG Statement
                 init_node.add_variable_declaration_statement(
-                    v_type, v_name, init_expr, self.current_start_line
+                    v_type, v_name, init_expr, self.lines.anchor(self.current_start_line)
                 )
 
             elif ctx == "Expression":
@@ -1825,7 +1848,7 @@ class ContractAnalyzer:
                 # CFG Statement
                 init_node.add_assign_statement(
                     assn_expr.left, assn_expr.operator, assn_expr.right,
-                    self.current_start_line,
+                    self.lines.anchor(self.current_start_line),
                 )
             else:
                 raise ValueError(f"[for] unknown init ctx '{ctx}'")
@@ -1860,7 +1883,7 @@ class ContractAnalyzer:
                 incr_node.add_unary_statement(
                     operand=increment_expr.expression,  # 전체 i++ 식
                     operator=increment_expr.operator,  # '++' or '--'
-                    line_no=self.current_start_line,
+                    line_no=self.lines.anchor(self.current_start_line),
                 )
 
             # ---- 복합 대입( += n / -= n … ) --------------------
@@ -1872,7 +1895,7 @@ class ContractAnalyzer:
                     increment_expr.left, r_val, op, incr_node.variables, None, None, False)
                 incr_node.add_assign_statement(
                     increment_expr.left, op, increment_expr.right,
-                    self.current_start_line)
+                    self.lines.anchor(self.current_start_line))
 
         exit_node = self.builder.build_for_statement(
             cur_block=cur_blk,
@@ -2286,6 +2309,17 @@ class ContractAnalyzer:
         # ★ 합류점에서 재해석 시작
         self.engine.reinterpret_from(fcfg, join)
 
+    def process_debug_directive(self, d: DebugDirective) -> None:
+        """lowering 된 디버그 주석 한 줄을 종류별 process_*_for_debug 로 적용"""
+        if d.kind == "global":
+            self.process_global_var_for_debug(d.target)
+        elif d.kind == "state":
+            self.process_state_var_for_debug(d.target, d.value)
+        elif d.kind == "local":
+            self.process_local_var_for_debug(d.target, d.value)
+        else:
+            raise ValueError(f"unknown debug directive {d.kind!r}")
+
     def process_global_var_for_debug(self, gv_obj: GlobalVariable):
         """
         @GlobalVar …   처리
@@ -2298,13 +2332,18 @@ class ContractAnalyzer:
         cfg = self.contract_cfgs[self.current_target_contract]
         self.current_target_function_cfg = cfg.get_function_cfg(self.current_target_function)
 
+        if self.current_target_function_cfg is not None:
+            self.tx_touch_function(self.current_target_function_cfg)
+
         # ── 등록이 처음이면 snapshot ⬇︎
         if gv_obj.identifier not in cfg.globals:
+            self.tx_touch_dict(cfg.globals)
             gv_obj.default_value = gv_obj.value
             cfg.globals[gv_obj.identifier] = gv_obj
             self.snapman.register(gv_obj, self.ser)  # ★ 스냅
 
         g = cfg.globals[gv_obj.identifier]
+        self.tx_touch(g)
 
         # ── add/modify ───────────────────────────────────────────
         if ev in ("add", "modify"):
@@ -2340,6 +2379,8 @@ class ContractAnalyzer:
             if self.current_target_function_cfg is None:
                 raise ValueError("@StateVar must be inside a function.")
 
+            self.tx_touch_function(self.current_target_function_cfg)
+
             self.debug_initializer.apply_debug_directive_enhanced(
                 scope="state",
                 lhs_expr=lhs_expr,
@@ -2364,6 +2405,8 @@ class ContractAnalyzer:
         if self.current_target_function_cfg is None:
             raise ValueError("@LocalVar must be inside a function.")
 
+        self.tx_touch_function(self.current_target_function_cfg)
+
         self.debug_initializer.apply_debug_directive_enhanced(
             scope="local",
             lhs_expr=lhs_expr,
@@ -2427,11 +2470,13 @@ class ContractAnalyzer:
 
     # ContractAnalyzer.py  (클래스 내부)
 
-    def flush_reinterpret_target(self) -> None:
+    def flush_reinterpret_target(self, checkpoint=None) -> None:
         if not self._batch_targets:
             return
         fcfg = self._batch_targets.pop()
-        self.engine.interpret_function_cfg_for_debug(fcfg, None)  # ★ 디버깅용 함수 사용
+        if checkpoint is not None and checkpoint.fcfg is not fcfg:
+            checkpoint = None
+        self.engine.interpret_function_cfg_for_debug(fcfg, None, checkpoint=checkpoint)  # ★ 디버깅용 함수 사용
 
         ln_set = {st.src_line
                   for blk in fcfg.graph.nodes
@@ -2453,4 +2498,31 @@ class ContractAnalyzer:
 
     # 공통 ‘한 줄 helper’
     def register_var(self, var_obj):
-        self.snapman.register(var_obj, self.ser)
\ No newline at end of file
+        self.snapman.register(var_obj, self.ser)
+
+    # ──────────────────────────────────────────────────────────────
+    # 트랜잭션 – 디버그 주석 적용/재해석을 격리 (Analyzer/Transaction.py)
+    # ----------------------------------------------------------------
+    def transaction(self) -> AnalyzerTransaction:
+        """with analyzer.transaction() as tx: … – 블록이 끝나면 commit() 하지 않은 변경은 rollback"""
+        return AnalyzerTransaction(self).begin()
+
+    def tx_touch(self, obj) -> None:
+        """obj 를 고치기 직전 호출 – 열린 트랜잭션마다 처음 한 번 그 상태를 기록"""
+        for tx in self._transactions:
+            tx.touch(obj)
+
+    def tx_touch_function(self, fcfg) -> None:
+        """fcfg 를 해석하거나 진입 변수를 고치기 직전 호출 – 노드 / return var / ledger 를 기록"""
+        for tx in self._transactions:
+            tx.touch_function(fcfg)
+
+    def tx_touch_line(self, line_no: int) -> None:
+        """ledger 의 line_no 기록을 고치기 직전 호출 (RecordManager.on_write)"""
+        for tx in self._transactions:
+            tx.touch_line(line_no)
+
+    def tx_touch_dict(self, d: dict) -> None:
+        """d 에 넣거나 빼기 직전 호출"""
+        for tx in self._transactions:
+            tx.touch_dict(d)
\ No newline at end of file
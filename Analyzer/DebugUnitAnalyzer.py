@@ -1,7 +1,11 @@
 # Analyzer/DebugBatchManager.py
 # ────────────────────────────
+import copy
+
 from Utils.Helper              import ParserHelpers
 from Analyzer.EnhancedSolidityVisitor import EnhancedSolidityVisitor
+from Interpreter.PrefixCheckpoint import PrefixCheckpoint
+from Domain.IR                 import DebugDirective
 
 class DebugBatchManager:
     """
@@ -12,12 +16,20 @@ class DebugBatchManager:
       • delete  → 제거
     flush() 는 ‘현재 보관 중인 모든 라인’을 해석만 하고
     _lines 는 지우지 않는다.  (@TestCase BEGIN 때만 초기화)
+    각 라인은 처음 flush 될 때 한 번만 파싱해 DebugDirective 로 보관한다 (modify/delete 시 폐기).
+    재해석은 직전 flush 이후 값이 바뀐 주석 변수를 처음 읽는 노드부터 한다.
+    flush_batch(cases) 는 같은 함수의 주석 세트 여러 개를 한 번에 해석한다.
     """
     def __init__(self, analyzer, snapman):
         # key = startLine, value = (code,start,end)
         self._lines: dict[int, tuple[str, int, int]] = {}
+        # key = startLine, value = (code, lowering 결과)
+        self._lowered: dict[int, tuple[str, tuple[DebugDirective, ...]]] = {}
         self.analyzer = analyzer
         self.snapman  = snapman
+        self.last_batch_shared = 0      # 마지막 flush_batch 에서 케이스끼리 공유한 노드 수
+        self._checkpoint: PrefixCheckpoint | None = None     # 직전 flush 의 기준 해석
+        self.flush_stats = {"full": 0, "incremental": 0}
 
     # ── 라인 조작 ──────────────────────────────────────────
     def add_line(self, code: str, s: int, e: int):
@@ -25,29 +37,135 @@ class DebugBatchManager:
 
     def modify_line(self, code: str, s: int, e: int):
         self._lines[s] = (code, s, e)          # 같은 key 교체
+        self._lowered.pop(s, None)
 
     def delete_line(self, s: int):
         self._lines.pop(s, None)
+        self._lowered.pop(s, None)
 
     # ── flush : 현재까지의 _lines 전부 해석 ────────────────
     def flush(self):
+        """
+        보관 중인 주석을 적용하고 대상 함수를 재해석한다.
+        직전 flush 의 기준 해석(PrefixCheckpoint)이 남아 있으면 값이 바뀐 주석 변수를
+        처음 읽는 노드부터만 다시 돈다 (결과는 전체 재해석과 같다).
+        도중에 예외가 나면 트랜잭션을 rollback 해 analyzer 를 flush 전 상태로 되돌린다.
+        """
         if not self._lines:
             return
-        snap = self.snapman.snapshot()
-        try:
-            for code, s, e in self._lines.values():
-                tree = ParserHelpers.generate_parse_tree(code, "debugUnit")
-                EnhancedSolidityVisitor(self.analyzer).visit(tree)
-
-            # 선택된 한 함수만 재-해석 (스냅샷 복원 전에 실행)
-            self.analyzer.flush_reinterpret_target()
-        finally:
-            # 스냅샷 복원 후에 결과 전송
-            self.snapman.restore_from_snap(snap)
+        with self.analyzer.transaction() as tx:
+            snap = self.snapman.snapshot()
+            calls = self.analyzer.engine.calls
+            calls.start_budget()
+            try:
+                self._apply(self._lines.values())
+
+                # 선택된 한 함수만 재-해석 (스냅샷 복원 전에 실행)
+                checkpoint = self._checkpoint_for(tx)
+                self.analyzer.flush_reinterpret_target(checkpoint)
+            except BaseException:
+                self._checkpoint = None
+                raise
+            finally:
+                calls.end_budget()
+                # 스냅샷 복원 후에 결과 전송
+                self.snapman.restore_from_snap(snap)
+            tx.commit()
 
         # 결과 전송 (스냅샷 복원 후)
         self.analyzer.send_report_to_front(None)
 
+    def _checkpoint_for(self, tx):
+        """이번 flush 대상 함수의 PrefixCheckpoint – 이어서 돌 수 없으면 새 기준 해석용"""
+        an = self.analyzer
+        fcfg = next(iter(an._batch_targets), None)
+        if fcfg is None:
+            return None
+        cp = self._checkpoint
+        if cp is not None and cp.fcfg is fcfg and cp.select():
+            self.flush_stats["incremental"] += 1
+            return cp
+        # 주석이 건드린 루트 변수 (DebugInitializer 의 tx_touch 지점)
+        names = {getattr(o, "identifier", None) for o in tx.touched()} - {None}
+        self._checkpoint = PrefixCheckpoint(an.engine, fcfg, names)
+        self.flush_stats["full"] += 1
+        return self._checkpoint
+
+    # ── flush_batch : 같은 함수의 주석 세트 여러 개를 한 번에 ──
+    def flush_batch(self, cases: list[list[tuple[str, int, int]]]) -> list[dict[int, list[dict]]]:
+        """
+        cases[i] = 테스트 케이스 하나의 주석 라인 (code,start,end) 목록.
+        케이스마다 따로 flush() 한 것과 같은 분석 결과(get_line_analysis)를 돌려준다.
+
+        첫 케이스의 해석을 PrefixCheckpoint 기준으로 삼고, 같은 함수에 주석 값만 다른
+        나머지 케이스는 값이 바뀐 변수를 처음 건드리는 노드부터만 해석한다.
+        analyzer 상태는 호출 전으로 돌아간다.
+        """
+        an = self.analyzer
+        out: list[dict[int, list[dict]]] = []
+        checkpoint = None
+        memo: dict[str, tuple[DebugDirective, ...]] = {}   # 보관 라인이 아닌 케이스 라인의 lowering
+        self.last_batch_shared = 0
+        with an.transaction():
+            calls = an.engine.calls
+            calls.start_budget()
+            try:
+                for lines in cases:
+                    with an.transaction() as tx:
+                        an._batch_targets.clear()
+                        self._apply(lines, memo)
+                        target = next(iter(an._batch_targets), None)
+                        an._batch_targets.clear()
+                        if target is None:
+                            out.append({})
+                            continue
+                        cp = checkpoint
+                        if checkpoint is None:
+                            names = {getattr(o, "identifier", None) for o in tx.touched()} - {None}
+                            checkpoint = cp = PrefixCheckpoint(an.engine, target, names)
+                        elif checkpoint.fcfg is not target or not checkpoint.select():
+                            cp = None       # 다른 함수 / 첫 케이스에 없던 변수 – 공유 없이
+                        an.engine.interpret_function_cfg_for_debug(target, None, checkpoint=cp)
+                        if cp is not None:
+                            self.last_batch_shared += cp.shared
+                            cp.shared = 0
+                        out.append(self._case_report(target))
+            finally:
+                calls.end_budget()
+        return out
+
+    def _apply(self, lines, memo: dict | None = None) -> None:
+        """lowering 해 둔 주석을 차례로 적용 (ANTLR 는 처음 보는 라인에서만)"""
+        for code, s, e in lines:
+            for d in self._lower(code, s, memo):
+                # 적용이 값·객체를 env / globals 에 그대로 넣으므로 보관본은 건드리지 않게
+                self.analyzer.process_debug_directive(copy.deepcopy(d))
+
+    def _lower(self, code: str, s: int, memo: dict | None = None) -> tuple[DebugDirective, ...]:
+        hit = self._lowered.get(s)
+        if hit is not None and hit[0] == code:
+            return hit[1]
+        if memo is not None and code in memo:
+            return memo[code]
+        tree = ParserHelpers.generate_parse_tree(code, "debugUnit")
+        d = tuple(EnhancedSolidityVisitor(self.analyzer).lower_debug_unit(tree))
+        stored = self._lines.get(s)
+        if stored is not None and stored[0] == code:
+            self._lowered[s] = (code, d)
+        elif memo is not None:
+            memo[code] = d
+        return d
+
+    def _case_report(self, fcfg) -> dict[int, list[dict]]:
+        """fcfg statement 라인 범위의 분석 결과 사본 (send_report_to_front 와 같은 kind)"""
+        lns = [st.src_line for blk in fcfg.graph.nodes for st in blk.statements
+               if getattr(st, "src_line", None)]
+        if not lns:
+            return {}
+        report = self.analyzer.get_line_analysis(min(lns), max(lns))
+        return {ln: [dict(r) for r in recs] for ln, recs in report.items()}
+
     # ── 테스트-케이스 새로 시작할 때 호출 ──────────────────
     def reset(self):
         self._lines.clear()
+        self._lowered.clear()
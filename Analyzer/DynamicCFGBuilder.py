@@ -19,6 +19,10 @@ class DynamicCFGBuilder:
     def eng(self):
         return self.an.engine
 
+    def _at(self, line_no):
+        """src_line 으로 넘길 라인 번호 → 이 분석기 LineStore 의 핸들"""
+        return self.an.lines.anchor(line_no)
+
     @staticmethod
     def splice_modifier(
             fn_cfg: FunctionCFG,  # 호출 중인 함수-CFG
@@ -86,7 +90,7 @@ class DynamicCFGBuilder:
         # 2) Add variable and statement to the new block
         new_block.variables[var_obj.identifier] = var_obj
         new_block.add_variable_declaration_statement(
-            type_obj, var_obj.identifier, init_expr, line_no
+            type_obj, var_obj.identifier, init_expr, self._at(line_no)
         )
 
         # 3) Add to function-scope variable table
@@ -126,7 +130,7 @@ class DynamicCFGBuilder:
             # Add individual declaration statement for each variable
             # For tuple, init_expr is None for each variable (the tuple expression is evaluated separately)
             new_block.add_variable_declaration_statement(
-                type_obj, var_obj.identifier, None, line_no
+                type_obj, var_obj.identifier, None, self._at(line_no)
             )
             # 3) Add to function-scope variable table
             # ★ 로컬 변수는 related_variables에 추가하지 않음 (state var만 있어야 함)
@@ -157,7 +161,7 @@ class DynamicCFGBuilder:
         )
 
         # 2) Add statement to the new block
-        new_block.add_assign_statement(expr.left, expr.operator, expr.right, line_no)
+        new_block.add_assign_statement(expr.left, expr.operator, expr.right, self._at(line_no))
         
         return new_block
 
@@ -185,7 +189,7 @@ class DynamicCFGBuilder:
         )
 
         # 2) Add statement to the new block
-        new_block.add_unary_statement(expr, op_token, line_no)
+        new_block.add_unary_statement(expr, op_token, self._at(line_no))
         
         return new_block
 
@@ -212,7 +216,7 @@ class DynamicCFGBuilder:
         )
 
         # 2) Add function call statement to the new block
-        new_block.add_function_call_statement(expr, line_no)
+        new_block.add_function_call_statement(expr, self._at(line_no))
 
         # 3) Update FCG
         fcfg.update_block(new_block)
@@ -237,22 +241,22 @@ class DynamicCFGBuilder:
             G.remove_edge(cur_block, s)
 
         cond = CFGNode(f"if_condition_{line_no}", condition_node=True,
-                       condition_node_type="if", src_line=line_no, is_loop_body=cur_block.is_loop_body)
+                       condition_node_type="if", src_line=self._at(line_no), is_loop_body=cur_block.is_loop_body)
         cond.condition_expr = condition_expr
         cond.variables = VariableEnv.copy_variables(cur_block.variables)
 
-        t_blk = CFGNode(f"if_true_{line_no}", branch_node=True, is_true_branch=True, src_line=line_no,
+        t_blk = CFGNode(f"if_true_{line_no}", branch_node=True, is_true_branch=True, src_line=self._at(line_no),
                         is_loop_body=cur_block.is_loop_body)
         t_blk.variables = VariableEnv.copy_variables(true_env)
 
-        f_blk = CFGNode(f"if_false_{line_no}", branch_node=True, is_true_branch=False, src_line=line_no,
+        f_blk = CFGNode(f"if_false_{line_no}", branch_node=True, is_true_branch=False, src_line=self._at(line_no),
                         is_loop_body=cur_block.is_loop_body)
         f_blk.variables = VariableEnv.copy_variables(false_env)
 
         join_env = VariableEnv.join_variables_simple(true_env, false_env)
         # ★ join의 src_line은 end_line으로 설정 (line_info[end_line]에 등록되므로 _shift_meta와 일치시킴)
         join_src_line = end_line if end_line is not None else line_no
-        join = CFGNode(f"if_join_{line_no}", join_point_node=True, src_line=join_src_line,
+        join = CFGNode(f"if_join_{line_no}", join_point_node=True, src_line=self._at(join_src_line),
                        is_loop_body=cur_block.is_loop_body)
         join.variables = VariableEnv.copy_variables(join_env)
 
@@ -306,21 +310,21 @@ class DynamicCFGBuilder:
 
         # ② 새 cond / t / f / local-join
         cond = CFGNode(f"else_if_condition_{line_no}", condition_node=True,
-                       condition_node_type="else if", src_line=line_no,
+                       condition_node_type="else if", src_line=self._at(line_no),
                        is_loop_body=prev_cond.is_loop_body)
         cond.condition_expr = condition_expr
         cond.variables = VariableEnv.copy_variables(false_base_env)
 
-        t_blk = CFGNode(f"else_if_true_{line_no}", branch_node=True, is_true_branch=True, src_line=line_no,
+        t_blk = CFGNode(f"else_if_true_{line_no}", branch_node=True, is_true_branch=True, src_line=self._at(line_no),
                         is_loop_body=prev_cond.is_loop_body)
         t_blk.variables = VariableEnv.copy_variables(true_env)
 
-        f_blk = CFGNode(f"else_if_false_{line_no}", branch_node=True, is_true_branch=False, src_line=line_no,
+        f_blk = CFGNode(f"else_if_false_{line_no}", branch_node=True, is_true_branch=False, src_line=self._at(line_no),
                         is_loop_body=prev_cond.is_loop_body)
         f_blk.variables = VariableEnv.copy_variables(false_env)
 
         local_join_env = VariableEnv.join_variables_simple(true_env, false_env)
-        local_join = CFGNode(f"else_if_join_{line_no}", join_point_node=True, src_line=line_no,
+        local_join = CFGNode(f"else_if_join_{line_no}", join_point_node=True, src_line=self._at(line_no),
                              is_loop_body=prev_cond.is_loop_body)
         local_join.variables = VariableEnv.copy_variables(local_join_env)
 
@@ -389,7 +393,7 @@ class DynamicCFGBuilder:
             raise ValueError("else: target join not found (passed from get_current_block)")
 
         # ③ else 블록 생성 및 연결
-        else_blk = CFGNode(f"else_block_{line_no}", branch_node=True, is_true_branch=False, src_line=line_no
+        else_blk = CFGNode(f"else_block_{line_no}", branch_node=True, is_true_branch=False, src_line=self._at(line_no)
                            ,is_loop_body=cond_node.is_loop_body)
         else_blk.variables = VariableEnv.copy_variables(else_env)
 
@@ -452,7 +456,7 @@ class DynamicCFGBuilder:
             f"while_cond_{line_no}",
             condition_node=True,
             condition_node_type="while",
-            src_line=line_no
+            src_line=self._at(line_no)
         )
         cond.condition_expr = condition_expr
         cond.variables = VariableEnv.copy_variables(join.variables)
@@ -469,7 +473,7 @@ class DynamicCFGBuilder:
             branch_node=True,
             is_true_branch=False,
             loop_exit_node=True,
-            src_line=(end_line if end_line is not None else line_no)  # ★ end_line 반영
+            src_line=self._at(end_line if end_line is not None else line_no)  # ★ end_line 반영
         )
         exit_.variables = VariableEnv.copy_variables(false_env)
 
@@ -541,7 +545,7 @@ class DynamicCFGBuilder:
             f"for_cond_{line_no}",
             condition_node=True,
             condition_node_type="for",
-            src_line=line_no
+            src_line=self._at(line_no)
         )
         cond.condition_expr = cond_expr
         cond.variables = VariableEnv.copy_variables(join_env)
@@ -556,7 +560,7 @@ class DynamicCFGBuilder:
             branch_node=True,
             is_true_branch=False,
             loop_exit_node=True,
-            src_line=(end_line if end_line is not None else line_no)  # ★ end_line 반영
+            src_line=self._at(end_line if end_line is not None else line_no)  # ★ end_line 반영
         )
         exit_.variables = VariableEnv.copy_variables(false_env)
 
@@ -622,7 +626,7 @@ class DynamicCFGBuilder:
             tag="Continue"
         )
         # 2) 새 블록에 statement 추가
-        new_block.add_continue_statement(line_no)
+        new_block.add_continue_statement(self._at(line_no))
 
         # 3) join(φ) 찾기 → new_block 의 모든 후속을 제거하고 φ로 재배선
         join = self.find_loop_join(new_block, fcfg)
@@ -672,7 +676,7 @@ class DynamicCFGBuilder:
             tag="Return"
         )
         # 2) statement 추가
-        new_block.add_return_statement(return_expr, line_no)
+        new_block.add_return_statement(return_expr, self._at(line_no))
 
         # 3) seed 용으로 현재(new_block) 후속 = “원래 cur_block 의 후속” 확보
         old_succs = list(G.successors(new_block))
@@ -709,7 +713,7 @@ class DynamicCFGBuilder:
             tag="Break"
         )
         # 2) statement 추가
-        new_block.add_break_statement(line_no)
+        new_block.add_break_statement(self._at(line_no))
 
         # 3) loop-exit 찾기
         cond = self.find_loop_condition(new_block, fcfg)
@@ -755,7 +759,7 @@ class DynamicCFGBuilder:
             tag="revert"
         )
         # 2) statement 추가
-        new_block.add_revert_statement(revert_id, string_literal, call_args, line_no)
+        new_block.add_revert_statement(revert_id, string_literal, call_args, self._at(line_no))
 
         # ★ seed 용으로 ‘재배선 전’ succ 보관
         g = fcfg.graph
@@ -794,7 +798,7 @@ class DynamicCFGBuilder:
             name=f"require_condition_{line_no}",
             condition_node=True,
             condition_node_type="require",
-            src_line=line_no,
+            src_line=self._at(line_no),
             is_loop_body=cur_block.is_loop_body
         )
         cond.condition_expr = condition_expr
@@ -805,7 +809,7 @@ class DynamicCFGBuilder:
             name=f"require_true_{line_no}",
             branch_node=True,
             is_true_branch=True,
-            src_line=line_no,
+            src_line=self._at(line_no),
             is_loop_body=cur_block.is_loop_body
         )
         t_blk.variables = true_env
@@ -860,7 +864,7 @@ class DynamicCFGBuilder:
             name=f"assert_condition_{line_no}",
             condition_node=True,
             condition_node_type="assert",
-            src_line=line_no,
+            src_line=self._at(line_no),
             is_loop_body=cur_block.is_loop_body
         )
         cond.condition_expr = condition_expr
@@ -871,7 +875,7 @@ class DynamicCFGBuilder:
             name=f"assert_true_{line_no}",
             branch_node=True,
             is_true_branch=True,
-            src_line=line_no,
+            src_line=self._at(line_no),
             is_loop_body=cur_block.is_loop_body
         )
         t_blk.variables = true_env
@@ -975,9 +979,9 @@ class DynamicCFGBuilder:
             self, *, cur_block: CFGNode, line_no: int, fcfg: FunctionCFG, line_info: dict
     ) -> None:
         G = fcfg.graph
-        do_entry = CFGNode(f"do_body_{line_no}", src_line=line_no, is_loop_body=True)
+        do_entry = CFGNode(f"do_body_{line_no}", src_line=self._at(line_no), is_loop_body=True)
         do_entry.is_do_entry = True
-        do_end = CFGNode(f"do_end_{line_no}", src_line=line_no, is_loop_body=False)
+        do_end = CFGNode(f"do_end_{line_no}", src_line=self._at(line_no), is_loop_body=False)
         do_end.is_do_end = True
 
         # env
@@ -1021,17 +1025,17 @@ class DynamicCFGBuilder:
             G.remove_edge(do_end, s)
 
         # φ / cond / exit
-        phi = CFGNode(f"do_while_phi_{while_line}", fixpoint_evaluation_node=True, src_line=while_line)
+        phi = CFGNode(f"do_while_phi_{while_line}", fixpoint_evaluation_node=True, src_line=self._at(while_line))
         phi.variables = VariableEnv.copy_variables(do_end.variables)
         phi.join_baseline_env = VariableEnv.copy_variables(do_end.variables)
         phi.fixpoint_evaluation_node_vars = VariableEnv.copy_variables(do_end.variables)
 
         cond = CFGNode(f"do_while_cond_{while_line}", condition_node=True,
-                       condition_node_type="do_while", src_line=while_line)
+                       condition_node_type="do_while", src_line=self._at(while_line))
         cond.condition_expr = condition_expr
         cond.variables = VariableEnv.copy_variables(phi.variables)
 
-        exit_ = CFGNode(f"do_while_exit_{while_line}", loop_exit_node=True, src_line=while_line)
+        exit_ = CFGNode(f"do_while_exit_{while_line}", loop_exit_node=True, src_line=self._at(while_line))
 
         G.add_nodes_from([phi, cond, exit_])
 
@@ -1071,12 +1075,12 @@ class DynamicCFGBuilder:
         # 2) 노드
         cond = CFGNode(f"try_cond_{line_no}",
                        condition_node=True, condition_node_type="try",
-                       src_line=line_no)
+                       src_line=self._at(line_no))
         cond.condition_expr = function_expr  # 기록용
 
-        t_blk = CFGNode(f"try_true_{line_no}", branch_node=True, is_true_branch=True, src_line=line_no)
-        f_stub = CFGNode(f"try_false_stub_{line_no}", branch_node=True, is_true_branch=False, src_line=line_no)
-        join = CFGNode(f"try_join_{line_no}", join_point_node=True, src_line=line_no)
+        t_blk = CFGNode(f"try_true_{line_no}", branch_node=True, is_true_branch=True, src_line=self._at(line_no))
+        f_stub = CFGNode(f"try_false_stub_{line_no}", branch_node=True, is_true_branch=False, src_line=self._at(line_no))
+        join = CFGNode(f"try_join_{line_no}", join_point_node=True, src_line=self._at(line_no))
 
         # env
         cond.variables = VariableEnv.copy_variables(cur_block.variables)
@@ -1151,8 +1155,8 @@ class DynamicCFGBuilder:
         # G.remove_node(false_stub)
 
         # 2) catch 블록 생성
-        c_entry = CFGNode(f"catch_entry_{line_no}", src_line=line_no)
-        c_end = CFGNode(f"catch_end_{line_no}", src_line=line_no)
+        c_entry = CFGNode(f"catch_entry_{line_no}", src_line=self._at(line_no))
+        c_end = CFGNode(f"catch_end_{line_no}", src_line=self._at(line_no))
 
         c_entry.variables = VariableEnv.copy_variables(cond.variables)
         c_end.variables = VariableEnv.copy_variables(cond.variables)
@@ -1205,7 +1209,7 @@ class DynamicCFGBuilder:
         # 2. Create new block with pred's environment
         new_block = CFGNode(f"{tag}_{line_no}", is_loop_body=pred_block.is_loop_body)
         new_block.variables = VariableEnv.copy_variables(pred_block.variables or {})
-        new_block.src_line = line_no
+        new_block.src_line = self._at(line_no)
         
         # 3. Add new block to graph
         G.add_node(new_block)
@@ -1451,8 +1455,12 @@ class DynamicCFGBuilder:
 
     def find_loop_join(self, start: CFGNode, fcfg: FunctionCFG) -> CFGNode | None:
         """
-        역-DFS 로 가장 가까운 `fixpoint_evaluation_node`(while/for join) 반환.
+        start 를 감싸는 가장 안쪽 루프의 `fixpoint_evaluation_node`(while/for join) 반환.
+        loop-nesting forest 로 찾고, 루프 밖이면 역-DFS 로 가장 가까운 것.
         """
+        join = fcfg.loop_forest().loop_join(start)
+        if join is not None:
+            return join
         G = fcfg.graph
         stk, seen = [start], set()
         while stk:
@@ -1466,6 +1474,9 @@ class DynamicCFGBuilder:
         return None
 
     def find_loop_condition(self, start: CFGNode, fcfg: FunctionCFG) -> CFGNode | None:
+        cond = fcfg.loop_forest().loop_condition(start)
+        if cond is not None:
+            return cond
         G = fcfg.graph
         stk, seen = [start], set()
         while stk:
@@ -6,7 +6,7 @@ from antlr4.tree.Tree import TerminalNodeImpl
 from Domain.Variable import Variables, GlobalVariable, ArrayVariable, StructVariable, EnumVariable, MappingVariable
 from Domain.Type import SolType
 from Domain.Interval import IntegerInterval, UnsignedIntegerInterval, BoolInterval
-from Domain.IR import Expression
+from Domain.IR import Expression, DebugDirective, READONLY_MEMBERS, READONLY_GLOBAL_BASES
 
 KEYWORD_IDENTIFIERS = {
     "from", "to", "payable", "returns",      # 필요 시 계속 추가
@@ -24,19 +24,7 @@ TIME_VALUE = {
     "ether":   10 ** 18,
 }
 
-# ContractAnalyzer (or util module) ──────────────────────────
-READONLY_MEMBERS = {
-    # Array / bytes
-    "length", "slot", "offset",
-    # Address
-    "balance", "code", "codehash",
-    # Function
-    "selector",
-    # type(T) meta
-    "max", "min", "size", "name"
-}
-
-READONLY_GLOBAL_BASES = {"block", "msg", "tx"}
+# READONLY_MEMBERS / READONLY_GLOBAL_BASES 는 Domain.IR 로 이동 (파서 없이 import 가능하도록)
 
 
 class EnhancedSolidityVisitor(SolidityVisitor):
@@ -44,6 +32,13 @@ class EnhancedSolidityVisitor(SolidityVisitor):
     def __init__(self, contract_analyzer):
         self.contract_analyzer = contract_analyzer
 
+    def visit(self, tree):
+        # generate_parse_tree 가 돌려준 루트(syntax_errors 보유)만 관문을 거친다.
+        # 내부 self.visit(ctx.xxx()) 호출은 그대로 통과.
+        if hasattr(tree, "syntax_errors") and not self.contract_analyzer.accept_parse_tree(tree):
+            return None
+        return super().visit(tree)
+
     # Visit a parse tree produced by SolidityParser#sourceUnit.
     def visitSourceUnit(self, ctx:SolidityParser.SourceUnitContext):
         return self.visitChildren(ctx)
@@ -582,8 +577,27 @@ class EnhancedSolidityVisitor(SolidityVisitor):
     def visitDebugUnit(self, ctx:SolidityParser.DebugUnitContext):
         return self.visitChildren(ctx)
 
+    def lower_debug_unit(self, ctx: SolidityParser.DebugUnitContext) -> list[DebugDirective]:
+        """
+        debugUnit 파스 트리 → 주석 순서대로의 DebugDirective 목록 (analyzer 에는 적용하지 않는다).
+        DebugBatchManager 가 라인별로 보관해 두고 flush 때 process_debug_directive 로 적용.
+        """
+        out: list[DebugDirective] = []
+        for child in ctx.getChildren():
+            if isinstance(child, SolidityParser.DebugGlobalVarContext):
+                out.append(self._lower_debug_global_var(child))
+            elif isinstance(child, SolidityParser.DebugStateVarContext):
+                out.append(self._lower_debug_var("state", child))
+            elif isinstance(child, SolidityParser.DebugLocalVarContext):
+                out.append(self._lower_debug_var("local", child))
+        return out
+
     # Visit a parse tree produced by SolidityParser#debugGlobalVar.
     def visitDebugGlobalVar(self, ctx: SolidityParser.DebugGlobalVarContext):
+        self.contract_analyzer.process_debug_directive(self._lower_debug_global_var(ctx))
+        return None
+
+    def _lower_debug_global_var(self, ctx: SolidityParser.DebugGlobalVarContext) -> DebugDirective:
         # ─────────────────── 1) 식별자 추출 ───────────────────
         left_id = ctx.identifier(0).getText()  # "block" | "msg" | "tx"
         right_id = ctx.identifier(1).getText() if ctx.identifier(1) else None
@@ -634,10 +648,7 @@ class EnhancedSolidityVisitor(SolidityVisitor):
             value=value,
             typeInfo=st  # ← 완성된 SolType 주입
         )
-
-        # ─────────────────── 5) ContractAnalyzer 에 전달 ─────
-        self.contract_analyzer.process_global_var_for_debug(gv_obj)
-        return None
+        return DebugDirective("global", gv_obj, value)
 
     # Visit a parse tree produced by SolidityParser#GlobalIntValue.
     def visitGlobalIntValue(self, ctx: SolidityParser.GlobalIntValueContext):
@@ -724,25 +735,22 @@ class EnhancedSolidityVisitor(SolidityVisitor):
     #  State-level 주석  (@StateVar …)
     # ──────────────────────────────────────────────────────────────
     def visitDebugStateVar(self, ctx: SolidityParser.DebugStateVarContext):
-        # 1) LHS (testingExpression → Expression AST)
-        lhs_expr = self.visitTestingExpression(ctx.testingExpression())
-
-        # 2) RHS
-        rhs_val = self._parse_state_local_value(ctx.stateLocalValue())
-
-        # 3) ContractAnalyzer 전달
-        self.contract_analyzer.process_state_var_for_debug(lhs_expr, rhs_val)
+        self.contract_analyzer.process_debug_directive(self._lower_debug_var("state", ctx))
         return None
 
     # ──────────────────────────────────────────────────────────────
     #  Local-level 주석  (@LocalVar …)
     # ──────────────────────────────────────────────────────────────
     def visitDebugLocalVar(self, ctx: SolidityParser.DebugLocalVarContext):
+        self.contract_analyzer.process_debug_directive(self._lower_debug_var("local", ctx))
+        return None
+
+    def _lower_debug_var(self, kind: str, ctx) -> DebugDirective:
+        # 1) LHS (testingExpression → Expression AST)
         lhs_expr = self.visitTestingExpression(ctx.testingExpression())
+        # 2) RHS
         rhs_val = self._parse_state_local_value(ctx.stateLocalValue())
-
-        self.contract_analyzer.process_local_var_for_debug(lhs_expr, rhs_val)
-        return None
+        return DebugDirective(kind, lhs_expr, rhs_val)
 
     # Visit a parse tree produced by SolidityParser#testingExpression.
     def visitTestingExpression(self, ctx: SolidityParser.TestingExpressionContext):
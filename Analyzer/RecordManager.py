@@ -17,9 +17,12 @@ from Utils.CFG import FunctionCFG
 
 class RecordManager:
 
-    def __init__(self) -> None:
+    def __init__(self, ledger=None, on_write=None) -> None:
         # line_no -> list[ record-dict ]
-        self.ledger: defaultdict[int, List[Dict[str, Any]]] = defaultdict(list)
+        #   ledger 로 LineStore column(default_factory=list) 을 넘기면 라인 이동을 따라간다
+        self.ledger: defaultdict[int, List[Dict[str, Any]]] = ledger if ledger is not None else defaultdict(list)
+        # on_write(line_no) : 그 라인 기록을 고치기 직전 (ContractAnalyzer.tx_touch_line)
+        self.on_write = on_write
 
     # ------------------------------------------------------ public accessors
     def __getitem__(self, line_no: int) -> List[Dict[str, Any]]:
@@ -30,11 +33,19 @@ class RecordManager:
         return {ln: self.ledger[ln] for ln in range(start, end + 1) if ln in self.ledger}
 
     def clear_line(self, line_no: int) -> None:
+        if self.on_write is not None:
+            self.on_write(line_no)
         self.ledger.pop(line_no, None)
 
     def clear_lines(self, lines: list[int] | set[int] | tuple[int, ...]) -> None:
         for ln in lines:
-            self.ledger.pop(ln, None)
+            self.clear_line(ln)
+
+    def _line(self, line_no: int) -> List[Dict[str, Any]]:
+        """기록을 고칠 라인의 list (on_write 를 먼저 부른다)"""
+        if self.on_write is not None:
+            self.on_write(line_no)
+        return self.ledger[line_no]
 
 
     # ─────────────────────────────────────────────────────
@@ -71,7 +82,7 @@ class RecordManager:
             )
 
         # ③ analysis_per_line[line_no] 에 저장/교체
-        rec_list = self.ledger[line_no]
+        rec_list = self._line(line_no)
         # 같은 식별자 선언이 이미 있으면 덮어쓰기
         for i, old in enumerate(rec_list):
             if old.get("kind") == "varDeclaration" and \
@@ -109,7 +120,7 @@ class RecordManager:
             }
 
         # ③ line_no → rec_list 가져오기
-        rec_list = self.ledger[line_no]          #   self._acc  == defaultdict(list)
+        rec_list = self._line(line_no)           #   self._acc  == defaultdict(list)
         # print(f"DEBUG RecordManager: Adding record to line {line_no}, current ledger size: {len(self.ledger)}")
 
         # ④ “같은 루트-키” 기록이 이미 있으면 **교체**, 없으면 append
@@ -155,7 +166,7 @@ class RecordManager:
             payload = {"kind": "return",
                        "vars": {key: self._serialize_val(return_val)}}
 
-        self.ledger[line_no].append(payload)
+        self._line(line_no).append(payload)
 
     def record_revert(
             self,
@@ -173,7 +184,7 @@ class RecordManager:
                 "args": [self._expr_to_str(a) for a in call_args] if call_args else [],
             },
         }
-        self.ledger[line_no].append(payload)
+        self._line(line_no).append(payload)
 
     # ---------------------------------------------------------------------
     # Public API
@@ -202,7 +213,7 @@ class RecordManager:
     # ------------------------------------------------------------------
 
     def _append_or_replace(self, line_no: int, new_rec: Dict[str, Any], *, replace_rule) -> None:
-        existing = self.ledger[line_no]
+        existing = self._line(line_no)
         for idx, rec in enumerate(existing):
             if replace_rule(rec, new_rec):
                 existing[idx] = new_rec  # replace in‑place
@@ -0,0 +1,177 @@
+# Analyzer/Transaction.py
+# ────────────────────────────
+"""
+ContractAnalyzer.transaction() – 디버그 주석 적용/재해석을 격리해서 돌리는 트랜잭션
+
+DebugBatchManager.flush 는 live analyzer 를 직접 고친다.  트랜잭션은 그 동안
+바뀌는 상태를 처음 쓰기 직전에만 기록해 두었다가 rollback() 으로 되돌린다
+(begin 비용은 프로그램 크기와 무관하고, flush 가 실제로 건드린 만큼만 든다).
+
+  • 디버그 주석이 고치는 변수   : 처음 쓰기 직전(tx_touch – DebugInitializer / Update 의
+                                   snapshot-once 지점)에 그 변수 하나만 deepcopy
+  • 해석되는 함수               : 주석 대상 함수 / 해석 진입 / 호출 인자 바인딩 직전
+                                   (tx_touch_function) 에 FunctionCFG · 노드 · return var 의
+                                   __dict__ 얕은 사본, related_variables 얕은 사본, 함수
+                                   라인의 ledger 사본 (해석은 env 를 통째로 갈아 끼우므로
+                                   env 안 변수는 복사하지 않는다 – copy-on-write)
+  • 그 밖의 ledger 라인          : RecordManager 가 처음 쓰기 직전(tx_touch_line) 그 라인만
+  • cfg.globals                 : 처음 등록하기 직전(tx_touch_dict) dict 얕은 사본
+  • snapman.store              : SnapshotManager undo log 표시
+  • analyzer / engine 커서·통계
+
+with 블록이 예외로 끝나면 항상 rollback, 정상 종료면 commit() 하지 않은 한 rollback.
+
+    with analyzer.transaction() as tx:
+        ...                      # 주석 적용 + 재해석, 결과 읽기
+        tx.commit()              # (선택) 변경 유지
+
+AddressManager 같은 프로세스 전역 싱글톤의 바인딩은 되돌리지 않는다.
+"""
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from Analyzer.ContractAnalyzer import ContractAnalyzer
+
+_ANALYZER_ATTRS = ("current_start_line", "current_end_line", "current_context_type",
+                   "current_target_contract", "current_target_function",
+                   "current_target_function_cfg", "current_target_struct",
+                   "current_edit_event", "_record_enabled", "_last_touched_lines",
+                   "_last_func_lines", "_batch_targets", "_seen_stmt_ids")
+
+
+def _shallow(v):
+    return v.copy() if type(v) in (list, set, dict) else v
+
+
+class AnalyzerTransaction:
+
+    def __init__(self, an: "ContractAnalyzer"):
+        self.an = an
+        self.active = False
+        self._touched: dict[int, tuple[object, dict]] = {}
+        self._objs: list[tuple[object, dict]] = []          # (객체, __dict__ 얕은 사본)
+        self._dicts: dict[int, tuple[dict, dict]] = {}      # id → (dict, 얕은 사본)
+        self._ledgers: list[tuple[set[int], object]] = []   # (라인들, ledger 사본)
+        self._lines: set[int] = set()                       # ledger 를 기록해 둔 라인
+        self._functions: set[int] = set()                   # touch_function 된 FunctionCFG id
+
+    # ─────────────────────────────────────────── 시작 / 종료
+    def begin(self) -> "AnalyzerTransaction":
+        an = self.an
+        self._snap_mark = an.snapman.snapshot()
+        self._attrs = {k: _shallow(an.__dict__[k]) for k in _ANALYZER_ATTRS if k in an.__dict__}
+        self._loop_stats = dict(an.engine.loop_stats)
+
+        self.active = True
+        an._transactions.append(self)
+        return self
+
+    def commit(self) -> None:
+        """변경을 유지하고 트랜잭션을 닫는다"""
+        if not self.active:
+            return
+        self.an.snapman.discard(self._snap_mark)
+        self._close()
+
+    def rollback(self) -> None:
+        """begin() 시점 상태로 되돌리고 트랜잭션을 닫는다"""
+        if not self.active:
+            return
+        an = self.an
+        # 주석이 고친 변수 (먼저 – 아래 dict 복원이 원래 객체를 다시 가리키게 된다)
+        for obj, saved in reversed(list(self._touched.values())):
+            obj.__dict__.clear()
+            obj.__dict__.update(saved)
+        for obj, saved in self._objs:
+            obj.__dict__.clear()
+            obj.__dict__.update(saved)
+        for d, saved in self._dicts.values():
+            d.clear()
+            d.update(saved)
+
+        ledger = an.recorder.ledger
+        for lines, saved in reversed(self._ledgers):
+            if hasattr(ledger, "restore"):
+                ledger.restore(saved, lines)
+            else:
+                for ln in lines:
+                    ledger.pop(ln, None)
+                ledger.update(saved)
+        an.engine.loop_stats = self._loop_stats
+        an.engine.calls.clear()
+        an.__dict__.update(self._attrs)
+        an.snapman.restore_from_snap(self._snap_mark)
+        self._close()
+
+    def _close(self) -> None:
+        self.active = False
+        self._touched.clear()
+        self._objs.clear()
+        self._dicts.clear()
+        self._ledgers.clear()
+        self._lines.clear()
+        self._functions.clear()
+        stack = self.an._transactions
+        if self in stack:
+            stack.remove(self)
+
+    # ─────────────────────────────────────────── write barrier
+    def touch(self, obj) -> None:
+        """obj 를 처음 고치기 직전 – 트랜잭션 안에서 한 번만 그 상태를 deepcopy"""
+        oid = id(obj)
+        if oid not in self._touched and hasattr(obj, "__dict__"):
+            self._touched[oid] = (obj, copy.deepcopy(obj.__dict__))
+
+    def touch_function(self, fcfg) -> None:
+        """fcfg 를 해석하거나 그 진입 변수를 고치기 직전 – 트랜잭션 안에서 한 번만 그 상태를 기록"""
+        if id(fcfg) in self._functions:
+            return
+        self._functions.add(id(fcfg))
+        self._save_obj(fcfg)
+        self.touch_dict(fcfg.related_variables)
+        for rv in fcfg.return_vars or []:
+            self._save_obj(rv)
+        for n in fcfg.graph.nodes:
+            self._save_obj(n)
+
+        self._save_lines(self.an.engine._function_lines(fcfg))
+
+    def touch_line(self, line_no: int) -> None:
+        """ledger 의 line_no 기록을 처음 고치기 직전 – 그 라인만 사본"""
+        if line_no not in self._lines:
+            self._save_lines({line_no})
+
+    def touch_dict(self, d: dict) -> None:
+        """d 에 처음 넣거나 빼기 직전 – 얕은 사본"""
+        if id(d) not in self._dicts:
+            self._dicts[id(d)] = (d, dict(d))
+
+    def touched(self) -> list:
+        """이 트랜잭션에서 지금까지 touch 된 객체들"""
+        return [obj for obj, _ in self._touched.values()]
+
+    def _save_lines(self, lines: set[int]) -> None:
+        lines = lines - self._lines
+        if not lines:
+            return
+        self._lines |= lines
+        ledger = self.an.recorder.ledger
+        saved = ledger.snapshot(list, lines) if hasattr(ledger, "snapshot") \
+            else {ln: list(ledger[ln]) for ln in lines if ln in ledger}
+        self._ledgers.append((lines, saved))
+
+    def _save_obj(self, obj) -> None:
+        self._objs.append((obj, {k: _shallow(v) for k, v in obj.__dict__.items()}))
+
+    # ─────────────────────────────────────────── context manager
+    def __enter__(self) -> "AnalyzerTransaction":
+        if not self.active:
+            self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.rollback()         # commit() 된 트랜잭션이면 아무 일도 하지 않음
+        return False
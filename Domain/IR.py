@@ -1,4 +1,11 @@
+from typing import NamedTuple
+
+from Utils.LineStore import SrcLine
+
+
 class Statement:
+    src_line = SrcLine()   # 라인 핸들로 저장 – 라인 삽입/삭제를 자동으로 따라감
+
     def __init__(self, statement_type, **kwargs):
         self.statement_type = statement_type
         self.src_line       = kwargs.get("src_line")
@@ -73,4 +80,26 @@ class Expression:
         self.elements = elements        # 튜플 또는 배열의 요소들 (리스트)
         self.expr_type = expr_type      # 표현식의 타입 (예: 'int', 'uint', 'bool')
         self.type_length = type_length  # 타입의 길이 (예: 256)
-        self.context = context
\ No newline at end of file
+        self.context = context
+
+
+# 대입 불가능한 멤버 / 글로벌 베이스 ──────────────────────────
+READONLY_MEMBERS = {
+    # Array / bytes
+    "length", "slot", "offset",
+    # Address
+    "balance", "code", "codehash",
+    # Function
+    "selector",
+    # type(T) meta
+    "max", "min", "size", "name"
+}
+
+READONLY_GLOBAL_BASES = {"block", "msg", "tx"}
+
+
+# 디버그 주석 한 줄(@GlobalVar / @StateVar / @LocalVar)을 lowering 한 결과 ─────────
+class DebugDirective(NamedTuple):
+    kind: str           # "global" | "state" | "local"
+    target: object      # GlobalVariable (global) | 대상 Expression (state / local)
+    value: object       # 파싱된 값 – Interval · AddressSet · list · str …
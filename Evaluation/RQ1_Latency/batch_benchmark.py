@@ -0,0 +1,172 @@
+"""
+SolQDebug Batch Benchmark - per-case flush() vs. DebugBatchManager.flush_batch
+
+flush_batch interprets several @Debugging annotation sets for the same function
+in one call. The first case runs as usual and saves the interpreter state just
+before the first node that reads or writes an annotated variable; the other
+cases resume from there with only the annotated variables replaced.
+
+For every test case in dataset/json/annotation this script builds variants
+(each annotation line with its numbers shifted) and reports:
+
+    cases    : annotation sets in the batch
+    flush    : total time of one flush() per case
+    batch    : time of one flush_batch() call
+    shared   : nodes interpreted once and shared by the later cases
+    same     : both ways record the same analysis per case
+
+Usage:
+    python batch_benchmark.py
+    python batch_benchmark.py --contract Lock --variants 8
+
+Output:
+    Results are saved to 'results/batch_results.csv'
+"""
+
+import sys
+import io
+import re
+import json
+import time
+import csv
+import contextlib
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from solqdebug_benchmark import create_fresh_analyzer, simulate_inputs
+
+# Paths
+ANNOTATION_DIR = PROJECT_ROOT / "dataset" / "json" / "annotation"
+RESULTS_DIR = Path(__file__).parent / "results"
+
+_NUM = re.compile(r"\b(\d+)\b")
+
+
+def make_cases(lines, variants):
+    """the test case itself + copies with one line's numbers shifted"""
+    cases = [lines]
+    for i in range(len(lines)):
+        for d in (1, 7):
+            if len(cases) > variants:
+                return cases
+            code, s, e = lines[i]
+            shifted = _NUM.sub(lambda m: str(int(m.group(1)) + d), code)
+            cases.append(lines[:i] + [(shifted, s, e)] + lines[i + 1:])
+    return cases
+
+
+def flush_each(analyzer, batch_mgr, cases):
+    out = []
+    for lines in cases:
+        with analyzer.transaction():
+            batch_mgr._lines = {s: (code, s, e) for code, s, e in lines}
+            batch_mgr.flush()
+            span = analyzer._last_func_lines
+            report = analyzer.get_line_analysis(*span) if span else {}
+            out.append({ln: [dict(r) for r in recs] for ln, recs in report.items()})
+    return out
+
+
+def measure(records, variants):
+    contract_analyzer, batch_mgr = create_fresh_analyzer()
+    stats = {"batches": 0, "cases": 0, "flush_s": 0.0, "batch_s": 0.0, "shared": 0, "same": True}
+
+    def compare_at_end(analyzer, mgr):
+        lines = list(mgr._lines.values())
+        cases = make_cases(lines, variants)
+        try:
+            start = time.perf_counter()
+            expected = flush_each(analyzer, mgr, cases)
+            stats["flush_s"] += time.perf_counter() - start
+        except Exception:
+            # 변형한 주석 값이 유효하지 않은 케이스 – 비교에서 제외
+            mgr._lines = {ln[1]: ln for ln in lines}
+            mgr.flush()
+            return
+        mgr._lines = {ln[1]: ln for ln in lines}
+
+        start = time.perf_counter()
+        got = mgr.flush_batch(cases)
+        stats["batch_s"] += time.perf_counter() - start
+
+        stats["batches"] += 1
+        stats["cases"] += len(cases)
+        stats["shared"] += mgr.last_batch_shared
+        stats["same"] &= repr(got) == repr(expected)
+        mgr.flush()
+
+    simulate_inputs(records, contract_analyzer, batch_mgr, on_end=compare_at_end)
+    return stats
+
+
+def run(contract=None, variants=6):
+    json_files = sorted(ANNOTATION_DIR.glob("*_annot.json"))
+    if contract:
+        json_files = [p for p in json_files if p.name.startswith(f"{contract}_")]
+    if not json_files:
+        print(f"ERROR: No JSON files found in {ANNOTATION_DIR}")
+        sys.exit(1)
+
+    print(f"\n{'='*80}")
+    print(f"Batch Benchmark (flush per case vs. flush_batch, {variants} variants)")
+    print(f"{'='*80}")
+    print(f"{'contract':28} {'cases':>6} {'flush(ms)':>10} {'batch(ms)':>10} {'shared':>7} {'same':>5}")
+
+    results = []
+    for json_path in json_files:
+        name = json_path.name.replace("_c_annot.json", "").replace("_annot.json", "")
+        with open(json_path, 'r', encoding='utf-8') as f:
+            records = json.load(f)
+
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            st = measure(records, variants)
+        if not st["batches"]:
+            continue
+
+        print(f"{name[:28]:28} {st['cases']:>6} {st['flush_s']*1000:>10.2f} {st['batch_s']*1000:>10.2f} "
+              f"{st['shared']:>7} {('yes' if st['same'] else 'NO'):>5}")
+        results.append({
+            'contract_name': name,
+            'cases': st['cases'],
+            'flush_ms': st['flush_s'] * 1000,
+            'batch_ms': st['batch_s'] * 1000,
+            'shared_nodes': st['shared'],
+            'same_ledger': st['same'],
+        })
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    output_file = RESULTS_DIR / "batch_results.csv"
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['contract_name', 'cases', 'flush_ms', 'batch_ms',
+                                               'shared_nodes', 'same_ledger'])
+        writer.writeheader()
+        writer.writerows(results)
+
+    print(f"\nResults saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    contract = None
+    variants = 6
+
+    i = 0
+    while i < len(args):
+        if args[i] == '--contract' and i + 1 < len(args):
+            contract = args[i + 1]
+            i += 2
+        elif args[i] == '--variants' and i + 1 < len(args):
+            variants = int(args[i + 1])
+            i += 2
+        elif args[i] in ['--help', '-h']:
+            print("Usage: python batch_benchmark.py [--contract NAME] [--variants N]")
+            sys.exit(0)
+        else:
+            print(f"Unknown argument: {args[i]}")
+            sys.exit(1)
+
+    run(contract, variants)
@@ -0,0 +1,212 @@
+"""
+SolQDebug Context-Lookup Benchmark - ScopeIndex vs. linear backward scan
+
+ContractAnalyzer.find_parent_context / find_contract_context /
+find_function_context resolve the enclosing scope of a line through the
+ScopeIndex (O(log n)). Before that they walked line_info backwards from the
+edit point, which is O(file length) per call.
+
+This script loads large (flattened) contracts from dataset/dataset_all,
+optionally concatenates them to reach a target size, fills a ContractAnalyzer
+with their brace bookkeeping only (no CFG construction), and times both
+lookups on sampled lines. The linear scans are reproduced below as
+legacy_* functions for the comparison.
+
+Usage:
+    python context_lookup_benchmark.py                    # 5 largest contracts
+    python context_lookup_benchmark.py --top 10 --samples 500
+    python context_lookup_benchmark.py --lines 20000      # concatenate up to 20k lines
+
+Output:
+    Results are saved to 'results/context_lookup_results.csv'
+"""
+
+import sys
+import csv
+import time
+import random
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Analyzer.ContractAnalyzer import ContractAnalyzer
+
+# Paths
+DATASET_DIR = PROJECT_ROOT / "dataset" / "dataset_all"
+RESULTS_DIR = Path(__file__).parent / "results"
+
+_EMPTY = {'open': 0, 'close': 0, 'cfg_nodes': []}
+
+
+# ─────────────────────────────────────────── legacy linear scans
+def _legacy_nearest_open(ca, line_number):
+    close_brace_count = 0
+    for line in range(line_number, 0, -1):
+        info = ca.line_info.get(line, _EMPTY)
+        if close_brace_count > 0:
+            close_brace_count -= info['open']
+            if close_brace_count <= 0:
+                close_brace_count = 0
+        else:
+            if info['open'] > 0:
+                return line
+            close_brace_count += info['close']
+    return None
+
+
+def legacy_parent(ca, line_number):
+    line = _legacy_nearest_open(ca, line_number - 1)
+    return ca.determine_top_level_context(ca.full_code_lines[line]) if line else "unknown"
+
+
+def legacy_contract(ca, line_number):
+    close_brace_count = 0
+    for line in range(line_number, 0, -1):
+        info = ca.line_info.get(line, _EMPTY)
+        if close_brace_count > 0:
+            close_brace_count -= info['open']
+            if close_brace_count <= 0:
+                close_brace_count = 0
+        else:
+            if info['open'] > 0:
+                code_line = ca.full_code_lines.get(line, '').strip()
+                if ca.determine_top_level_context(code_line) in ["contract", "library", "interface"]:
+                    parts = code_line.split()
+                    for kw in ("contract", "library", "interface"):
+                        if kw in parts and parts.index(kw) + 1 < len(parts):
+                            return parts[parts.index(kw) + 1].split('{')[0].strip()
+            close_brace_count += info['close']
+    return None
+
+
+def legacy_function(ca, line_number):
+    open_line = _legacy_nearest_open(ca, line_number)
+    if open_line is None:
+        return None
+    for line in range(open_line, 0, -1):
+        code_line = ca.full_code_lines.get(line, "").strip()
+        if code_line.startswith(("function ", "modifier ")):
+            parts = code_line.split()
+            if len(parts) >= 2:
+                return parts[1].split('(')[0]
+        elif code_line.startswith(("constructor", "fallback", "receive")):
+            return code_line.split('(')[0].split()[0]
+        if code_line.startswith(("contract ", "library ", "interface ", "struct ", "enum ")):
+            break
+    return None
+
+
+# ─────────────────────────────────────────── benchmark
+def load_sources(top, max_lines):
+    files = sorted(DATASET_DIR.glob("*.sol"),
+                   key=lambda p: sum(1 for _ in open(p, encoding='utf-8', errors='ignore')),
+                   reverse=True)
+    sources = []
+    for path in files[:top]:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            sources.append((path.stem, f.read().split("\n")))
+
+    if max_lines:
+        # 여러 파일을 이어 붙여 하나의 거대한 flattened 소스를 만든다
+        merged = []
+        for path in files:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                merged.extend(f.read().split("\n"))
+            if len(merged) >= max_lines:
+                break
+        sources.append((f"merged_{len(merged)}", merged))
+    return sources
+
+
+def load_analyzer(lines):
+    ca = ContractAnalyzer()
+    for ln, code in enumerate(lines, start=1):
+        ca.full_code_lines[ln] = code
+        ca.update_brace_count(ln, code)
+    return ca
+
+
+def time_calls(fn, ca, sample):
+    start = time.perf_counter()
+    out = [fn(ca, ln) for ln in sample]
+    return time.perf_counter() - start, out
+
+
+def run(top=5, samples=300, max_lines=0, seed=0):
+    rng = random.Random(seed)
+    results = []
+
+    print(f"\n{'='*92}")
+    print(f"Context-Lookup Benchmark ({samples} sampled lines per contract)")
+    print(f"{'='*92}")
+    print(f"{'contract':28} {'lines':>6} {'lookup':>9} {'scan us':>10} {'index us':>10} "
+          f"{'speedup':>8} {'agree':>7}")
+
+    for name, lines in load_sources(top, max_lines):
+        ca = load_analyzer(lines)
+        sample = [rng.randint(1, len(lines)) for _ in range(samples)]
+
+        for label, new_fn, old_fn in (
+            ("parent", ContractAnalyzer.find_parent_context, legacy_parent),
+            ("contract", ContractAnalyzer.find_contract_context, legacy_contract),
+            ("function", ContractAnalyzer.find_function_context, legacy_function),
+        ):
+            scan_s, scan_out = time_calls(old_fn, ca, sample)
+            index_s, index_out = time_calls(new_fn, ca, sample)
+            agree = sum(a == b for a, b in zip(scan_out, index_out)) / len(sample)
+            scan_us = scan_s / len(sample) * 1e6
+            index_us = index_s / len(sample) * 1e6
+            speedup = scan_us / index_us if index_us else 0.0
+            print(f"{name[:28]:28} {len(lines):>6} {label:>9} {scan_us:>10.1f} {index_us:>10.1f} "
+                  f"{speedup:>7.1f}x {agree:>6.0%}")
+            results.append({
+                'contract_name': name,
+                'lines': len(lines),
+                'lookup': label,
+                'scan_us': scan_us,
+                'index_us': index_us,
+                'speedup': speedup,
+                'agreement': agree,
+            })
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    output_file = RESULTS_DIR / "context_lookup_results.csv"
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['contract_name', 'lines', 'lookup', 'scan_us',
+                                               'index_us', 'speedup', 'agreement'])
+        writer.writeheader()
+        writer.writerows(results)
+
+    print(f"\nAgreement < 100% is expected where the linear scan ignores '}}' seen while")
+    print(f"skipping a closed block (e.g. right after nested if/for blocks, or after a")
+    print(f"balanced '{{...}}' on one line such as NatSpec '{{Transfer}}' references).")
+    print(f"Each difference is listed and tested in tests/test_scope_lookup.py.")
+    print(f"\nResults saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    top, samples, max_lines = 5, 300, 0
+
+    i = 0
+    while i < len(args):
+        if args[i] == '--top' and i + 1 < len(args):
+            top = int(args[i + 1])
+            i += 2
+        elif args[i] == '--samples' and i + 1 < len(args):
+            samples = int(args[i + 1])
+            i += 2
+        elif args[i] == '--lines' and i + 1 < len(args):
+            max_lines = int(args[i + 1])
+            i += 2
+        elif args[i] in ['--help', '-h']:
+            print("Usage: python context_lookup_benchmark.py [--top N] [--samples N] [--lines N]")
+            sys.exit(0)
+        else:
+            print(f"Unknown argument: {args[i]}")
+            sys.exit(1)
+
+    run(top, samples, max_lines)
@@ -0,0 +1,173 @@
+"""
+SolQDebug Env-Allocation Benchmark - deep-copy vs. copy-on-write environments
+
+VariableEnv.copy_variables used to deep-copy the whole variable environment
+at every CFG node and statement. With VariableEnv.PERSISTENT the copies are
+PersistentEnv forks: variables are shared and only copied on first access,
+so the work per statement is proportional to the variables it touches.
+
+This script replays the annotated edit traces in dataset/json/annotation
+once per mode and reports:
+
+    stmts   : statements interpreted (Engine.update_statement_with_variables)
+    copied  : variable objects copied (VariableEnv.copy_stats["copied"])
+    forks   : copy-on-write forks      (VariableEnv.copy_stats["forks"])
+    time    : wall time of the whole replay
+
+and checks that both modes record the same ledger.
+
+Usage:
+    python env_alloc_benchmark.py
+    python env_alloc_benchmark.py --contract Dai
+
+Output:
+    Results are saved to 'results/env_alloc_results.csv'
+"""
+
+import sys
+import io
+import json
+import time
+import csv
+import hashlib
+import contextlib
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Interpreter.Engine import Engine
+from Utils.Helper import VariableEnv
+from solqdebug_benchmark import create_fresh_analyzer, simulate_inputs
+
+# Paths
+ANNOTATION_DIR = PROJECT_ROOT / "dataset" / "json" / "annotation"
+RESULTS_DIR = Path(__file__).parent / "results"
+
+_stmt_count = [0]
+_orig_update = Engine.update_statement_with_variables
+
+
+def _counting_update(self, stmt, current_variables, ret_acc=None):
+    _stmt_count[0] += 1
+    return _orig_update(self, stmt, current_variables, ret_acc)
+
+
+def replay(records):
+    """Replay the trace and return a digest of the recorded ledger."""
+    contract_analyzer, batch_mgr = create_fresh_analyzer()
+    snapshots = []
+
+    def flush_and_snapshot(analyzer, mgr):
+        mgr.flush()
+        snapshots.append(repr(sorted(analyzer.recorder.ledger.items())))
+
+    simulate_inputs(records, contract_analyzer, batch_mgr, on_end=flush_and_snapshot)
+    return hashlib.md5("\n".join(snapshots).encode()).hexdigest()[:10]
+
+
+def measure(records, persistent):
+    VariableEnv.PERSISTENT = persistent
+    VariableEnv.copy_stats["copied"] = 0
+    VariableEnv.copy_stats["forks"] = 0
+    _stmt_count[0] = 0
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        digest = replay(records)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'stmts': _stmt_count[0],
+        'copied': VariableEnv.copy_stats["copied"],
+        'forks': VariableEnv.copy_stats["forks"],
+        'time_s': elapsed,
+        'digest': digest,
+    }
+
+
+def run(contract=None):
+    json_files = sorted(ANNOTATION_DIR.glob("*_annot.json"))
+    if contract:
+        json_files = [p for p in json_files if p.name.startswith(f"{contract}_")]
+    if not json_files:
+        print(f"ERROR: No JSON files found in {ANNOTATION_DIR}")
+        sys.exit(1)
+
+    Engine.update_statement_with_variables = _counting_update
+    saved_mode = VariableEnv.PERSISTENT
+
+    print(f"\n{'='*96}")
+    print(f"Env-Allocation Benchmark (deep-copy vs. copy-on-write)")
+    print(f"{'='*96}")
+    print(f"{'contract':28} {'stmts':>6} {'copied(dc)':>11} {'copied(cow)':>12} {'forks':>7} "
+          f"{'dc (s)':>8} {'cow (s)':>8} {'speedup':>8} {'same':>5}")
+
+    results = []
+    try:
+        for json_path in json_files:
+            name = json_path.name.replace("_c_annot.json", "").replace("_annot.json", "")
+            with open(json_path, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+
+            dc = measure(records, persistent=False)
+            cow = measure(records, persistent=True)
+            same = dc['digest'] == cow['digest']
+            speedup = dc['time_s'] / cow['time_s'] if cow['time_s'] else 0.0
+
+            print(f"{name[:28]:28} {cow['stmts']:>6} {dc['copied']:>11} {cow['copied']:>12} "
+                  f"{cow['forks']:>7} {dc['time_s']:>8.3f} {cow['time_s']:>8.3f} "
+                  f"{speedup:>7.2f}x {('yes' if same else 'NO'):>5}")
+            results.append({
+                'contract_name': name,
+                'statements': cow['stmts'],
+                'copied_deepcopy': dc['copied'],
+                'copied_cow': cow['copied'],
+                'cow_forks': cow['forks'],
+                'deepcopy_s': dc['time_s'],
+                'cow_s': cow['time_s'],
+                'speedup': speedup,
+                'same_ledger': same,
+            })
+    finally:
+        Engine.update_statement_with_variables = _orig_update
+        VariableEnv.PERSISTENT = saved_mode
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    output_file = RESULTS_DIR / "env_alloc_results.csv"
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['contract_name', 'statements', 'copied_deepcopy',
+                                               'copied_cow', 'cow_forks', 'deepcopy_s', 'cow_s',
+                                               'speedup', 'same_ledger'])
+        writer.writeheader()
+        writer.writerows(results)
+
+    total_dc = sum(r['deepcopy_s'] for r in results)
+    total_cow = sum(r['cow_s'] for r in results)
+    print(f"{'-'*96}")
+    print(f"{'TOTAL':28} {sum(r['statements'] for r in results):>6} "
+          f"{sum(r['copied_deepcopy'] for r in results):>11} {sum(r['copied_cow'] for r in results):>12} "
+          f"{sum(r['cow_forks'] for r in results):>7} {total_dc:>8.3f} {total_cow:>8.3f} "
+          f"{(total_dc / total_cow if total_cow else 0.0):>7.2f}x")
+    print(f"\nResults saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    contract = None
+
+    i = 0
+    while i < len(args):
+        if args[i] == '--contract' and i + 1 < len(args):
+            contract = args[i + 1]
+            i += 2
+        elif args[i] in ['--help', '-h']:
+            print("Usage: python env_alloc_benchmark.py [--contract NAME]")
+            sys.exit(0)
+        else:
+            print(f"Unknown argument: {args[i]}")
+            sys.exit(1)
+
+    run(contract)
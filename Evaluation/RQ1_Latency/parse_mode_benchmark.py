@@ -0,0 +1,148 @@
+"""
+SolQDebug Parse-Mode Benchmark - SLL-first vs. full LL prediction
+
+This script compares the two ANTLR prediction modes supported by
+ParserHelpers.generate_parse_tree on the annotated edit traces in
+dataset/json/annotation:
+
+    ll  : default ALL(*) LL prediction
+    sll : PredictionMode.SLL + BailErrorStrategy, falling back to LL on failure
+
+Each trace is replayed once through solqdebug_benchmark.simulate_inputs to
+recover the context type of every fragment. The
+collected (fragment, context) pairs are then re-parsed in each mode with
+the parse-tree cache disabled, so only ANTLR time is measured.
+
+Usage:
+    python parse_mode_benchmark.py                 # 5 repetitions per mode
+    python parse_mode_benchmark.py --repeat 20
+    python parse_mode_benchmark.py --contract Dai
+
+Output:
+    Results are saved to 'results/parse_mode_results.csv'
+"""
+
+import sys
+import io
+import json
+import time
+import csv
+import contextlib
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Utils.Helper import ParserHelpers
+from solqdebug_benchmark import create_fresh_analyzer, simulate_inputs
+
+# Paths
+ANNOTATION_DIR = PROJECT_ROOT / "dataset" / "json" / "annotation"
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def collect_fragments(records):
+    """
+    Replay the trace and return every (code, ctx_type) pair that would be
+    handed to generate_parse_tree.
+    """
+    contract_analyzer, batch_mgr = create_fresh_analyzer()
+    fragments = []
+    simulate_inputs(records, contract_analyzer, batch_mgr,
+                    on_fragment=lambda code, ctx: fragments.append((code, ctx)))
+    return fragments
+
+
+def time_mode(fragments, mode, repeat):
+    """Best-of-N wall time for parsing all fragments in the given mode."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for code, ctx in fragments:
+            ParserHelpers.generate_parse_tree(code, ctx, use_cache=False, mode=mode)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(contract=None, repeat=5):
+    json_files = sorted(ANNOTATION_DIR.glob("*_annot.json"))
+    if contract:
+        json_files = [p for p in json_files if p.name.startswith(f"{contract}_")]
+    if not json_files:
+        print(f"ERROR: No JSON files found in {ANNOTATION_DIR}")
+        sys.exit(1)
+
+    print(f"\n{'='*72}")
+    print(f"Parse-Mode Benchmark (best of {repeat})")
+    print(f"{'='*72}")
+    print(f"{'contract':32} {'frags':>6} {'ll (s)':>10} {'sll (s)':>10} {'speedup':>8} {'fallback':>9}")
+
+    results = []
+    for json_path in json_files:
+        name = json_path.name.replace("_c_annot.json", "").replace("_annot.json", "")
+        with open(json_path, 'r', encoding='utf-8') as f:
+            records = json.load(f)
+
+        # 분석기 로그는 측정과 무관하므로 숨긴다
+        with contextlib.redirect_stdout(io.StringIO()):
+            fragments = collect_fragments(records)
+
+            # warm-up: 공유 DFA 캐시를 채워 두 모드를 같은 조건에서 비교
+            time_mode(fragments, "ll", 1)
+            time_mode(fragments, "sll", 1)
+
+            ParserHelpers.clear_parse_cache()
+            ll_s = time_mode(fragments, "ll", repeat)
+            sll_s = time_mode(fragments, "sll", repeat)
+            fallback = ParserHelpers.parse_cache_stats()["ll_fallback"] // repeat
+
+        speedup = ll_s / sll_s if sll_s else 0.0
+        print(f"{name:32} {len(fragments):>6} {ll_s:>10.4f} {sll_s:>10.4f} {speedup:>7.2f}x {fallback:>9}")
+        results.append({
+            'contract_name': name,
+            'fragments': len(fragments),
+            'll_s': ll_s,
+            'sll_s': sll_s,
+            'speedup': speedup,
+            'll_fallbacks': fallback,
+        })
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    output_file = RESULTS_DIR / "parse_mode_results.csv"
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['contract_name', 'fragments', 'll_s', 'sll_s',
+                                               'speedup', 'll_fallbacks'])
+        writer.writeheader()
+        writer.writerows(results)
+
+    total_ll = sum(r['ll_s'] for r in results)
+    total_sll = sum(r['sll_s'] for r in results)
+    print(f"{'-'*72}")
+    print(f"{'TOTAL':32} {sum(r['fragments'] for r in results):>6} {total_ll:>10.4f} {total_sll:>10.4f} "
+          f"{(total_ll / total_sll if total_sll else 0.0):>7.2f}x")
+    print(f"\nResults saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    contract = None
+    repeat = 5
+
+    i = 0
+    while i < len(args):
+        if args[i] == '--contract' and i + 1 < len(args):
+            contract = args[i + 1]
+            i += 2
+        elif args[i] == '--repeat' and i + 1 < len(args):
+            repeat = int(args[i + 1])
+            i += 2
+        elif args[i] in ['--help', '-h']:
+            print("Usage: python parse_mode_benchmark.py [--contract NAME] [--repeat N]")
+            sys.exit(0)
+        else:
+            print(f"Unknown argument: {args[i]}")
+            sys.exit(1)
+
+    run(contract, repeat)
@@ -0,0 +1,193 @@
+"""
+SolQDebug Snapshot Benchmark - deep-copied store vs. undo-log snapshots
+
+DebugBatchManager.flush takes a SnapshotManager snapshot before interpreting
+the debug annotations and restores it afterwards. It used to deep-copy the
+whole store (every registered variable and modifier CFG), so its cost grew
+with total contract state. With SnapshotManager.UNDO_LOG the snapshot is a
+mark in an undo log and the restore undoes only the store writes made during
+the flush.
+
+This script replays the annotated edit traces in dataset/json/annotation
+once per mode and reports:
+
+    flushes  : DebugBatchManager.flush calls
+    store    : registered objects in the store at the last flush
+    undone   : store writes rolled back per flush (undo-log mode, mean)
+    snap     : mean time of snapshot() + restore_from_snap() per flush
+    flush    : mean time of a whole flush
+
+and checks that both modes record the same ledger.
+
+Usage:
+    python snapshot_benchmark.py
+    python snapshot_benchmark.py --contract Dai
+
+Output:
+    Results are saved to 'results/snapshot_results.csv'
+"""
+
+import sys
+import io
+import json
+import time
+import csv
+import hashlib
+import contextlib
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Analyzer.DebugUnitAnalyzer import DebugBatchManager
+from Utils.Snapshot import SnapshotManager
+from solqdebug_benchmark import create_fresh_analyzer, simulate_inputs
+
+# Paths
+ANNOTATION_DIR = PROJECT_ROOT / "dataset" / "json" / "annotation"
+RESULTS_DIR = Path(__file__).parent / "results"
+
+_stats = {"flushes": 0, "store": 0, "undone": 0, "snap_s": 0.0, "flush_s": 0.0}
+_orig_snapshot = SnapshotManager.snapshot
+_orig_restore = SnapshotManager.restore_from_snap
+_orig_flush = DebugBatchManager.flush
+
+
+def _timed_snapshot(self):
+    start = time.perf_counter()
+    snap = _orig_snapshot(self)
+    _stats["snap_s"] += time.perf_counter() - start
+    _stats["store"] = len(self.store)
+    return snap
+
+
+def _timed_restore(self, snap):
+    _stats["undone"] += len(self._undo) - snap.pos if hasattr(snap, "pos") else 0
+    start = time.perf_counter()
+    _orig_restore(self, snap)
+    _stats["snap_s"] += time.perf_counter() - start
+
+
+def _timed_flush(self):
+    if self._lines:
+        _stats["flushes"] += 1
+    start = time.perf_counter()
+    try:
+        return _orig_flush(self)
+    finally:
+        _stats["flush_s"] += time.perf_counter() - start
+
+
+def replay(records):
+    """Replay the trace and return a digest of the recorded ledger."""
+    contract_analyzer, batch_mgr = create_fresh_analyzer()
+    snapshots = []
+
+    def flush_and_snapshot(analyzer, mgr):
+        mgr.flush()
+        snapshots.append(repr(sorted(analyzer.recorder.ledger.items())))
+
+    simulate_inputs(records, contract_analyzer, batch_mgr, on_end=flush_and_snapshot)
+    return hashlib.md5("\n".join(snapshots).encode()).hexdigest()[:10]
+
+
+def measure(records, undo_log):
+    SnapshotManager.UNDO_LOG = undo_log
+    _stats.update(flushes=0, store=0, undone=0, snap_s=0.0, flush_s=0.0)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        digest = replay(records)
+
+    n = _stats["flushes"] or 1
+    return {
+        'flushes': _stats["flushes"],
+        'store': _stats["store"],
+        'undone': _stats["undone"] / n,
+        'snap_ms': _stats["snap_s"] / n * 1000,
+        'flush_ms': _stats["flush_s"] / n * 1000,
+        'digest': digest,
+    }
+
+
+def run(contract=None):
+    json_files = sorted(ANNOTATION_DIR.glob("*_annot.json"))
+    if contract:
+        json_files = [p for p in json_files if p.name.startswith(f"{contract}_")]
+    if not json_files:
+        print(f"ERROR: No JSON files found in {ANNOTATION_DIR}")
+        sys.exit(1)
+
+    SnapshotManager.snapshot = _timed_snapshot
+    SnapshotManager.restore_from_snap = _timed_restore
+    DebugBatchManager.flush = _timed_flush
+    saved_mode = SnapshotManager.UNDO_LOG
+
+    print(f"\n{'='*100}")
+    print(f"Snapshot Benchmark (deep-copied store vs. undo log)")
+    print(f"{'='*100}")
+    print(f"{'contract':28} {'flushes':>7} {'store':>6} {'undone':>7} "
+          f"{'snap dc(ms)':>12} {'snap undo(ms)':>14} {'flush dc(ms)':>13} {'flush undo(ms)':>15} {'same':>5}")
+
+    results = []
+    try:
+        for json_path in json_files:
+            name = json_path.name.replace("_c_annot.json", "").replace("_annot.json", "")
+            with open(json_path, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+
+            dc = measure(records, undo_log=False)
+            ul = measure(records, undo_log=True)
+            same = dc['digest'] == ul['digest']
+
+            print(f"{name[:28]:28} {ul['flushes']:>7} {ul['store']:>6} {ul['undone']:>7.1f} "
+                  f"{dc['snap_ms']:>12.3f} {ul['snap_ms']:>14.4f} {dc['flush_ms']:>13.2f} "
+                  f"{ul['flush_ms']:>15.2f} {('yes' if same else 'NO'):>5}")
+            results.append({
+                'contract_name': name,
+                'flushes': ul['flushes'],
+                'store_entries': ul['store'],
+                'undone_per_flush': ul['undone'],
+                'snapshot_deepcopy_ms': dc['snap_ms'],
+                'snapshot_undo_ms': ul['snap_ms'],
+                'flush_deepcopy_ms': dc['flush_ms'],
+                'flush_undo_ms': ul['flush_ms'],
+                'same_ledger': same,
+            })
+    finally:
+        SnapshotManager.snapshot = _orig_snapshot
+        SnapshotManager.restore_from_snap = _orig_restore
+        DebugBatchManager.flush = _orig_flush
+        SnapshotManager.UNDO_LOG = saved_mode
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    output_file = RESULTS_DIR / "snapshot_results.csv"
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['contract_name', 'flushes', 'store_entries',
+                                               'undone_per_flush', 'snapshot_deepcopy_ms',
+                                               'snapshot_undo_ms', 'flush_deepcopy_ms',
+                                               'flush_undo_ms', 'same_ledger'])
+        writer.writeheader()
+        writer.writerows(results)
+
+    print(f"\nResults saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    contract = None
+
+    i = 0
+    while i < len(args):
+        if args[i] == '--contract' and i + 1 < len(args):
+            contract = args[i + 1]
+            i += 2
+        elif args[i] in ['--help', '-h']:
+            print("Usage: python snapshot_benchmark.py [--contract NAME]")
+            sys.exit(0)
+        else:
+            print(f"Unknown argument: {args[i]}")
+            sys.exit(1)
+
+    run(contract)
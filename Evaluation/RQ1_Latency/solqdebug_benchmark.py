@@ -13,6 +13,7 @@ Usage:
     python solqdebug_benchmark.py                          # Default: interval=0, run-id=1
     python solqdebug_benchmark.py --interval 5             # Specify interval
     python solqdebug_benchmark.py --interval 0 --run-id 2  # Specify both
+    python solqdebug_benchmark.py --parse-mode sll         # SLL-first parsing
 
 Prerequisites:
     1. Clone the repository:
@@ -52,18 +53,27 @@ JSON_INTERVALS_DIR = Path(__file__).parent / "json_intervals"
 RESULTS_DIR = Path(__file__).parent / "results"
 
 
-def create_fresh_analyzer():
+def create_fresh_analyzer(parse_mode=None):
     """Create a fresh ContractAnalyzer instance for each test."""
-    contract_analyzer = ContractAnalyzer()
+    contract_analyzer = ContractAnalyzer(parse_mode=parse_mode)
     snapman = contract_analyzer.snapman
     batch_mgr = DebugBatchManager(contract_analyzer, snapman)
     return contract_analyzer, batch_mgr
 
 
-def simulate_inputs(records, contract_analyzer, batch_mgr, verbose=False):
+def simulate_inputs(records, contract_analyzer, batch_mgr, verbose=False,
+                    on_end=None, on_fragment=None, on_step=None):
     """
     Simulate user inputs from JSON records.
     Returns True if successful, False otherwise.
+
+    The other RQ1 benchmarks (and tests/) replay traces through this function
+    and plug in with optional hooks:
+        on_end(contract_analyzer, batch_mgr) : runs at "// @Debugging END"
+                                               instead of batch_mgr.flush()
+        on_fragment(code, ctx)               : every fragment that reaches the
+                                               parser (annotations as "debugUnit")
+        on_step(idx, rec)                    : after each record is applied
     """
     in_testcase = False
 
@@ -80,15 +90,18 @@ def simulate_inputs(records, contract_analyzer, batch_mgr, verbose=False):
         if stripped.startswith("// @Debugging BEGIN"):
             batch_mgr.reset()
             in_testcase = True
-            continue
 
-        if stripped.startswith("// @Debugging END"):
-            batch_mgr.flush()
+        elif stripped.startswith("// @Debugging END"):
+            if on_end is not None:
+                on_end(contract_analyzer, batch_mgr)
+            else:
+                batch_mgr.flush()
             in_testcase = False
-            continue
 
         # Debug annotations (@StateVar, @GlobalVar, etc.)
-        if stripped.startswith("// @"):
+        elif stripped.startswith("// @"):
+            if on_fragment is not None:
+                on_fragment(code, "debugUnit")
             if ev == "add":
                 batch_mgr.add_line(code, s, e)
             elif ev == "modify":
@@ -98,23 +111,31 @@ def simulate_inputs(records, contract_analyzer, batch_mgr, verbose=False):
 
             if not in_testcase:
                 batch_mgr.flush()
-            continue
 
         # Regular Solidity code
-        if code.strip():
-            ctx = contract_analyzer.get_current_context_type()
-            tree = ParserHelpers.generate_parse_tree(code, ctx, True)
-            EnhancedSolidityVisitor(contract_analyzer).visit(tree)
+        else:
+            if code.strip():
+                ctx = contract_analyzer.get_current_context_type()
+                if on_fragment is not None:
+                    on_fragment(code, ctx)
+                tree = ParserHelpers.generate_parse_tree(code, ctx, True,
+                                                         tokens=contract_analyzer.edit_tokens())
+                EnhancedSolidityVisitor(contract_analyzer).visit(tree)
 
-        # Get line analysis (optional, for verification)
-        analysis = contract_analyzer.get_line_analysis(s, e)
+            # Get line analysis (optional, for verification)
+            analysis = contract_analyzer.get_line_analysis(s, e)
+
+        if on_step is not None:
+            on_step(idx, rec)
 
     return True
 
 
-def run_single_benchmark(json_path, verbose=False):
+def run_single_benchmark(json_path, verbose=False, parse_mode=None, stats=None):
     """
     Run benchmark on a single JSON file.
+    If a dict is passed as `stats`, it is filled with the analyzer's
+    parse-skip statistics (see ContractAnalyzer.parse_skip_stats).
     Returns: (success, latency_seconds, error_message)
     """
     try:
@@ -123,7 +144,8 @@ def run_single_benchmark(json_path, verbose=False):
             records = json.load(f)
 
         # Create fresh analyzer for each test
-        contract_analyzer, batch_mgr = create_fresh_analyzer()
+        contract_analyzer, batch_mgr = create_fresh_analyzer(parse_mode)
+        ParserHelpers.clear_parse_cache()
 
         # Measure latency
         start_time = time.perf_counter()
@@ -131,6 +153,8 @@ def run_single_benchmark(json_path, verbose=False):
         end_time = time.perf_counter()
 
         latency = end_time - start_time
+        if stats is not None:
+            stats.update(contract_analyzer.parse_skip_stats())
         return True, latency, None
 
     except Exception as e:
@@ -144,7 +168,7 @@ def extract_contract_info(json_filename):
     return name
 
 
-def run_benchmark_suite(interval, run_id, verbose=False):
+def run_benchmark_suite(interval, run_id, verbose=False, parse_mode="ll"):
     """
     Run benchmark on all JSON files for a given interval.
 
@@ -152,6 +176,7 @@ def run_benchmark_suite(interval, run_id, verbose=False):
         interval: Interval value (0, 2, 5, or 10)
         run_id: Run identifier for output filename
         verbose: Print detailed progress
+        parse_mode: ANTLR prediction mode, "ll" or "sll"
     """
     json_dir = JSON_INTERVALS_DIR / f"interval_{interval}"
 
@@ -170,6 +195,7 @@ def run_benchmark_suite(interval, run_id, verbose=False):
     print(f"SolQDebug Benchmark Suite")
     print(f"Interval: {interval}")
     print(f"Run ID: {run_id}")
+    print(f"Parse mode: {parse_mode}")
     print(f"Total contracts: {len(json_files)}")
     print(f"{'='*60}\n")
 
@@ -180,15 +206,23 @@ def run_benchmark_suite(interval, run_id, verbose=False):
 
         print(f"[{idx+1}/{len(json_files)}] {contract_name}...", end=" ", flush=True)
 
-        success, latency, error = run_single_benchmark(json_path, verbose)
+        skip = {'skipped': 0, 'skip_rate': 0.0}
+        success, latency, error = run_single_benchmark(json_path, verbose, parse_mode, skip)
+
+        cache = ParserHelpers.parse_cache_stats()
 
         if success:
-            print(f"OK ({latency:.4f}s)")
+            print(f"OK ({latency:.4f}s, parse cache {cache['hits']}/{cache['hits'] + cache['misses']} hits)")
             results.append({
                 'contract_name': contract_name,
                 'interval': interval,
                 'run_id': run_id,
                 'latency_s': latency,
+                'parse_hits': cache['hits'],
+                'parse_misses': cache['misses'],
+                'parse_saved_s': cache['saved_s'],
+                'skipped_fragments': skip['skipped'],
+                'skip_rate': skip['skip_rate'],
                 'success': True,
                 'error': None
             })
@@ -199,15 +233,24 @@ def run_benchmark_suite(interval, run_id, verbose=False):
                 'interval': interval,
                 'run_id': run_id,
                 'latency_s': 0.0,
+                'parse_hits': cache['hits'],
+                'parse_misses': cache['misses'],
+                'parse_saved_s': cache['saved_s'],
+                'skipped_fragments': skip['skipped'],
+                'skip_rate': skip['skip_rate'],
                 'success': False,
                 'error': error
             })
 
     # Save results
-    output_file = RESULTS_DIR / f"solqdebug_results_interval{interval}_run{run_id}.csv"
+    suffix = "" if parse_mode == "ll" else f"_{parse_mode}"
+    output_file = RESULTS_DIR / f"solqdebug_results_interval{interval}_run{run_id}{suffix}.csv"
 
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['contract_name', 'interval', 'run_id', 'latency_s', 'success', 'error'])
+        writer = csv.DictWriter(f, fieldnames=['contract_name', 'interval', 'run_id', 'latency_s',
+                                               'parse_hits', 'parse_misses', 'parse_saved_s',
+                                               'skipped_fragments', 'skip_rate',
+                                               'success', 'error'])
         writer.writeheader()
         writer.writerows(results)
 
@@ -229,6 +272,16 @@ def run_benchmark_suite(interval, run_id, verbose=False):
         print(f"  Min:  {min(latencies):.4f}s")
         print(f"  Max:  {max(latencies):.4f}s")
 
+        hits = sum(r['parse_hits'] for r in successful)
+        total = hits + sum(r['parse_misses'] for r in successful)
+        saved = sum(r['parse_saved_s'] for r in successful)
+        print(f"\nParse-tree cache:")
+        print(f"  Hits: {hits}/{total} ({(hits / total if total else 0.0):.1%})")
+        print(f"  ANTLR time saved: {saved:.4f}s")
+
+        skipped = sum(r['skipped_fragments'] for r in successful)
+        print(f"\nBroken fragments skipped (no CFG update / reinterpretation): {skipped}")
+
     if failed:
         print(f"\nFailed contracts:")
         for r in failed:
@@ -246,6 +299,7 @@ def print_usage():
     print("Options:")
     print("  --interval N  Interval value: 0, 2, 5, or 10 (default: 0)")
     print("  --run-id M    Run identifier for multiple runs (default: 1)")
+    print("  --parse-mode P  ANTLR prediction mode: ll or sll (default: ll)")
     print("  --verbose     Print detailed progress")
     print("")
     print("Examples:")
@@ -260,6 +314,7 @@ if __name__ == "__main__":
     interval = None
     run_id = None
     verbose = False
+    parse_mode = "ll"
 
     # Parse arguments
     i = 0
@@ -270,6 +325,9 @@ if __name__ == "__main__":
         elif args[i] == '--run-id' and i + 1 < len(args):
             run_id = int(args[i + 1])
             i += 2
+        elif args[i] == '--parse-mode' and i + 1 < len(args):
+            parse_mode = args[i + 1]
+            i += 2
         elif args[i] == '--verbose':
             verbose = True
             i += 1
@@ -291,5 +349,9 @@ if __name__ == "__main__":
         print(f"ERROR: Invalid interval {interval}. Must be 0, 2, 5, or 10")
         sys.exit(1)
 
+    if parse_mode not in ParserHelpers.PARSE_MODES:
+        print(f"ERROR: Invalid parse mode {parse_mode}. Must be one of {ParserHelpers.PARSE_MODES}")
+        sys.exit(1)
+
     # Run benchmark
-    run_benchmark_suite(interval, run_id, verbose)
+    run_benchmark_suite(interval, run_id, verbose, parse_mode)
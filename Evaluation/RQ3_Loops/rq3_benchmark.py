@@ -13,6 +13,8 @@ Usage:
     python rq3_benchmark.py                    # Run all 5 contracts
     python rq3_benchmark.py --contract AOC_BEP # Specific contract
     python rq3_benchmark.py --run-id 2         # Specify run ID
+    python rq3_benchmark.py --thresholds       # Threshold widening (literals + annotation bounds)
+    python rq3_benchmark.py --delay 3          # Fixed widening delay instead of the estimate
 """
 
 import sys
@@ -30,6 +32,7 @@ from Analyzer.EnhancedSolidityVisitor import EnhancedSolidityVisitor
 from Analyzer.ContractAnalyzer import ContractAnalyzer
 from Analyzer.DebugUnitAnalyzer import DebugBatchManager
 from Utils.Helper import ParserHelpers
+from Interpreter.WideningPolicy import WideningPolicy
 
 # Paths
 RQ1_JSON_DIR = PROJECT_ROOT / "Evaluation" / "RQ1_Latency" / "json_intervals" / "interval_0"
@@ -71,9 +74,11 @@ RQ3_CONTRACTS = {
 }
 
 
-def create_fresh_analyzer():
+def create_fresh_analyzer(policy=None):
     """Create a fresh ContractAnalyzer instance for each test."""
     contract_analyzer = ContractAnalyzer()
+    if policy is not None:
+        contract_analyzer.engine.widening = policy
     snapman = contract_analyzer.snapman
     batch_mgr = DebugBatchManager(contract_analyzer, snapman)
     return contract_analyzer, batch_mgr
@@ -127,29 +132,41 @@ def simulate_inputs(records, contract_analyzer, batch_mgr, verbose=False):
     return True
 
 
-def run_single_benchmark(json_path, verbose=False):
+def summarize_loop_stats(loop_stats, function):
+    """Aggregate Engine.loop_stats for the loops of the target function."""
+    stats = [v for (fname, _), v in loop_stats.items() if fname == function]
+    return {
+        'loops': len(stats),
+        'widening_iters': sum(v['widening'] for v in stats),
+        'narrowing_iters': sum(v['narrowing'] for v in stats),
+        'max_visits': max((v['max_visits'] for v in stats), default=0),
+        'converged': all(v['converged'] and v['narrowing_converged'] for v in stats),
+    }
+
+
+def run_single_benchmark(json_path, function, policy=None, verbose=False):
     """
     Run benchmark on a single JSON file.
-    Returns: (success, latency_seconds, error_message)
+    Returns: (success, latency_seconds, loop_summary, error_message)
     """
     try:
         with open(json_path, 'r', encoding='utf-8') as f:
             records = json.load(f)
 
-        contract_analyzer, batch_mgr = create_fresh_analyzer()
+        contract_analyzer, batch_mgr = create_fresh_analyzer(policy)
 
         start_time = time.perf_counter()
         success = simulate_inputs(records, contract_analyzer, batch_mgr, verbose)
         end_time = time.perf_counter()
 
         latency = end_time - start_time
-        return True, latency, None
+        return True, latency, summarize_loop_stats(contract_analyzer.engine.loop_stats, function), None
 
     except Exception as e:
-        return False, 0.0, str(e)
+        return False, 0.0, summarize_loop_stats({}, function), str(e)
 
 
-def run_benchmark(contracts=None, run_id=1, verbose=False):
+def run_benchmark(contracts=None, run_id=1, verbose=False, policy=None):
     """
     Run RQ3 benchmark on loop contracts.
 
@@ -157,6 +174,7 @@ def run_benchmark(contracts=None, run_id=1, verbose=False):
         contracts: List of contract names to test (default: all 5)
         run_id: Run identifier for output filename
         verbose: Print detailed progress
+        policy: WideningPolicy for every analyzer (default: Engine default)
     """
     if contracts is None:
         contracts = list(RQ3_CONTRACTS.keys())
@@ -192,10 +210,11 @@ def run_benchmark(contracts=None, run_id=1, verbose=False):
 
         print(f"[{idx+1}/{len(contracts)}] {contract_name} ({info['function']})...", end=" ", flush=True)
 
-        success, latency, error = run_single_benchmark(json_path, verbose)
+        success, latency, loops, error = run_single_benchmark(json_path, info['function'], policy, verbose)
 
         if success:
-            print(f"OK ({latency:.4f}s)")
+            print(f"OK ({latency:.4f}s, {loops['loops']} loops, "
+                  f"{loops['widening_iters']}+{loops['narrowing_iters']} iters)")
             results.append({
                 'contract_name': contract_name,
                 'function': info['function'],
@@ -203,6 +222,7 @@ def run_benchmark(contracts=None, run_id=1, verbose=False):
                 'expected': info['expected'],
                 'run_id': run_id,
                 'latency_s': latency,
+                **loops,
                 'success': True,
                 'error': None
             })
@@ -215,6 +235,7 @@ def run_benchmark(contracts=None, run_id=1, verbose=False):
                 'expected': info['expected'],
                 'run_id': run_id,
                 'latency_s': 0.0,
+                **loops,
                 'success': False,
                 'error': error
             })
@@ -225,7 +246,8 @@ def run_benchmark(contracts=None, run_id=1, verbose=False):
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
         writer = csv.DictWriter(f, fieldnames=[
             'contract_name', 'function', 'pattern', 'expected',
-            'run_id', 'latency_s', 'success', 'error'
+            'run_id', 'latency_s', 'loops', 'widening_iters', 'narrowing_iters',
+            'max_visits', 'converged', 'success', 'error'
         ])
         writer.writeheader()
         writer.writerows(results)
@@ -269,6 +291,8 @@ if __name__ == "__main__":
     contracts = None
     run_id = 1
     verbose = False
+    thresholds = False
+    delay = None
 
     i = 0
     while i < len(args):
@@ -281,10 +305,17 @@ if __name__ == "__main__":
         elif args[i] == '--verbose':
             verbose = True
             i += 1
+        elif args[i] == '--thresholds':
+            thresholds = True
+            i += 1
+        elif args[i] == '--delay' and i + 1 < len(args):
+            delay = int(args[i + 1])
+            i += 2
         elif args[i] in ['--help', '-h']:
             print(__doc__)
             sys.exit(0)
         else:
             i += 1
 
-    run_benchmark(contracts, run_id, verbose)
+    policy = WideningPolicy(thresholds=thresholds, delay=delay) if (thresholds or delay is not None) else None
+    run_benchmark(contracts, run_id, verbose, policy)
@@ -0,0 +1,192 @@
+"""
+내부 함수 호출의 call-string(k-CFA) 컨텍스트 관리 (Engine.calls)
+
+evaluate_function_call_context 는 callee CFG 를 그대로 다시 해석하므로
+재귀·상호 재귀 함수는 파이썬 스택이 넘칠 때까지 내려가고, 깊은 호출 체인은
+지연 시간을 곱절로 늘린다.  CallStringManager 는
+
+  • 현재 호출 스택과 마지막 K 개 호출 지점(call-string)을 컨텍스트로 관리하고
+  • (callee, context) 별 반환값을 memo 해 두며
+  • 스택에 이미 있는 callee 를 다시 부르면(재귀) 내려가지 않고 memo 값
+    (없으면 반환 타입의 ⊤)을 돌려준 뒤, 바깥 호출이 끝나면 결과를 memo 에
+    widening 으로 합쳐 값이 안정될 때까지(최대 MAX_RECURSION_ROUNDS) 다시 해석하고
+  • 호출 깊이(MAX_DEPTH)와 flush 당 시간 예산(TIME_BUDGET_S)을 넘으면
+    callee 해석 대신 같은 근사값을 쓴다.
+"""
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from Utils.CFG import FunctionCFG
+
+from Domain.Interval import IntegerInterval, UnsignedIntegerInterval, BoolInterval
+from Domain.AddressSet import AddressSet
+
+
+class CallFrame:
+    __slots__ = ("fcfg", "site", "recursed")
+
+    def __init__(self, fcfg: "FunctionCFG", site):
+        self.fcfg = fcfg
+        self.site = site
+        self.recursed = False      # 이 프레임 아래에서 자기 자신을 다시 불렀는지
+
+
+class CallStringManager:
+    K = 2                        # call-string 길이
+    MAX_DEPTH = 16               # 내부 호출 중첩 한도
+    TIME_BUDGET_S: float | None = 10.0   # flush 한 번에 쓸 수 있는 호출 해석 시간 (None = 무제한)
+    MAX_RECURSION_ROUNDS = 4     # 재귀 사이클 재해석 횟수 (이후 memo 값으로 고정)
+
+    def __init__(self):
+        self.stack: list[CallFrame] = []
+        self.memo: dict[tuple, Any] = {}
+        self._deadline: float | None = None
+        self.stats = {"calls": 0, "recursive": 0, "depth_cut": 0, "budget_cut": 0, "rounds": 0}
+
+    # ─────────────────────────────────────────── 예산
+    def start_budget(self) -> None:
+        """debug flush 시작 – 시간 예산을 새로 잡는다"""
+        self._deadline = (time.perf_counter() + self.TIME_BUDGET_S
+                          if self.TIME_BUDGET_S is not None else None)
+
+    def end_budget(self) -> None:
+        self._deadline = None
+
+    def over_budget(self) -> bool:
+        return self._deadline is not None and time.perf_counter() > self._deadline
+
+    # ─────────────────────────────────────────── 컨텍스트
+    def context(self, site) -> tuple:
+        """현재 스택의 마지막 K-1 개 호출 지점 + 이번 호출 지점"""
+        tail = [id(f.site) for f in self.stack[-(self.K - 1):]] if self.K > 1 else []
+        return tuple(tail) + (id(site),)
+
+    def _frame_of(self, fcfg: "FunctionCFG") -> CallFrame | None:
+        for f in reversed(self.stack):
+            if f.fcfg is fcfg:
+                return f
+        return None
+
+    # ─────────────────────────────────────────── 호출
+    def call(self, fcfg: "FunctionCFG", site, run):
+        """
+        run() 으로 callee 를 해석한다.  재귀·깊이·시간 한도에 걸리면 run 대신 근사값.
+        run 은 caller env 반영까지 끝낸 뒤 반환값을 돌려주는 함수.
+        """
+        self.stats["calls"] += 1
+        if not self.stack:
+            # 바깥쪽 호출마다 새로 – 이전 편집 상태에서 얻은 memo 로 재귀를 시작하지 않도록
+            self.memo.clear()
+        key = (fcfg, self.context(site))
+
+        frame = self._frame_of(fcfg)
+        if frame is not None:
+            # 재귀 사이클 – 내려가지 않고 현재까지의 근사값 사용
+            frame.recursed = True
+            self.stats["recursive"] += 1
+            return self.approximate(fcfg, key)
+        if len(self.stack) >= self.MAX_DEPTH:
+            self.stats["depth_cut"] += 1
+            return self.approximate(fcfg, key)
+        if self.over_budget():
+            self.stats["budget_cut"] += 1
+            return self.approximate(fcfg, key)
+
+        frame = CallFrame(fcfg, site)
+        self.stack.append(frame)
+        try:
+            result = run()
+            recursive = frame.recursed
+            rounds = 0
+            # 재귀가 있었으면 memo 를 widening 하며 안정될 때까지 다시 해석
+            while frame.recursed and rounds < self.MAX_RECURSION_ROUNDS:
+                old = self.memo.get(key)
+                new = result if old is None else _widen_value(old, result)
+                self.memo[key] = new
+                if old is not None and _same_value(old, new):
+                    break
+                frame.recursed = False
+                rounds += 1
+                self.stats["rounds"] += 1
+                result = run()
+        finally:
+            self.stack.pop()
+
+        # 비재귀 호출은 마지막 결과, 재귀 사이클은 widening 한 결과를 memo
+        if recursive and key in self.memo:
+            self.memo[key] = _widen_value(self.memo[key], result)
+        else:
+            self.memo[key] = result
+        return result
+
+    def approximate(self, fcfg: "FunctionCFG", key):
+        if key in self.memo:
+            return _fresh(self.memo[key])
+        # 같은 callee 의 다른 컨텍스트 memo 가 있으면 그것들의 합
+        acc = None
+        for (f, _), v in self.memo.items():
+            if f is fcfg:
+                acc = v if acc is None else _widen_value(acc, v)
+        if acc is not None:
+            return _fresh(acc)
+        return _top_of_returns(fcfg)
+
+    def clear(self) -> None:
+        self.stack.clear()
+        self.memo.clear()
+
+
+# ─────────────────────────────────────────── 값 helpers
+def _widen_value(old, new):
+    """재귀 반환값 합치기 – interval 은 widen, 그 밖에는 join, 합칠 수 없으면 새 값"""
+    if isinstance(old, (list, tuple)) and isinstance(new, (list, tuple)) and len(old) == len(new):
+        return [_widen_value(a, b) for a, b in zip(old, new)]
+    if type(old) is type(new) and not isinstance(old, str):
+        if isinstance(old, BoolInterval):          # bool 은 join 만으로 유한 높이
+            return old.join(new)
+        if hasattr(old, "widen"):
+            return old.widen(new)
+        if hasattr(old, "join"):
+            return old.join(new)
+    return new
+
+
+def _fresh(v):
+    return list(v) if isinstance(v, list) else v
+
+
+def _same_value(a, b) -> bool:
+    if hasattr(a, "equals") and type(a) is type(b):
+        return bool(a.equals(b))
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(_same_value(x, y) for x, y in zip(a, b))
+    return a is b or a == b
+
+
+def _top_of(sol_t):
+    if sol_t is None or getattr(sol_t, "typeCategory", None) != "elementary":
+        return None
+    et = sol_t.elementaryTypeName or ""
+    if et.startswith("int"):
+        return IntegerInterval.top(sol_t.intTypeLength or 256)
+    if et.startswith("uint"):
+        return UnsignedIntegerInterval.top(sol_t.intTypeLength or 256)
+    if et == "bool":
+        return BoolInterval.top()
+    if et == "address":
+        return AddressSet.top()
+    return None
+
+
+def _top_of_returns(fcfg: "FunctionCFG"):
+    types = list(fcfg.return_types or [])
+    if not types:       # 이름 있는 반환 변수만 있는 함수
+        types = [getattr(rv, "typeInfo", None) for rv in (fcfg.return_vars or [])]
+    if not types:
+        return None
+    tops = [_top_of(t) for t in types]
+    tops = [t if t is not None else f"symbolicCall({fcfg.function_name})" for t in tops]
+    return tops[0] if len(tops) == 1 else tops
@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from Analyzer.ContractAnalyzer import ContractAnalyzer
+    from Interpreter.PrefixCheckpoint import PrefixCheckpoint
 
 from Domain.Variable import Variables, MappingVariable, ArrayVariable, StructVariable
 from Domain.IR import Expression
@@ -11,16 +12,34 @@ from Domain.Interval import UnsignedIntegerInterval, IntegerInterval, BoolInterv
 from Domain.AddressSet import AddressSet
 from Utils.CFG import CFGNode, FunctionCFG
 from Utils.Helper import VariableEnv
+from Interpreter.CallContext import CallStringManager
+from Interpreter.WideningPolicy import WideningPolicy
 from collections import deque
+import weakref
+import time
 from typing import cast  # 파일 상단 import 구역에 추가
 
 class Engine:
+    # reinterpret_from 에서 바뀐 변수를 읽거나 쓰는 노드만 다시 transfer (False 면 예전 dense 방식)
+    SPARSE_REINTERPRET = True
+    # 메인 패스 · narrowing worklist 를 WTO 순서로 꺼냄 (False 면 예전 FIFO deque + join 대기)
+    WTO_SCHEDULE = True
+
     def __init__(self, an: "ContractAnalyzer"):
         self.an = an
         # ── 기록 제어 플래그(기존 Runtime 것이 여기로 이동) ───────────────
         self._record_enabled: bool = True
         self._suppress_stmt_records: bool = False  # 고정점 중 문장 기록 억제
         self._in_widening_mode: bool = False  # widening 중에는 side-effect 억제
+        # ── sparse reinterpret: 노드별 def/use 캐시 + 통계 ─────────────────
+        self._def_use_cache: "weakref.WeakKeyDictionary[CFGNode, tuple]" = weakref.WeakKeyDictionary()
+        self.reinterpret_stats = {"transfer": 0, "passthrough": 0}
+        # ── 내부 함수 호출 call-string 컨텍스트 / 재귀 가드 / 깊이·시간 예산
+        self.calls = CallStringManager()
+        # ── 루프 고정점 widening 정책 (delay / threshold / 반복 예산)
+        self.widening = WideningPolicy()
+        # ── 루프별 고정점 수렴 통계 {(함수 이름, head 라인): {"widening", "narrowing", "max_visits", ...}}
+        self.loop_stats: dict[tuple[str | None, int | None], dict] = {}
 
     # ── lazy properties (그대로 유지) ──────────────────────────────────
     @property
@@ -286,7 +305,7 @@ class Engine:
             start_env: Loop 진입 시점의 변수 환경
 
         Returns:
-            추정 반복 횟수 (기본값: 1, 최대값: 20)
+            추정 반복 횟수 (기본값: 1) – 범위 제한은 WideningPolicy.delay_for
         """
         # Loop head가 condition node가 아니면 기본값
         if not getattr(head, 'condition_node', False):
@@ -331,13 +350,11 @@ class Engine:
             else:
                 return 1
 
-            # 합리적인 범위로 제한: [1, 20]
             if iterations <= 0:
                 return 1
-            elif iterations > 20:
-                return 20
-            else:
-                return int(iterations)
+            if iterations == float("inf"):    # 상한 없는 조건 – 정책의 최대 delay
+                return self.widening.max_delay
+            return int(iterations)
 
         except Exception as e:
             # 평가 실패 시 기본값
@@ -347,7 +364,9 @@ class Engine:
     #  Fixpoint (루프 중 문장기록 억제)
     # =================================================================
     def fixpoint(self, head: CFGNode) -> CFGNode:
-        G = self.an.current_target_function_cfg.graph
+        fcfg = self.an.current_target_function_cfg
+        G = fcfg.graph
+        wto = fcfg.weak_topological_order()
         ref = self.ref; rec = self.rec
 
         def _edge_flow_from_node_out(node, succ, node_out_env):
@@ -405,17 +424,24 @@ class Engine:
         old_sup = self._suppress_stmt_records
         self._suppress_stmt_records = True
 
-        # Loop 반복 횟수 추정 (조건식 기반)
-        widening_threshold = (self._estimate_loop_iterations(head, in_vars[head]))
+        # widening 정책: delay (조건식 기반 반복 횟수 추정) / threshold / 반복 예산
+        policy = self.widening
+        widening_threshold = policy.delay_for(self, head, in_vars[head])
+        thresholds = policy.thresholds_for(fcfg, in_vars[head])
+        t0 = time.perf_counter()
 
         # ★ widening - 초기 WL은 head만 (join 노드는 predecessor가 준비되면 자동으로 추가됨)
-        W_MAX = 300
+        # ★ widening WL 은 FIFO 유지 – delay 가 노드별 방문 횟수로 반복을 세므로 순서를 바꾸면
+        #    widening 시점이 달라져 결과가 바뀐다 (interval_5 AvatarArtMarketPlace: 배열 길이 6 → 8)
+        W_MAX = policy.max_visits
         WL = deque([head])
         iteration = 0
+        max_visits = 0
 
-        while WL and max(visit_cnt.values(), default=0) < W_MAX:
+        while WL and max_visits < W_MAX:
             node = WL.popleft()
             visit_cnt[node] += 1
+            max_visits = max(max_visits, visit_cnt[node])
             iteration += 1
 
             # ★ in_vars[node]가 None인 경우 처리
@@ -484,13 +510,13 @@ class Engine:
 
                     # 이제 old in_vars와 새로 join된 값을 비교하여 widening
                     if all_pred_flows is not None:
-                        in_new = (VariableEnv.join_variables_with_widening(in_vars[succ], all_pred_flows)
+                        in_new = (policy.widen(in_vars[succ], all_pred_flows, thresholds)
                                   if succ_widen
                                   else VariableEnv.join_variables_simple(in_vars[succ], all_pred_flows))
                     else:
                         in_new = in_vars[succ]
                 else:
-                    in_new = (VariableEnv.join_variables_with_widening(in_vars[succ], flow)
+                    in_new = (policy.widen(in_vars[succ], flow, thresholds)
                               if succ_widen
                               else VariableEnv.join_variables_simple(in_vars[succ], flow))
 
@@ -500,10 +526,15 @@ class Engine:
                     in_vars[succ] = VariableEnv.copy_variables(in_new)
                     WL.append(succ)
 
+        widening_converged = not WL
+
         # narrowing
-        WL = deque(loop_nodes); N_MAX = 30
+        WL = wto.worklist(loop_nodes) if self.WTO_SCHEDULE else deque(loop_nodes)
+        N_MAX = policy.narrowing_budget
+        narrow_iter = 0
         while WL and N_MAX:
             N_MAX -= 1
+            narrow_iter += 1
             node = WL.popleft()
 
             new_in = None
@@ -535,6 +566,20 @@ class Engine:
                 if succ in loop_nodes:
                     WL.append(succ)
 
+        key = (fcfg.function_name, getattr(head, "src_line", None))
+        prev = self.loop_stats.get(key)
+        self.loop_stats[key] = {
+            "widening": iteration,
+            "narrowing": narrow_iter,
+            "max_visits": max_visits,
+            "delay": widening_threshold,
+            "thresholds": len(thresholds),
+            "converged": widening_converged,           # False = max_visits 예산에서 멈춤
+            "narrowing_converged": not WL,             # False = narrowing 예산에서 멈춤
+            "time_s": time.perf_counter() - t0,
+            "runs": (prev["runs"] if prev else 0) + 1,
+        }
+
         # ★ Narrowing 후 fixpoint_evaluation_node_vars 업데이트
         for n in loop_nodes:
             if getattr(n, "fixpoint_evaluation_node", False):
@@ -592,14 +637,22 @@ class Engine:
     # =================================================================
     #  interpret_function_cfg_for_debug (디버깅 테스트용 - 기록 활성화)
     # =================================================================
-    def interpret_function_cfg_for_debug(self, fcfg: FunctionCFG, caller_env: dict[str, Variables] | None = None):
-        return self._interpret_function_cfg_impl(fcfg, caller_env, record_enabled=True)
+    def interpret_function_cfg_for_debug(self, fcfg: FunctionCFG, caller_env: dict[str, Variables] | None = None,
+                                         checkpoint: "PrefixCheckpoint | None" = None):
+        return self._interpret_function_cfg_impl(fcfg, caller_env, record_enabled=True,
+                                                 checkpoint=checkpoint)
 
     # =================================================================
     #  _interpret_function_cfg_impl (공통 구현)
     # =================================================================
-    def _interpret_function_cfg_impl(self, fcfg: FunctionCFG, caller_env: dict[str, Variables] | None = None, record_enabled: bool = False):
+    def _interpret_function_cfg_impl(self, fcfg: FunctionCFG, caller_env: dict[str, Variables] | None = None, record_enabled: bool = False,
+                                     checkpoint: "PrefixCheckpoint | None" = None):
+        """
+        checkpoint (DebugBatchManager) : 기준 해석이면 주석 변수를 처음 건드리는 지점마다 mark,
+                                         select() 된 mark 가 있으면 그 지점부터 이어서 해석한다.
+        """
         an = self.an; rec = self.rec
+        an.tx_touch_function(fcfg)
         _old_func = an.current_target_function
         _old_fcfg = an.current_target_function_cfg
 
@@ -611,26 +664,21 @@ class Engine:
 
         # 기록 활성화 여부 설정
         self._record_enabled = record_enabled
-        an._seen_stmt_ids.clear()
-        for blk in fcfg.graph.nodes:
-            # ★ 노드의 variables 초기화 (이전 실행의 값 제거)
-            blk.variables = {}
-            for st in blk.statements:
-                ln = getattr(st, "src_line", None)
-                if ln is not None:
-                    if ln in an.analysis_per_line:
-                        an.analysis_per_line[ln].clear()
-                    # ★ recorder.ledger도 초기화 (이전 분석 결과 제거)
-                    if hasattr(rec, 'ledger') and ln in rec.ledger:
-                        rec.ledger[ln].clear()
-
-        entry = fcfg.get_entry_node()
-        (start_block,) = fcfg.graph.successors(entry)
-        start_block.variables = VariableEnv.copy_variables(fcfg.related_variables)
-
-        if caller_env is not None:
-            for k, v in caller_env.items():
-                start_block.variables[k] = v
+        resume = checkpoint.resume() if checkpoint is not None else None
+        if resume is None:
+            an._seen_stmt_ids.clear()
+            for blk in fcfg.graph.nodes:
+                # ★ 노드의 variables 초기화 (이전 실행의 값 제거)
+                blk.variables = {}
+            self._clear_function_records(fcfg)
+
+            entry = fcfg.get_entry_node()
+            (start_block,) = fcfg.graph.successors(entry)
+            start_block.variables = VariableEnv.copy_variables(fcfg.related_variables)
+
+            if caller_env is not None:
+                for k, v in caller_env.items():
+                    start_block.variables[k] = v
 
         G = fcfg.graph
         def _is_sink(n: CFGNode) -> bool:
@@ -652,23 +700,33 @@ class Engine:
                         return None
             return base
 
-        work = deque([start_block])
-        visited: set[CFGNode] = set()
-        return_values = []
+        # ★ WTO 순서 worklist: join 노드는 (back-edge 를 뺀) 모든 predecessor 뒤에 꺼내진다
+        wto = fcfg.weak_topological_order()
+        if resume is not None:
+            work, visited, return_values = resume
+        else:
+            work = wto.worklist([start_block]) if self.WTO_SCHEDULE else deque([start_block])
+            visited: set[CFGNode] = set()
+            return_values = []
 
         while work:
             node = work.popleft()
             if node in visited: continue
 
             preds = list(G.predecessors(node))
-            # ★ join 노드는 모든 predecessor가 방문될 때까지 대기
-            # 단, worklist에 자기 자신 외의 노드가 있을 때만 defer
-            if getattr(node, 'join_point_node', False) and preds:
-                unvisited_preds = [p for p in preds if p not in visited]
-                if unvisited_preds and len(work) > 0:
-                    # worklist에 다른 노드가 남아있으면 defer
-                    work.append(node)
-                    continue
+            # ★ join 노드는 모든 forward predecessor 가 방문될 때까지 대기
+            #    (아직 worklist 에 있는 앞 순서 predecessor 가 먼저 꺼내지도록 다시 넣는다;
+            #     FIFO 면 worklist 에 다른 노드가 남아 있는 동안 계속 뒤로 미룬다)
+            if getattr(node, 'join_point_node', False) and (
+                    any(p not in visited and p in work
+                        and wto.position.get(p, -1) < wto.position.get(node, -1) for p in preds)
+                    if self.WTO_SCHEDULE else
+                    work and any(p not in visited for p in preds)):
+                work.append(node)
+                continue
+
+            if checkpoint is not None and checkpoint.recording:
+                checkpoint.observe(node, work, visited, return_values)
 
             visited.add(node)
 
@@ -781,6 +839,8 @@ class Engine:
                     if _is_sink(nxt): continue
                     nxt.variables = VariableEnv.copy_variables(cur_vars)
                     work.append(nxt)
+        if checkpoint is not None:
+            checkpoint.recording = False
         self._force_join_before_exit(fcfg)
         self._sync_named_return_vars(fcfg)
 
@@ -854,6 +914,19 @@ class Engine:
                     return _restore_and_return(joined_ret)
             return _restore_and_return(joined_ret)
 
+    def _clear_function_records(self, fcfg: FunctionCFG) -> None:
+        """fcfg 의 statement 라인에 남은 이전 분석 결과 제거 (요약 캐시 hit 때도 같은 효과를 낸다)"""
+        an = self.an; rec = self.rec
+        for blk in fcfg.graph.nodes:
+            for st in blk.statements:
+                ln = getattr(st, "src_line", None)
+                if ln is not None:
+                    if ln in an.analysis_per_line:
+                        an.analysis_per_line[ln].clear()
+                    # ★ recorder.ledger도 초기화 (이전 분석 결과 제거)
+                    if hasattr(rec, 'ledger') and ln in rec.ledger:
+                        rec.ledger[ln].clear()
+
     # =================================================================
     #  reinterpret_from (변경 없음; self.* 호출로 정리)
     # =================================================================
@@ -912,12 +985,27 @@ class Engine:
             cleared_lines.add(ln)
 
 
-        for s in seeds:
-            if not _is_sink(s) and s not in in_queue:
+        # ★ sparse: 노드별로 "이번에 바뀐 변수 이름" 을 모은다 (None = 전부)
+        sparse = self.SPARSE_REINTERPRET
+        pending: dict[CFGNode, set[str] | None] = {}
+
+        def _push(s, changed):
+            if _is_sink(s):
+                return
+            if s in pending:
+                cur = pending[s]
+                pending[s] = None if cur is None or changed is None else cur | changed
+            else:
+                pending[s] = None if changed is None else set(changed)
+            if s not in in_queue:
                 WL.append(s); in_queue.add(s)
 
+        for s in seeds:
+            _push(s, None)
+
         while WL:
             n = WL.popleft(); in_queue.discard(n)
+            delta = pending.pop(n, None)
 
             in_env = _compute_in(n)
 
@@ -935,39 +1023,192 @@ class Engine:
 
                 exit_node = self.fixpoint(n)
                 for s in G.successors(exit_node):
-                    if not _is_sink(s) and s not in in_queue:
-                        WL.append(s); in_queue.add(s)
+                    _push(s, None)
+
+                continue
+
+            old_out = getattr(n, "variables", None) or None
 
+            # ── (S) sparse: 바뀐 변수를 읽지도 쓰지도 않는 노드는 transfer 없이 통과
+            if sparse and delta is not None and old_out is not None and \
+                    self._is_transparent(G, n, delta, in_env):
+                self.reinterpret_stats["passthrough"] += 1
+                new_out = VariableEnv.copy_variables(old_out)
+                for k in delta:
+                    if k in in_env:
+                        new_out[k] = VariableEnv.copy_single_variable(dict.__getitem__(in_env, k))
+                    else:
+                        new_out.pop(k, None)
+                n.variables = VariableEnv.copy_variables(new_out)
+                for ln_t in self._node_lines(n):
+                    touched_lines.add(ln_t)
+                changed = VariableEnv.changed_keys(old_out, new_out, delta)
+                out_snapshot[n] = new_out
+                for s in G.successors(n):
+                    if changed:
+                        _push(s, changed)
                 continue
 
             # ── (A) 라인 초기화: 이 노드가 기록을 남길 수 있는 라인들을 선제적으로 clear
             #     - 조건 노드: 자신의 src_line (branchTrue/requireTrue 등)
             #     - 일반/베이식: 각 statement 의 src_line
-            ln = getattr(n, "src_line", None)
-            if getattr(n, "condition_node", False):
-                _clear_line_once(ln)
-                if ln is not None: touched_lines.add(ln)
-            else:
-                for st in getattr(n, "statements", []):
-                    ln_st = getattr(st, "src_line", None)
-                    _clear_line_once(ln_st)
-                    if ln_st is not None: touched_lines.add(ln_st)
+            for ln_t in self._node_lines(n):
+                _clear_line_once(ln_t)
+                touched_lines.add(ln_t)
 
+            self.reinterpret_stats["transfer"] += 1
             new_out = self.transfer_function(n, in_env)
             n.variables = VariableEnv.copy_variables(new_out)
 
-            changed = not VariableEnv.variables_equal(out_snapshot.get(n), new_out)
+            if sparse:
+                # 이번 run 에서 이미 낸 결과와 비교해 실제로 달라진 변수만 후속 노드로 넘긴다
+                # (이번 run 의 첫 방문이면 – 예전 env 는 이전 실행의 것 – 전부 바뀐 것으로)
+                changed = (VariableEnv.changed_keys(old_out, new_out)
+                           if old_out is not None and n in out_snapshot else None)
+            else:
+                changed = (None if not VariableEnv.variables_equal(out_snapshot.get(n), new_out)
+                           else set())
             out_snapshot[n] = VariableEnv.copy_variables(new_out)
 
-            if changed:
+            if changed is None or changed:
                 for s in G.successors(n):
-                    if not _is_sink(s) and s not in in_queue:
-                        WL.append(s); in_queue.add(s)
+                    _push(s, changed)
 
             # ★ 이번 reinterpret 에서 ‘어디를 보여줄지’를 ContractAnalyzer에 남김
             if touched_lines:
                 self.an._last_touched_lines = set(touched_lines)
 
+    # =================================================================
+    #  def/use (sparse reinterpret_from)
+    # =================================================================
+    _EXPR_CHILDREN = ("left", "right", "base", "index", "start_index", "end_index",
+                      "expression", "condition", "true_expr", "false_expr")
+    _CALL_CONTEXTS = {"FunctionCallContext", "PayableFunctionCallContext",
+                      "FunctionCallOptionContext", "NewExpContext"}
+
+    @staticmethod
+    def _expr_uses(expr, out: set[str]) -> bool:
+        """
+        expr 가 읽는 변수의 루트 이름(a.b[i] → a, i / block.timestamp 는 그대로)을 out 에 모은다.
+        함수 호출처럼 효과를 알 수 없는 식이 있으면 False.
+        """
+        stack = [expr]
+        while stack:
+            e = stack.pop()
+            if e is None:
+                continue
+            if isinstance(e, (list, tuple)):
+                stack.extend(e); continue
+            if isinstance(e, dict):
+                stack.extend(e.values()); continue
+            if not isinstance(e, Expression):
+                continue
+            if e.function is not None or e.context in Engine._CALL_CONTEXTS:
+                return False
+            if e.identifier is not None and e.base is None:
+                out.add(e.identifier)
+            elif e.member is not None and e.base is not None and \
+                    e.base.identifier in VariableEnv._GLOBAL_BASES:
+                out.add(f"{e.base.identifier}.{e.member}")      # env 키는 "block.timestamp"
+            for attr in Engine._EXPR_CHILDREN:
+                sub = getattr(e, attr, None)
+                if sub is not None:
+                    stack.append(sub)
+            if e.elements:
+                stack.extend(e.elements)
+        return True
+
+    @staticmethod
+    def _lvalue_root(expr) -> str | None:
+        while expr is not None:
+            if expr.base is None and expr.identifier is not None:
+                return expr.identifier
+            expr = expr.base if expr.base is not None else expr.expression
+        return None
+
+    def _node_def_use(self, node: CFGNode) -> tuple[set[str] | None, set[str]]:
+        """
+        (defs, uses) – 루트 변수 이름 집합.  defs 가 None 이면 "모든 변수를 쓸 수 있음"
+        (함수 호출·return·revert, 참조 타입 선언처럼 별칭이 생길 수 있는 경우).
+        statement 목록이 바뀌면 다시 계산한다.
+        """
+        stmts = getattr(node, "statements", None) or []
+        cond = getattr(node, "condition_expr", None)
+        key = (tuple(map(id, stmts)), id(cond))
+        hit = self._def_use_cache.get(node)
+        if hit is not None and hit[0] == key:
+            return hit[1], hit[2]
+
+        defs: set[str] | None = set()
+        uses: set[str] = set()
+        for st in stmts:
+            typ = st.statement_type
+            ok = True
+            if typ == "variableDeclaration":
+                cat = getattr(st.type_obj, "typeCategory", None)
+                ok = cat not in {"array", "struct", "mapping"} and \
+                     Engine._expr_uses(st.init_expr, uses)
+                if ok:
+                    defs.add(st.var_name)
+            elif typ == "assignment":
+                root = Engine._lvalue_root(st.left)
+                ok = root is not None and Engine._expr_uses(st.right, uses) and \
+                     Engine._expr_uses(st.left, uses)
+                if ok:
+                    defs.add(root)
+            elif typ == "unary":
+                root = Engine._lvalue_root(st.operand)
+                ok = root is not None and Engine._expr_uses(st.operand, uses)
+                if ok:
+                    defs.add(root)
+            elif typ in {"break", "continue"}:
+                pass
+            else:                       # functionCall / return / revert
+                ok = False
+            if not ok:
+                defs = None
+                break
+        if defs is not None and cond is not None and not Engine._expr_uses(cond, uses):
+            defs = None
+
+        self._def_use_cache[node] = (key, defs, uses)
+        return defs, uses
+
+    def _is_transparent(self, G, node: CFGNode, delta: set[str], in_env: dict) -> bool:
+        """delta 에 속한 변수를 읽지도 쓰지도 않아 transfer 를 건너뛰어도 되는 노드인가"""
+        defs, uses = self._node_def_use(node)
+        if defs is None or not delta.isdisjoint(defs) or not delta.isdisjoint(uses):
+            return False
+        # 참조 타입 지역 변수(storage 포인터 등)에 쓰면 다른 변수도 바뀔 수 있다
+        for name in defs:
+            v = dict.get(in_env, name)
+            if isinstance(v, (ArrayVariable, StructVariable, MappingVariable)) and \
+                    getattr(v, "scope", None) != "state":
+                return False
+        # 조건 노드에서 들어오는 edge : delta 가 조건식에 걸리면 feasibility 가 바뀔 수 있다
+        for p in G.predecessors(node):
+            if getattr(p, "condition_node", False):
+                p_defs, p_uses = self._node_def_use(p)
+                if p_defs is None or not delta.isdisjoint(p_uses):
+                    return False
+        return True
+
+    @staticmethod
+    def _node_lines(node: CFGNode) -> list[int]:
+        """이 노드가 기록을 남길 수 있는 라인들 (조건 노드: 자신의 라인, 그 외: statement 라인)"""
+        if getattr(node, "condition_node", False):
+            ln = getattr(node, "src_line", None)
+            return [ln] if ln is not None else []
+        return [ln for st in getattr(node, "statements", [])
+                if (ln := getattr(st, "src_line", None)) is not None]
+
+    def _function_lines(self, fcfg: FunctionCFG) -> set[int]:
+        """fcfg 해석이 ledger 에 기록을 남길 수 있는 라인 전부 (노드별 _node_lines 의 합)"""
+        out: set[int] = set()
+        for n in fcfg.graph.nodes:
+            out.update(self._node_lines(n))
+        return out
+
     # =================================================================
     #  Helpers (branch feasible, bottom, EXIT sync, line utils)
     # =================================================================
@@ -1059,22 +1300,9 @@ class Engine:
         """
         loop_head(while/for/do-while 의 조건 노드)에서 시작해,
         loop-exit 노드(= False 분기에서 loop_exit_node=True)를 '절단점'으로 보고
-        그 안쪽 노드들만 수집한다.
+        그 안쪽 노드들만 수집한다.  (그래프가 그대로면 LoopForest 캐시 – 호출자가 고칠 수 있게 복사본)
         """
-        G = self.an.current_target_function_cfg.graph
-        visited: set[CFGNode] = set()
-        stack = [loop_head]
-        while stack:
-            cur = stack.pop()
-            if cur in visited:
-                continue
-            visited.add(cur)
-            for succ in G.successors(cur):
-                # 루프 바깥으로 나가는 exit 노드는 확장하지 않음
-                if getattr(succ, "loop_exit_node", False):
-                    continue
-                stack.append(cast(CFGNode, succ))
-        return visited
+        return set(self.an.current_target_function_cfg.loop_forest().region(loop_head))
 
     def is_node_in_loop(self, node: CFGNode, loop_head: CFGNode) -> bool:
         """
@@ -1083,9 +1311,14 @@ class Engine:
         """
         if getattr(node, "loop_exit_node", False):
             return False
-        return node in self.traverse_loop_nodes(loop_head)
+        return node in self.an.current_target_function_cfg.loop_forest().region(loop_head)
 
     def find_loop_exit_node(self, loop_head: CFGNode) -> CFGNode:
+        """loop_head 의 loop-exit 노드 (그래프가 그대로면 LoopForest 캐시)"""
+        forest = self.an.current_target_function_cfg.loop_forest()
+        return forest.cached_exit(loop_head, self._find_loop_exit_node)
+
+    def _find_loop_exit_node(self, loop_head: CFGNode) -> CFGNode:
         """
         (가능하면) 헤더의 False-edge 로 표시된 loop-exit 를 먼저 사용하고,
         없다면 traverse 기반으로 '루프 내부 노드들의 후속 중 루프 밖에 있는 유일한 노드'를 찾는다.
@@ -1099,7 +1332,7 @@ class Engine:
                 return cast(CFGNode, succ)
 
         # 2) traverse 로 루프 내부 집합을 만든 뒤 바깥으로 나가는 successor 를 후보로 수집
-        loop_nodes = self.traverse_loop_nodes(loop_head)
+        loop_nodes = self.an.current_target_function_cfg.loop_forest().region(loop_head)
         exit_candidates: set[CFGNode] = set()
         for n in loop_nodes:
             for succ in G.successors(n):
@@ -0,0 +1,171 @@
+"""
+디버그 주석 변수의 prefix 공유 (DebugBatchManager.flush / flush_batch)
+
+주석이 붙은 변수(names)를 읽지도 쓰지도 않는 노드만 worklist 에서 나온 동안은,
+그 변수들이 진입 값 그대로 env 를 따라 흘러갈 뿐 다른 결과에 영향을 주지 않는다.
+
+  • 기준 해석 (recording) : names 중 아직 아무도 건드리지 않은 변수를 처음 건드리는
+                             노드가 나올 때마다, 그 노드 직전 상태(worklist / visited /
+                             노드 env / 함수 라인의 ledger)를 mark 로 남긴다
+                             (mark 수 ≤ len(names) + 1)
+  • 다음 해석 : 기준 진입 env 와 지금의 related_variables 를 비교해 값이 바뀐 변수만
+                골라, 그 변수들을 처음 건드리는 노드 직전 mark 로 되돌리고 env 의
+                그 변수만 새 값으로 바꿔 끼운 뒤 같은 worklist 루프를 이어 돈다
+                → 전체 재해석과 같은 결과
+
+루프 head, 함수 호출·return 처럼 def/use 를 모르는 노드는 names 전부를 건드린 것으로 본다.
+함수 CFG 가 바뀌었거나 주석 밖 변수 값이 바뀌었으면 select() 가 False → 전체 해석.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from Interpreter.Engine import Engine
+    from Utils.CFG import CFGNode, FunctionCFG
+
+from Domain.Variable import ArrayVariable, StructVariable, MappingVariable
+from Utils.Helper import VariableEnv
+
+_LOOP_TYPES = {"while", "for", "doWhile", "do_while"}
+# env 말고 해석이 노드에 남기는 값 (loop join 의 기준 / fixpoint env – loopDelta 에 쓰인다)
+_NODE_ATTRS = ("evaluated", "join_baseline_env", "fixpoint_evaluation_node_vars")
+
+
+class _Mark(NamedTuple):
+    pos: int                # 이 지점까지 꺼낸(공유되는) 노드 수
+    work: object            # WTOWorklist 사본 (멈춘 노드 포함)
+    visited: frozenset
+    return_values: tuple
+    seen: frozenset         # ContractAnalyzer._seen_stmt_ids
+    envs: dict              # 노드 → env fork (env 가 있는 노드만)
+    attrs: dict             # 노드 → _NODE_ATTRS 값 (해석은 통째로 갈아 끼우므로 참조만)
+    ledger: object          # 함수 라인의 ledger 스냅
+
+
+def _shape(fcfg: "FunctionCFG") -> tuple:
+    """CFG 구조 + 노드별 statement / 조건식 (편집되면 달라진다)"""
+    G = fcfg.graph
+    return (getattr(G, "version", None),
+            tuple((id(n), tuple(map(id, getattr(n, "statements", None) or ())),
+                   id(getattr(n, "condition_expr", None))) for n in G.nodes))
+
+
+class PrefixCheckpoint:
+
+    def __init__(self, engine: "Engine", fcfg: "FunctionCFG", names: set[str]):
+        self.engine = engine
+        self.fcfg = fcfg
+        self.names = set(names)
+        if "block.timestamp" in self.names:
+            self.names.add("now")
+        self.base_env = VariableEnv.copy_variables(fcfg.related_variables)   # 기준 진입 값
+        self.recording = True           # 기준 해석이 끝나면 False (Engine 이 닫는다)
+        self.shared = 0                 # 마지막 resume 에서 건너뛴 노드 수
+        self._shape = _shape(fcfg)
+        self._touched: set[str] = set()
+        self._marks: list[tuple[frozenset, _Mark]] = []
+        self._selected: tuple[_Mark, set[str]] | None = None
+
+    # ─────────────────────────────────────────── 기준 해석 중
+    def observe(self, node: "CFGNode", work, visited: set, return_values: list) -> None:
+        """node 를 처리하기 직전 – 새 주석 변수를 건드리면 mark"""
+        new = self._hits(node) - self._touched
+        if not new:
+            return
+        self._marks.append((frozenset(self.names - self._touched),
+                            self._save(node, work, visited, return_values)))
+        self._touched |= new
+        if self._touched >= self.names:
+            self.recording = False
+
+    def _hits(self, node: "CFGNode") -> set[str]:
+        """node 가 읽거나 쓸 수 있는 names (모르면 전부)"""
+        if getattr(node, "condition_node", False) and \
+                getattr(node, "condition_node_type", None) in _LOOP_TYPES:
+            return self.names
+        defs, uses = self.engine._node_def_use(node)
+        if defs is None:
+            return self.names
+        # 참조 타입 지역 변수(storage 포인터 등)에 쓰면 names 도 바뀔 수 있다
+        env = getattr(node, "variables", None) or {}
+        for name in defs:
+            v = dict.get(env, name)
+            if isinstance(v, (ArrayVariable, StructVariable, MappingVariable)) and \
+                    getattr(v, "scope", None) != "state":
+                return self.names
+        return self.names & (defs | uses)
+
+    def _save(self, node, work, visited, return_values) -> _Mark:
+        an = self.engine.an
+        rest = work.copy()
+        rest.append(node)
+        # 이후 해석이 env 를 제자리에서 고치므로 fork 해 둔다
+        envs = {n: VariableEnv.copy_variables(n.variables)
+                for n in self.fcfg.graph.nodes if getattr(n, "variables", None)}
+        attrs = {n: tuple(getattr(n, a, None) for a in _NODE_ATTRS)
+                 for n in self.fcfg.graph.nodes}
+        ledger = self.engine.rec.ledger
+        lines = self._lines()
+        snap = ledger.snapshot(list, lines) if hasattr(ledger, "snapshot") \
+            else {ln: list(ledger[ln]) for ln in lines if ln in ledger}
+        return _Mark(len(visited), rest, frozenset(visited), tuple(return_values),
+                     frozenset(an._seen_stmt_ids), envs, attrs, snap)
+
+    def _lines(self) -> set[int]:
+        return self.engine._function_lines(self.fcfg)
+
+    # ─────────────────────────────────────────── 다음 해석
+    def changed(self) -> set[str]:
+        """기준 해석 이후 값이 바뀐 진입 변수 이름"""
+        return VariableEnv.changed_keys(self.base_env, self.fcfg.related_variables)
+
+    def select(self) -> bool:
+        """바뀐 변수를 처음 건드리는 노드 직전 mark 를 고른다 (False → 전체 해석)"""
+        self._selected = None
+        if self.recording or not self._marks or _shape(self.fcfg) != self._shape:
+            return False
+        changed = self.changed()
+        if not changed <= self.names:
+            return False
+        for free, mark in reversed(self._marks):
+            if changed <= free:
+                self._selected = (mark, changed)
+                return True
+        return False
+
+    def resume(self):
+        """select() 한 mark 로 되돌리고 (work, visited, return_values) – 고른 게 없으면 None"""
+        if self._selected is None:
+            return None
+        mark, changed = self._selected
+        self._selected = None
+        related = self.fcfg.related_variables
+        for n in self.fcfg.graph.nodes:
+            for a, v in zip(_NODE_ATTRS, mark.attrs.get(n, ())):
+                setattr(n, a, v)
+            env = mark.envs.get(n)
+            if env is None:
+                n.variables = {}
+                continue
+            # 진입 env 처럼 (fork_of) related_variables 와 객체를 공유하지 않는 사본
+            env = VariableEnv.copy_variables(env)
+            for name in changed:
+                if name in related:
+                    env[name] = VariableEnv.copy_single_variable(related[name])
+                else:
+                    env.pop(name, None)
+            n.variables = env
+
+        ledger = self.engine.rec.ledger
+        if hasattr(ledger, "restore"):
+            ledger.restore([(h, list(v)) for h, v in mark.ledger], self._lines())
+        else:
+            for ln in self._lines():
+                ledger.pop(ln, None)
+            ledger.update({k: list(v) for k, v in mark.ledger.items()})
+        an = self.engine.an
+        an._seen_stmt_ids.clear()
+        an._seen_stmt_ids.update(mark.seen)
+        self.shared = mark.pos
+        return mark.work.copy(), set(mark.visited), list(mark.return_values)
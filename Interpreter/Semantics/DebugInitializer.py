@@ -443,6 +443,9 @@ class DebugInitializer:
         - `array.length = [N, N]` → 동적 배열의 크기를 N개로 초기화
         """
 
+        # 트랜잭션 중이면 LHS 의 루트 변수를 고치기 전에 기록 (mapping entry 강제 생성 포함)
+        self._touch_root_for_debug(lhs_expr, variables)
+
         # ★ 특별 케이스: 동적 배열의 .length 설정
         if (lhs_expr.context in ("MemberAccessContext", "TestingMemberAccess") and
             lhs_expr.member == "length"):
@@ -521,6 +524,16 @@ class DebugInitializer:
         if hasattr(self.an, 'snapman') and hasattr(self.an, 'ser'):
             if id(target_var) not in self.an.snapman.store:
                 self.an.snapman.register(target_var, self.an.ser)
+        self.an.tx_touch(target_var)
+
+    def _touch_root_for_debug(self, lhs_expr: Expression, variables: dict[str, Variables]):
+        """a[k].m 같은 LHS 의 루트 변수(a)를 열린 트랜잭션에 기록"""
+        root = lhs_expr
+        while getattr(root, "base", None) is not None:
+            root = root.base
+        name = getattr(root, "identifier", None)
+        if name is not None and name in variables:
+            self.an.tx_touch(dict.__getitem__(variables, name))
 
     def _patch_var_with_new_value_for_debug(self, target_var, new_value):
         """
@@ -1247,15 +1247,20 @@ class Evaluation :
             raise ValueError(f"Argument count mismatch in function call to '{function_name}': "
                              f"expected {total_params}, got {total_args}.")
 
+        # callee 진입 변수(파라미터 값 / caller env 병합)를 고치기 전에 열린 트랜잭션에 기록
+        self.an.tx_touch_function(function_cfg)
+
         # 현재 함수 컨텍스트 저장
         saved_function = self.an.current_target_function
         self.current_target_function = function_name
 
         # 5) 인자 해석
         #    순서 기반 인자
+        arg_vals = []
         for i, arg_expr in enumerate(arguments):
             param_name = param_names[i]
             arg_val = self.evaluate_expression(arg_expr, variables, None, None)
+            arg_vals.append(arg_val)
 
             # function_cfg 내부의 related_variables에 param_name이 있어야
             if param_name in function_cfg.related_variables:
@@ -1270,6 +1275,7 @@ class Evaluation :
             if key not in param_names:
                 raise ValueError(f"Unknown named parameter '{key}' in function '{function_name}'.")
             arg_val = self.evaluate_expression(expr_val, variables, None, f"CallNamedArg({function_name})")
+            arg_vals.append((key, arg_val))
 
             if key in function_cfg.related_variables:
                 function_cfg.related_variables[key].value = arg_val
@@ -1282,8 +1288,21 @@ class Evaluation :
         for k, v in variables.items():
             function_cfg.related_variables.setdefault(k, v)
 
-        # 6) 실제 함수 CFG 해석
-        return_value = self.an.engine.interpret_function_cfg(function_cfg, variables)  # ← caller env 전달
+        # 6) 실제 함수 CFG 해석 – 같은 인자·같은 read-set 값으로 부른 적이 있으면 요약 재사용
+        summaries = self.an.summaries
+
+        def _run():
+            summary_key = summaries.key_for(function_cfg, arg_vals, variables)
+            summary = summaries.lookup(function_cfg, summary_key) if summary_key is not None else None
+            if summary is not None:
+                return summaries.apply(function_cfg, summary, variables)
+            result = self.an.engine.interpret_function_cfg(function_cfg, variables)  # ← caller env 전달
+            if summary_key is not None:
+                summaries.store(function_cfg, summary_key, result)
+            return result
+
+        # 재귀·호출 깊이·flush 시간 예산은 call-string 컨텍스트 관리자가 처리
+        return_value = self.an.engine.calls.call(function_cfg, expr, _run)
 
         # 7) 함수 컨텍스트 복원
         self.an.current_target_function = saved_function
@@ -5,10 +5,9 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:                                         # 타입 검사 전용
      from Analyzer.ContractAnalyzer import ContractAnalyzer
 
-from Analyzer.EnhancedSolidityVisitor import READONLY_MEMBERS, READONLY_GLOBAL_BASES
 from Domain.Interval import *
 from Domain.Variable import Variables
-from Domain.IR import Expression
+from Domain.IR import Expression, READONLY_MEMBERS, READONLY_GLOBAL_BASES
 from Utils.Helper import VariableEnv
 
 
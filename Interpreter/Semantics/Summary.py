@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, NamedTuple, Any
+import copy
+
+if TYPE_CHECKING:                                         # 타입 검사 전용
+     from Analyzer.ContractAnalyzer import ContractAnalyzer
+     from Utils.CFG import FunctionCFG
+
+from Domain.Variable import Variables, ArrayVariable, StructVariable, MappingVariable
+from Domain.Interval import Interval
+from Domain.IR import Expression
+from Utils.Helper import VariableEnv
+
+
+class Summary(NamedTuple):
+    return_value: Any
+    return_vars: list          # 호출 후 fcfg.return_vars 각각의 value (value 가 없으면 변수 자체)
+    exits: dict                # read-set 이름 → 호출 종료 시 EXIT env 의 변수
+    reached: bool              # EXIT env 가 비어 있지 않았는지 (모든 경로가 revert 면 False)
+
+
+class FunctionSummaries:
+    """
+    내부 함수 호출 요약 캐시 (Evaluation.evaluate_function_call_context 용)
+
+    key = (callee, 인자 값, callee 가 (전이적으로) 참조하는 변수들의 호출 시점 값)
+      • 같은 key 로 다시 호출되면 callee CFG 해석을 건너뛰고 저장된
+        반환값 / EXIT env 를 caller env 에 그대로 반영한다.
+      • callee(또는 그 callee 가 부르는 내부 함수)의 graph.version 이 바뀌면
+        stamp 가 달라져 그 callee 의 요약 전체를 버린다.
+      • stamp / read-set 은 함수별로 graph.version 에 묶어 두어, 캐시 조회마다
+        callee CFG 를 다시 훑지 않는다 (버전 비교만).
+    """
+
+    MAX_PER_FUNCTION = 64
+
+    def __init__(self, analyzer: "ContractAnalyzer"):
+        self.an = analyzer
+        self.enabled = True
+        # fcfg → (stamp, read-set, OrderedDict[key, Summary])
+        self._cache: dict["FunctionCFG", tuple[tuple, frozenset, OrderedDict]] = {}
+        # fcfg → (graph.version, 참조 이름, callee 이름) – 그래프가 바뀔 때만 다시 훑는다
+        self._shapes: dict["FunctionCFG", tuple[int, frozenset, frozenset]] = {}
+        self._stats = {"hits": 0, "misses": 0, "bypass": 0, "invalidations": 0}
+
+    # ─────────────────────────────────────────── 통계
+    def stats(self) -> dict[str, float]:
+        st = dict(self._stats)
+        total = st["hits"] + st["misses"]
+        st["hit_rate"] = (st["hits"] / total) if total else 0.0
+        st["size"] = sum(len(c[2]) for c in self._cache.values())
+        return st
+
+    def clear(self, reset_stats: bool = True) -> None:
+        self._cache.clear()
+        self._shapes.clear()
+        if reset_stats:
+            self._stats.update(hits=0, misses=0, bypass=0, invalidations=0)
+
+    # ─────────────────────────────────────────── 조회 / 저장
+    def key_for(self, fcfg: "FunctionCFG", arg_vals: list, caller_env: dict):
+        """캐시 key (캐시할 수 없는 호출이면 None)"""
+        if not self.enabled:
+            return None
+        entry = self._entry(fcfg)
+        if entry is None:
+            self._stats["bypass"] += 1
+            return None
+        _, read_set, _ = entry
+
+        related = fcfg.related_variables
+        env_key = []
+        for name in sorted(read_set):
+            # dict.get : PersistentEnv 의 공유 변수를 복사하지 않고 읽기
+            v = dict.get(caller_env, name) if name in caller_env else dict.get(related, name)
+            if v is not None:
+                env_key.append((name, value_key(v)))
+        return (tuple(_val_key(a) for a in arg_vals),
+                bool(self.an.engine._in_widening_mode),
+                tuple(env_key))
+
+    def lookup(self, fcfg: "FunctionCFG", key) -> Summary | None:
+        summaries = self._cache[fcfg][2]
+        hit = summaries.get(key)
+        if hit is None:
+            self._stats["misses"] += 1
+            return None
+        summaries.move_to_end(key)
+        self._stats["hits"] += 1
+        return hit
+
+    def store(self, fcfg: "FunctionCFG", key, return_value) -> None:
+        _, read_set, summaries = self._cache[fcfg]
+        exit_env = fcfg.get_exit_node().variables or {}
+        exits = {k: VariableEnv.copy_single_variable(dict.__getitem__(exit_env, k))
+                 for k in read_set if k in exit_env}
+        ret_vars = [copy.deepcopy(rv.value) if hasattr(rv, "value")
+                    else VariableEnv.copy_single_variable(rv)
+                    for rv in (fcfg.return_vars or [])]
+        summaries[key] = Summary(copy.deepcopy(return_value), ret_vars, exits, bool(exit_env))
+        if len(summaries) > self.MAX_PER_FUNCTION:
+            summaries.popitem(last=False)
+
+    def apply(self, fcfg: "FunctionCFG", summary: Summary, caller_env: dict):
+        """
+        interpret_function_cfg(fcfg, caller_env) 를 다시 돌린 것과 같은 효과를
+        caller_env / fcfg.return_vars 에 남기고 반환값을 돌려준다.
+        """
+        engine = self.an.engine
+        self.an._seen_stmt_ids.clear()
+        engine._clear_function_records(fcfg)
+
+        for i, rv in enumerate(fcfg.return_vars or []):
+            if hasattr(rv, "value"):
+                rv.value = copy.deepcopy(summary.return_vars[i])
+            else:
+                fcfg.return_vars[i] = VariableEnv.copy_single_variable(summary.return_vars[i])
+
+        # caller_env 반영 (Engine._interpret_function_cfg_impl 과 같은 규칙)
+        if caller_env is not None and summary.reached:
+            for k, v in summary.exits.items():
+                v = VariableEnv.copy_single_variable(v)
+                if k in caller_env:
+                    if hasattr(caller_env[k], "value"):
+                        caller_env[k].value = v.value
+                    else:
+                        caller_env[k] = v
+                elif isinstance(v, (MappingVariable, ArrayVariable)):
+                    caller_env[k] = v
+            # read-set 밖의 변수는 callee 가 건드리지 않으므로 시작 env 그대로
+            read_set = self._cache[fcfg][1]
+            for k, v in fcfg.related_variables.items():
+                if k not in read_set and k not in caller_env and \
+                        isinstance(v, (MappingVariable, ArrayVariable)):
+                    caller_env[k] = VariableEnv.copy_single_variable(v)
+
+        return copy.deepcopy(summary.return_value)
+
+    # ─────────────────────────────────────────── stamp / read-set
+    def _entry(self, fcfg: "FunctionCFG"):
+        stamp = self._stamp(fcfg, set())
+        if stamp is None:
+            return None
+        entry = self._cache.get(fcfg)
+        if entry is None or entry[0] != stamp:
+            if entry is not None:
+                self._stats["invalidations"] += 1
+            entry = (stamp, self._read_set(fcfg, set()), OrderedDict())
+            self._cache[fcfg] = entry
+        return entry
+
+    def _functions(self) -> dict:
+        contract_cfg = self.an.contract_cfgs.get(self.an.current_target_contract)
+        return contract_cfg.functions if contract_cfg else {}
+
+    def _stamp(self, fcfg: "FunctionCFG", visiting: set):
+        """
+        callee 와 그 callee 가 (전이적으로) 부르는 내부 함수들의 (그래프, version).
+        재귀 호출이 있으면 None (캐시하지 않음).
+        """
+        if fcfg in visiting:
+            return None
+        visiting.add(fcfg)
+        version, _, callees = self._shape(fcfg)
+        stamp = [(id(fcfg.graph), version)]
+        functions = self._functions()
+        for name in sorted(callees):
+            sub = functions.get(name)
+            if sub is None:
+                continue
+            sub_stamp = self._stamp(sub, visiting)
+            if sub_stamp is None:
+                return None
+            stamp.append(sub_stamp)
+        visiting.discard(fcfg)
+        return tuple(stamp)
+
+    def _read_set(self, fcfg: "FunctionCFG", seen: set) -> frozenset:
+        """callee 와 그 내부 callee 들이 참조하는 변수 이름 (stamp 가 바뀔 때만 다시 모은다)"""
+        seen.add(fcfg)
+        _, names, callees = self._shape(fcfg)
+        names = set(names)
+        names.update(fcfg.parameters or [])
+        names.update(rv.identifier for rv in (fcfg.return_vars or []) if hasattr(rv, "identifier"))
+        functions = self._functions()
+        for name in callees:
+            sub = functions.get(name)
+            if sub is not None and sub not in seen:
+                names |= self._read_set(sub, seen)
+        return frozenset(names)
+
+    def _shape(self, fcfg: "FunctionCFG") -> tuple:
+        """
+        (graph.version, 참조 이름, 이름으로 부르는 함수) – 함수 하나의 statement·조건식을
+        훑은 결과를 graph.version 이 바뀔 때까지 재사용한다.
+        """
+        version = fcfg.graph.version
+        hit = self._shapes.get(fcfg)
+        if hit is not None and hit[0] == version:
+            return hit
+        names: set[str] = set()
+        callees: set[str] = set()
+        for node in fcfg.graph.nodes:
+            _collect(getattr(node, "condition_expr", None), names, callees)
+            for st in getattr(node, "statements", None) or []:
+                if getattr(st, "var_name", None):
+                    names.add(st.var_name)
+                for attr in ("init_expr", "left", "right", "operand",
+                             "function_expr", "return_expr", "arguments"):
+                    _collect(getattr(st, attr, None), names, callees)
+        hit = (version, frozenset(names), frozenset(callees))
+        self._shapes[fcfg] = hit
+        return hit
+
+
+# ─────────────────────────────────────────── helpers
+_EXPR_ATTRS = ("left", "right", "base", "index", "start_index", "end_index", "expression",
+               "condition", "true_expr", "false_expr", "function")
+
+
+def _collect(expr, names: set[str], callees: set[str]) -> None:
+    """expr 안의 모든 식별자(names, block/msg/tx 멤버는 "block.timestamp" 꼴)와 이름으로 부르는 함수(callees)를 모은다."""
+    stack = [expr]
+    while stack:
+        e = stack.pop()
+        if e is None:
+            continue
+        if isinstance(e, (list, tuple)):
+            stack.extend(e); continue
+        if isinstance(e, dict):
+            stack.extend(e.values()); continue
+        if not isinstance(e, Expression):
+            continue
+        if e.identifier is not None:
+            names.add(e.identifier)
+        elif e.member is not None and isinstance(e.base, Expression) and \
+                e.base.identifier in VariableEnv._GLOBAL_BASES:
+            names.add(f"{e.base.identifier}.{e.member}")      # env 키는 "block.timestamp"
+        fn = e.function
+        if isinstance(fn, Expression) and fn.identifier is not None and fn.base is None:
+            callees.add(fn.identifier)
+        for attr in _EXPR_ATTRS:
+            sub = getattr(e, attr, None)
+            if sub is not None:
+                stack.append(sub)
+        for seq in (e.arguments, e.elements):
+            if seq:
+                stack.extend(seq)
+        for d in (e.named_arguments, e.options):
+            if d:
+                stack.extend(d.values())
+
+
+def value_key(v) -> tuple:
+    """변수 값의 구조적 key (hash 가능)"""
+    if isinstance(v, ArrayVariable):
+        return ("A", tuple(value_key(e) for e in v.elements))
+    if isinstance(v, StructVariable):
+        return ("S", tuple((k, value_key(m))
+                           for k, m in sorted(dict.items(v.members), key=lambda kv: repr(kv[0]))))
+    if isinstance(v, MappingVariable):
+        return ("M", tuple((repr(k), value_key(m))
+                           for k, m in sorted(dict.items(v.mapping), key=lambda kv: repr(kv[0]))))
+    if isinstance(v, Variables):
+        return ("V", _val_key(v.value))
+    return ("?", _val_key(v))
+
+
+def _val_key(x):
+    if isinstance(x, Interval):
+        return (type(x).__name__, x.min_value, x.max_value, getattr(x, "type_length", None))
+    if isinstance(x, Variables):
+        return value_key(x)
+    if isinstance(x, (list, tuple)):
+        return tuple(_val_key(e) for e in x)
+    try:
+        hash(x)
+        return (type(x).__name__, x)
+    except TypeError:
+        return (type(x).__name__, repr(x))
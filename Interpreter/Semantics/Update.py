@@ -1025,6 +1025,7 @@ class Update :
         """처음 보는 객체면 스냅샷 매니저에 등록."""
         if id(var_obj) not in self.an.snapman.store:
             self.an.snapman.register(var_obj, self.an.ser)
+        self.an.tx_touch(var_obj)
 
     def _bind_if_address(self, var_obj):
         """address 형이면 심볼릭-ID ↔ 변수 바인딩."""
@@ -0,0 +1,175 @@
+"""
+루프 고정점의 widening / narrowing 정책 (Engine.widening)
+
+Engine.fixpoint 가 하드코딩하던 값들을 analyzer 별로 바꿀 수 있게 모은 것.
+
+  • delay            : 한 노드를 몇 번 방문한 뒤부터 widening 할지 (delayed widening)
+                       None 이면 루프 조건식으로 반복 횟수를 추정해 [min_delay, max_delay] 로 자른다
+  • thresholds       : True 면 threshold widening – 경계가 ±∞ 로 튀는 대신
+                       함수의 정수 literal(±1)과 @StateVar/@LocalVar 주석 값의 경계 중
+                       다음 값까지만 넓힌다 (다음 widening 에서 다시 넘으면 그 다음 값, 끝은 ±∞)
+  • max_visits       : widening 단계에서 노드 하나의 최대 방문 횟수 (예전 W_MAX)
+  • narrowing_budget : narrowing 단계에서 꺼낼 수 있는 노드 수 (예전 N_MAX)
+
+기본값은 예전 동작과 같다 (threshold widening 꺼짐).
+
+    analyzer.engine.widening = WideningPolicy(thresholds=True, delay=3)
+"""
+from __future__ import annotations
+
+import bisect
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from Interpreter.Engine import Engine
+    from Utils.CFG import CFGNode, FunctionCFG
+
+from Domain.Variable import Variables, ArrayVariable, StructVariable, MappingVariable
+from Domain.Interval import IntegerInterval, UnsignedIntegerInterval
+from Domain.IR import Expression
+from Utils.Helper import VariableEnv
+
+
+class WideningPolicy:
+    MAX_VISITS = 300
+    NARROWING_BUDGET = 30
+    MIN_DELAY = 1
+    MAX_DELAY = 20
+
+    def __init__(self, *, thresholds: bool = False, delay: int | None = None,
+                 max_visits: int | None = None, narrowing_budget: int | None = None,
+                 min_delay: int | None = None, max_delay: int | None = None):
+        self.thresholds = thresholds
+        self.delay = delay
+        self.max_visits = self.MAX_VISITS if max_visits is None else max_visits
+        self.narrowing_budget = self.NARROWING_BUDGET if narrowing_budget is None else narrowing_budget
+        self.min_delay = self.MIN_DELAY if min_delay is None else min_delay
+        self.max_delay = self.MAX_DELAY if max_delay is None else max_delay
+
+    # ─────────────────────────────────────────── delayed widening
+    def delay_for(self, engine: "Engine", head: "CFGNode", start_env: dict) -> int:
+        """head 루프에서 widening 을 시작하기 전까지 허용하는 방문 횟수"""
+        if self.delay is not None:
+            return self.delay
+        est = engine._estimate_loop_iterations(head, start_env)
+        return max(self.min_delay, min(self.max_delay, est))
+
+    # ─────────────────────────────────────────── threshold widening
+    def thresholds_for(self, fcfg: "FunctionCFG", start_env: dict | None) -> list[int]:
+        """함수 literal ±1 + 주석/진입 env 의 interval 경계 (정렬, 중복 없음)"""
+        if not self.thresholds:
+            return []
+        out: set[int] = set()
+        for node in fcfg.graph.nodes:
+            _literals(getattr(node, "condition_expr", None), out)
+            for st in getattr(node, "statements", None) or []:
+                for attr in ("init_expr", "left", "right", "operand",
+                             "function_expr", "return_expr", "arguments"):
+                    _literals(getattr(st, attr, None), out)
+        out |= {c + d for c in list(out) for d in (-1, 1)}
+        for env in (fcfg.related_variables, start_env):
+            for v in dict.values(env or {}):
+                _bounds(v, out)
+        return sorted(out)
+
+    def widen(self, old: dict | None, new: dict | None, thresholds: list[int]) -> dict:
+        """join_variables_with_widening + (thresholds 가 있으면) 튄 경계를 다음 threshold 로"""
+        widened = VariableEnv.join_variables_with_widening(old, new)
+        if not thresholds or not widened:
+            return widened
+        joined = VariableEnv.join_variables_simple(old, new)
+        for name, w in dict.items(widened):
+            j = dict.get(joined, name)
+            if j is not None and w is not j:
+                _clamp(w, j, thresholds)
+        return widened
+
+
+# ─────────────────────────────────────────── helpers
+_EXPR_ATTRS = ("left", "right", "base", "index", "start_index", "end_index", "expression",
+               "condition", "true_expr", "false_expr", "function")
+
+
+def _literals(expr, out: set[int]) -> None:
+    """expr 안의 정수 literal 을 out 에 모은다."""
+    stack = [expr]
+    while stack:
+        e = stack.pop()
+        if e is None:
+            continue
+        if isinstance(e, (list, tuple)):
+            stack.extend(e); continue
+        if not isinstance(e, Expression):
+            continue
+        if isinstance(e.literal, str):
+            try:
+                out.add(int(e.literal, 0))
+            except ValueError:
+                pass
+        for attr in _EXPR_ATTRS:
+            sub = getattr(e, attr, None)
+            if sub is not None:
+                stack.append(sub)
+        for seq in (e.arguments, e.elements):
+            if seq:
+                stack.extend(seq)
+
+
+def _is_int_interval(x) -> bool:
+    return isinstance(x, (IntegerInterval, UnsignedIntegerInterval))
+
+
+def _bounds(v, out: set[int]) -> None:
+    """변수(중첩 포함) 의 유한한 interval 경계를 out 에 모은다 (공유 변수는 복사하지 않고 읽기)"""
+    stack = [v]
+    while stack:
+        x = stack.pop()
+        if isinstance(x, ArrayVariable):
+            stack.extend(x.elements)
+        elif isinstance(x, StructVariable):
+            stack.extend(dict.values(x.members))
+        elif isinstance(x, MappingVariable):
+            stack.extend(dict.values(x.mapping))
+        elif isinstance(x, Variables):
+            iv = x.value
+            if _is_int_interval(iv) and not iv.is_bottom():
+                for b in (iv.min_value, iv.max_value):
+                    if isinstance(b, int):
+                        out.add(b)
+
+
+def _clamp(w, j, thresholds: list[int]) -> None:
+    """
+    widening 결과 w 에서 join 결과 j 보다 넓어진 경계를 가장 가까운 threshold 로 되돌린다.
+    w 는 이번 merge 에서 새로 만든 객체라 제자리에서 고친다.
+    """
+    if isinstance(w, ArrayVariable) and isinstance(j, ArrayVariable):
+        if len(w.elements) == len(j.elements):
+            for a, b in zip(w.elements, j.elements):
+                if a is not b:
+                    _clamp(a, b, thresholds)
+    elif isinstance(w, StructVariable) and isinstance(j, StructVariable):
+        for k, a in dict.items(w.members):
+            b = dict.get(j.members, k)
+            if b is not None and a is not b:
+                _clamp(a, b, thresholds)
+    elif isinstance(w, MappingVariable) and isinstance(j, MappingVariable):
+        for k, a in dict.items(w.mapping):
+            b = dict.get(j.mapping, k)
+            if b is not None and a is not b:
+                _clamp(a, b, thresholds)
+    elif isinstance(w, Variables) and isinstance(j, Variables):
+        wv, jv = w.value, j.value
+        if not (_is_int_interval(wv) and type(wv) is type(jv)) or wv.is_bottom() or jv.is_bottom():
+            return
+        lo, hi = wv.min_value, wv.max_value
+        if hi > jv.max_value:
+            i = bisect.bisect_left(thresholds, jv.max_value)
+            if i < len(thresholds) and thresholds[i] < hi:
+                hi = thresholds[i]
+        if lo < jv.min_value:
+            i = bisect.bisect_right(thresholds, jv.min_value) - 1
+            if i >= 0 and thresholds[i] > lo:
+                lo = thresholds[i]
+        if (lo, hi) != (wv.min_value, wv.max_value):
+            w.value = type(wv)(lo, hi, wv.type_length)
@@ -1,9 +1,11 @@
 # SolidityGuardian/Utils/CFG.py
-import networkx as nx
 from Domain.IR import *
 from Domain.Variable import *
+from Utils.LineStore import SrcLine
 
 class CFGNode:
+    src_line = SrcLine()   # 라인 핸들로 저장 – 라인 삽입/삭제를 자동으로 따라감
+
     def __init__(self, name,
                  # ───── condition / branch role flags ─────────────────────────
                  condition_node: bool = False,
@@ -155,7 +157,8 @@ class CFGNode:
 
 class CFG:
     def __init__(self, cfg_type):
-        self.graph = nx.DiGraph()
+        from Utils.WTO import VersionedDiGraph   # 첫 CFG 생성 시점에 networkx 로드 (cold start 단축)
+        self.graph = VersionedDiGraph()
         self.cfg_type = cfg_type
         self.entry_node = CFGNode("ENTRY")
         self.exit_node = CFGNode("EXIT")
@@ -299,7 +302,30 @@ class FunctionCFG(CFG):
         self.graph.add_node(self.return_exit)
         self.graph.add_node(self.error_exit)
 
+        self._wto = None   # weak topological order 캐시 (graph.version 이 바뀌면 재계산)
+        self._loops = None  # dominator tree / loop-nesting forest 캐시 (〃)
+
     # ── helpers ----------------------------------------------------------
+    def weak_topological_order(self):
+        """Bourdoncle WTO – 그래프가 바뀌지 않았으면 캐시를 그대로 쓴다"""
+        from Utils.WTO import WTO
+        version = getattr(self.graph, "version", None)
+        wto = getattr(self, "_wto", None)
+        if wto is None or version is None or wto.version != version:
+            wto = WTO(self.graph, self.entry_node, version or 0)
+            self._wto = wto
+        return wto
+
+    def loop_forest(self):
+        """dominator tree + loop-nesting forest – 그래프가 바뀌지 않았으면 캐시를 그대로 쓴다"""
+        from Utils.LoopForest import LoopForest
+        version = getattr(self.graph, "version", None)
+        forest = getattr(self, "_loops", None)
+        if forest is None or version is None or forest.version != version:
+            forest = LoopForest(self.graph, self.entry_node, version or 0)
+            self._loops = forest
+        return forest
+
     def get_return_exit_node(self) -> CFGNode:
         return self.return_exit
 
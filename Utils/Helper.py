@@ -1,10 +1,16 @@
 import copy
-from typing import Dict, Any
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, NamedTuple
 
 from antlr4 import *
-from Parser.SolidityLexer  import SolidityLexer
-from Parser.SolidityParser import SolidityParser
 from antlr4.error.ErrorListener import ErrorListener, ConsoleErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.dfa.DFA import DFA
+from antlr4.ListTokenSource import ListTokenSource
 
 from Domain.Variable import (Variables, ArrayVariable,
                              StructVariable, MappingVariable, EnumVariable)
@@ -12,6 +18,120 @@ from Domain.Interval import *   # ← 딱 이 정도만 있으면 됨
 from Domain.AddressSet import AddressSet
 from Domain.Type import SolType
 from Domain.IR import Expression
+from Utils import PersistentEnv as _penv
+from Utils.PersistentEnv import PersistentEnv
+
+class _InlineErr(ErrorListener):
+    """verbose 파싱용 한 줄짜리 ErrorListener (매 호출마다 클래스를 만들지 않도록 모듈 수준 1개)"""
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        print(f"[ANTLR] {line}:{column} {msg}")
+
+
+class SyntaxIssue(NamedTuple):
+    """ANTLR 구문 오류 1건 (line 은 fragment 기준 1-based, [column, end_column) 구간)"""
+    line: int
+    column: int
+    end_column: int
+    msg: str
+
+
+class _CollectErr(ErrorListener):
+    """오류를 출력하지 않고 SyntaxIssue 로 모아 두는 ErrorListener"""
+    def __init__(self):
+        self.errors: list[SyntaxIssue] = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        text = getattr(offendingSymbol, "text", None)
+        width = len(text) if text and text != "<EOF>" else 1
+        self.errors.append(SyntaxIssue(line, column, column + width, msg))
+
+
+def _solidity_recognizers():
+    """
+    생성된 SolidityLexer / SolidityParser(13k 라인) 를 첫 사용 시점에 import.
+    Utils.Helper / ContractAnalyzer import 만으로는 파서를 로드하지 않는다.
+    """
+    from Parser.SolidityLexer import SolidityLexer
+    from Parser.SolidityParser import SolidityParser
+    return SolidityLexer, SolidityParser
+
+
+class ParserPool:
+    """
+    SolidityLexer / CommonTokenStream / SolidityParser 인스턴스를 재사용하는 풀.
+      • acquire(src) : 대기 중인 인스턴스를 꺼내 setInputStream/reset 후 반환
+      • release(...) : 풀로 반납 (DFA 가 너무 커졌으면 여기서 초기화)
+    ATN·DFA·PredictionContextCache 는 생성된 클래스의 클래스 속성이라
+    모든 인스턴스가 공유하며, 호출 사이에 그대로 따뜻하게 유지된다.
+    풀 자체는 잠그지 않는다 – ParserHelpers 가 _LOCK 을 잡은 채로만 쓴다.
+    """
+    DFA_STATE_LIMIT = 50_000   # 파서 DFA 상태 수가 이를 넘으면 release 시 초기화 (0 = 무제한)
+
+    def __init__(self, max_idle: int = 4):
+        self.max_idle = max_idle
+        self._idle: list[tuple[Lexer, CommonTokenStream, Parser]] = []
+        self._lexer_of: dict[int, Lexer] = {}   # id(token stream) → 원래 렉서 (ListTokenSource 로 바꿔 끼운 경우 복원용)
+        self.stats = {"created": 0, "reused": 0, "dfa_resets": 0}
+
+    def _checkout(self, stream: InputStream):
+        if self._idle:
+            lexer, tokens, parser = self._idle.pop()
+            lexer.inputStream = stream          # Lexer.reset() 포함
+            tokens.setTokenSource(lexer)        # 버퍼 비움
+            parser.setTokenStream(tokens)       # Parser.reset() 포함
+            self.stats["reused"] += 1
+        else:
+            SolidityLexer, SolidityParser = _solidity_recognizers()
+            lexer = SolidityLexer(stream)
+            tokens = CommonTokenStream(lexer)
+            parser = SolidityParser(tokens)
+            self._lexer_of[id(tokens)] = lexer
+            self.stats["created"] += 1
+
+        # 이전 호출(SLL 단계 등)이 바꿔 둔 설정 복원
+        parser._errHandler = DefaultErrorStrategy()
+        parser._interp.predictionMode = PredictionMode.LL
+        return tokens, parser
+
+    def acquire(self, src: str) -> tuple[CommonTokenStream, Parser]:
+        return self._checkout(InputStream(src))
+
+    def acquire_tokens(self, token_list: list) -> tuple[CommonTokenStream, Parser]:
+        """이미 렉싱된 토큰(LineTokenStore 등)으로 파서를 준비한다 – 렉서는 돌지 않음."""
+        tokens, parser = self._checkout(InputStream(""))
+        tokens.setTokenSource(ListTokenSource(token_list))
+        parser.setTokenStream(tokens)
+        return tokens, parser
+
+    def release(self, tokens: CommonTokenStream, parser: Parser) -> None:
+        if self.DFA_STATE_LIMIT and ParserPool.dfa_size() > self.DFA_STATE_LIMIT:
+            self.reset_dfa()
+        lexer = self._lexer_of.get(id(tokens))
+        if len(self._idle) < self.max_idle and lexer is not None:
+            self._idle.append((lexer, tokens, parser))
+        else:
+            self._lexer_of.pop(id(tokens), None)
+
+    # ── 공유 DFA 관리 ───────────────────────────────────────────────
+    @staticmethod
+    def dfa_size() -> int:
+        """파서 공유 DFA 의 총 상태 수"""
+        _, SolidityParser = _solidity_recognizers()
+        return sum(len(d._states) for d in SolidityParser.decisionsToDFA)
+
+    def reset_dfa(self) -> None:
+        """
+        렉서·파서의 공유 DFA 와 PredictionContextCache 를 비운다.
+        시뮬레이터들이 같은 list 객체를 참조하므로 항목만 제자리 교체한다.
+        """
+        SolidityLexer, SolidityParser = _solidity_recognizers()
+        for recog in (SolidityParser, SolidityLexer):
+            dfas = recog.decisionsToDFA
+            for i, ds in enumerate(recog.atn.decisionToState):
+                dfas[i] = DFA(ds, i)
+        SolidityParser.sharedContextCache.cache.clear()
+        self.stats["dfa_resets"] += 1
+
 
 class ParserHelpers:
     # --------------------------- 컨텍스트 → 파싱 규칙 매핑
@@ -46,37 +166,237 @@ class ParserHelpers:
     def map_context_type(ctx_type: str) -> str|None:
         return ParserHelpers._CTX_MAP.get(ctx_type)
 
+    # --------------------------- 파싱 결과 LRU 캐시
+    #   key = (fragment 원문, 파싱 규칙, 토큰 입력 여부)  →  (parse tree, 최초 파싱 소요시간)
+    #   같은 fragment 가 다시 들어오면(디버그 주석 재-flush 등) ANTLR 를 건너뛴다.
+    _PARSE_CACHE: "OrderedDict[tuple[str, str, bool], tuple[Any, float]]" = OrderedDict()
+    _PARSE_CACHE_SIZE: int = 512
+    _parse_stats: dict[str, float] = {"hits": 0, "misses": 0, "saved_s": 0.0, "parse_s": 0.0,
+                                      "sll_ok": 0, "ll_fallback": 0}
+
+    # --------------------------- 예측 모드
+    #   "ll"  : 기본 ALL(*) LL 예측 (기존 동작)
+    #   "sll" : SLL + BailErrorStrategy 로 먼저 시도, 실패 시에만 LL 로 재파싱
+    PARSE_MODES = ("ll", "sll")
+    _PREDICTION_MODE: str = "ll"
+
+    @staticmethod
+    def set_prediction_mode(mode: str) -> None:
+        if mode not in ParserHelpers.PARSE_MODES:
+            raise ValueError(f"unknown parse mode '{mode}' (expected one of {ParserHelpers.PARSE_MODES})")
+        ParserHelpers._PREDICTION_MODE = mode
+
+    @staticmethod
+    def get_prediction_mode() -> str:
+        return ParserHelpers._PREDICTION_MODE
+
+    # --------------------------- lexer/parser 풀 (generate_parse_tree 의 최내곽 루프)
+    _POOL = ParserPool()
+    _INLINE_ERR = _InlineErr()
+    # 풀 · 공유 DFA(파싱 중에도 자란다) · 파스 캐시 · 통계는 프로세스 전역이라
+    # 백그라운드 prewarm(Utils.Startup) 과 요청 처리가 겹쳐도 한 번에 한 파싱만 돈다
+    _LOCK = threading.RLock()
+
+    @staticmethod
+    def parser_pool() -> ParserPool:
+        return ParserHelpers._POOL
+
+    @staticmethod
+    def _cache_key(src: str, rule: str, from_tokens: bool = False) -> tuple[str, str, bool]:
+        # 원문 그대로 – 트리에 붙은 syntax_errors 의 라인/컬럼이 첫 파싱 기준이므로
+        # 앞 개행만 다른 fragment 가 같은 트리를 받으면 오류 위치가 어긋난다.
+        # 토큰 입력 트리는 렉서 오류를 따로 보관(lexed_from_store)하므로 키를 나눈다.
+        return src, rule, from_tokens
+
+    @staticmethod
+    def set_parse_cache_size(size: int) -> None:
+        """캐시 용량 변경 (0 이면 캐시 비활성화)."""
+        with ParserHelpers._LOCK:
+            ParserHelpers._PARSE_CACHE_SIZE = max(0, int(size))
+            while len(ParserHelpers._PARSE_CACHE) > ParserHelpers._PARSE_CACHE_SIZE:
+                ParserHelpers._PARSE_CACHE.popitem(last=False)
+
+    @staticmethod
+    def clear_parse_cache(reset_stats: bool = True) -> None:
+        with ParserHelpers._LOCK:
+            ParserHelpers._PARSE_CACHE.clear()
+            if reset_stats:
+                ParserHelpers._parse_stats.update(hits=0, misses=0, saved_s=0.0, parse_s=0.0,
+                                                  sll_ok=0, ll_fallback=0)
+
+    @staticmethod
+    def parse_cache_stats() -> dict[str, float]:
+        """
+        hits / misses / hit_rate / size 와 함께
+        parse_s(실제 ANTLR 파싱 시간), saved_s(hit 로 절약한 추정 시간),
+        sll_ok / ll_fallback(SLL 모드에서 1단계 성공 / LL 재파싱 횟수)를 반환.
+        """
+        with ParserHelpers._LOCK:
+            st = dict(ParserHelpers._parse_stats)
+            st["size"] = len(ParserHelpers._PARSE_CACHE)
+        total = st["hits"] + st["misses"]
+        st["hit_rate"] = (st["hits"] / total) if total else 0.0
+        return st
+
     # --------------------------- 파싱
     @staticmethod
-    def generate_parse_tree(src: str, ctx_type: str, verbose=False):
-        input_stream  = InputStream(src)
-        lexer         = SolidityLexer(input_stream)
-        token_stream  = CommonTokenStream(lexer)
-        parser        = SolidityParser(token_stream)
+    def generate_parse_tree(src: str, ctx_type: str, verbose=False, use_cache: bool = True,
+                            mode: str | None = None, tokens: list | None = None):
+        """
+        fragment 를 ctx_type 에 맞는 규칙으로 파싱한다.
+        동일 (fragment, 규칙) 은 LRU 캐시에서 같은 트리를 돌려준다.
+        (캐시 hit 시에는 ANTLR 오류 메시지가 다시 출력되지 않는다)
+        mode 를 주지 않으면 set_prediction_mode() 로 지정한 전역 모드를 쓴다.
+        tokens 를 주면(ContractAnalyzer.edit_tokens()) 렉싱을 건너뛰고 그 토큰으로 파싱한다.
+        """
+        rule = ParserHelpers.map_context_type(ctx_type) or 'interactiveSourceUnit'
+        with ParserHelpers._LOCK:
+            cache = ParserHelpers._PARSE_CACHE
+            stats = ParserHelpers._parse_stats
+            use_cache = use_cache and ParserHelpers._PARSE_CACHE_SIZE > 0
+
+            if use_cache:
+                key = ParserHelpers._cache_key(src, rule, tokens is not None)
+                hit = cache.get(key)
+                if hit is not None:
+                    cache.move_to_end(key)
+                    stats["hits"] += 1
+                    stats["saved_s"] += hit[1]
+                    return hit[0]
+
+            t0 = time.perf_counter()
+            tree = ParserHelpers._parse(src, rule, verbose, mode or ParserHelpers._PREDICTION_MODE, tokens)
+            elapsed = time.perf_counter() - t0
+            stats["misses"] += 1
+            stats["parse_s"] += elapsed
+
+            if use_cache:
+                cache[key] = (tree, elapsed)
+                if len(cache) > ParserHelpers._PARSE_CACHE_SIZE:
+                    cache.popitem(last=False)
+            return tree
 
-        # ── ① 에러 리스너 부착 ───────────────────────────────
-        if verbose:
-            # 기본 ConsoleErrorListener 제거
+    @staticmethod
+    def _parse(src: str, rule: str, verbose=False, mode: str = "ll", tokens: list | None = None):
+        """
+        파싱 후 루트에 syntax_errors(list[SyntaxIssue]) 를 붙여 반환한다.
+        (캐시에도 트리와 함께 남으므로 hit 시에도 같은 오류 정보를 얻는다)
+        """
+        with ParserHelpers._LOCK:
+            pool = ParserHelpers._POOL
+            collector = _CollectErr()
+            if tokens is not None:
+                token_stream, parser = pool.acquire_tokens(tokens)
+                lexer = None                        # 렉싱은 LineTokenStore 에서 이미 끝남
+            else:
+                token_stream, parser = pool.acquire(src)
+                lexer = token_stream.tokenSource
+                lexer.addErrorListener(collector)
+            try:
+                tree = ParserHelpers._parse_with(parser, rule, verbose, mode, collector)
+                tree.syntax_errors = collector.errors
+                tree.lexed_from_store = lexer is None   # 렉서 오류는 LineTokenStore 쪽에 있음
+                return tree
+            finally:
+                if lexer is not None:
+                    lexer.removeErrorListener(collector)
+                pool.release(token_stream, parser)
+
+    @staticmethod
+    def syntax_errors(tree) -> list[SyntaxIssue]:
+        """generate_parse_tree 결과의 구문 오류 목록 (없으면 빈 list)."""
+        return getattr(tree, "syntax_errors", None) or []
+
+    @staticmethod
+    def _parse_with(parser, rule: str, verbose=False, mode: str = "ll", collector=None):
+        # ── ⓪ SLL 1단계: 오류 출력 없이 bail-out, 성공하면 그대로 사용
+        if mode == "sll":
             parser.removeErrorListeners()
+            parser._interp.predictionMode = PredictionMode.SLL
+            parser._errHandler = BailErrorStrategy()
+            try:
+                tree = ParserHelpers._invoke_rule(parser, rule)
+                ParserHelpers._parse_stats["sll_ok"] += 1
+                return tree
+            except ParseCancellationException:
+                ParserHelpers._parse_stats["ll_fallback"] += 1
+                # 2단계: 같은 토큰 스트림을 되감고 full LL + 기본 오류 복구로 재파싱
+                parser._errHandler = DefaultErrorStrategy()
+                parser._interp.predictionMode = PredictionMode.LL
+                parser.reset()
 
-            # ▶ 한 줄짜리 익명 ErrorListener
-            parser.addErrorListener(
-                type(
-                    "InlineErr", (ErrorListener,), {
-                        "syntaxError": lambda self, recognizer, offendingSymbol,
-                                              line, column, msg, e:
-                        print(f"[ANTLR] {line}:{column} {msg}")
-                    }
-                )()
-            )
+        # ── ① 에러 리스너 부착 ───────────────────────────────
+        parser.removeErrorListeners()
+        if verbose:
+            parser.addErrorListener(ParserHelpers._INLINE_ERR)
         else:
-            # 최소한 기본 오류 출력은 유지하고 싶다면
-            parser.removeErrorListeners()
+            # 최소한 기본 오류 출력은 유지
             parser.addErrorListener(ConsoleErrorListener.INSTANCE)
+        if collector is not None:
+            parser.addErrorListener(collector)
 
-        rule = ParserHelpers.map_context_type(ctx_type)
+        return ParserHelpers._invoke_rule(parser, rule)
 
+    @staticmethod
+    def lex(src: str, errors: list | None = None) -> list:
+        """
+        src 를 렉싱한 토큰 목록 (EOF 제외, hidden 채널 포함).
+        렉서 오류는 출력하지 않고 errors 가 주어지면 SyntaxIssue 로 담는다.
+        """
+        with ParserHelpers._LOCK:
+            pool = ParserHelpers._POOL
+            token_stream, parser = pool.acquire(src)
+            lexer = token_stream.tokenSource
+            collector = _CollectErr()
+            lexer.removeErrorListeners()
+            lexer.addErrorListener(collector)
+            try:
+                token_stream.fill()
+                if errors is not None:
+                    errors.extend(collector.errors)
+                return token_stream.tokens[:-1]
+            finally:
+                lexer.removeErrorListeners()
+                lexer.addErrorListener(ConsoleErrorListener.INSTANCE)
+                pool.release(token_stream, parser)
+
+    @staticmethod
+    def check_syntax(src: str, rule: str = "sourceUnit") -> list[SyntaxIssue]:
+        """
+        src 를 rule 로 파싱해 구문 오류 목록 [SyntaxIssue] 을 반환 (빈 list = 유효).
+        solc 없이 프로세스 내에서 검사하며 파스 트리 캐시·통계는 건드리지 않는다.
+        SLL + bail 로 먼저 시도하고, 실패한 경우에만 LL 로 재파싱해 오류를 모은다.
+        """
+        with ParserHelpers._LOCK:
+            pool = ParserHelpers._POOL
+            token_stream, parser = pool.acquire(src)
+            lexer = token_stream.tokenSource
+            collector = _CollectErr()
+            lexer.removeErrorListeners()
+            lexer.addErrorListener(collector)
+            try:
+                parser.removeErrorListeners()
+                parser._interp.predictionMode = PredictionMode.SLL
+                parser._errHandler = BailErrorStrategy()
+                try:
+                    ParserHelpers._invoke_rule(parser, rule)
+                    return collector.errors
+                except ParseCancellationException:
+                    parser._errHandler = DefaultErrorStrategy()
+                    parser._interp.predictionMode = PredictionMode.LL
+                    parser.reset()
+                parser.addErrorListener(collector)
+                ParserHelpers._invoke_rule(parser, rule)
+                return collector.errors
+            finally:
+                lexer.removeErrorListeners()
+                lexer.addErrorListener(ConsoleErrorListener.INSTANCE)
+                pool.release(token_stream, parser)
+
+    @staticmethod
+    def _invoke_rule(parser, rule: str):
         match rule:
+            case 'sourceUnit':                return parser.sourceUnit()
             case 'interactiveStructUnit':     return parser.interactiveStructUnit()
             case 'interactiveEnumUnit':       return parser.interactiveEnumUnit()
             case 'interactiveBlockUnit':      return parser.interactiveBlockUnit()
@@ -90,9 +410,14 @@ class VariableEnv:
     """
     변수 환경(dict[str, Variables])을 deep-copy / 비교 / merge 하는 공통 유틸.
     * Engine, Semantics 모두 같은 로직을 필요로 하므로 여기로 끌어올렸다.
+    * PERSISTENT 이면 copy_variables 는 PersistentEnv(copy-on-write) 를 돌려준다.
     """
     _GLOBAL_BASES = {"block", "msg", "tx"}
 
+    # False 면 예전처럼 매번 전체 deep-copy (비교·디버깅용)
+    PERSISTENT = True
+    copy_stats = _penv.stats     # {"copied": 복사된 변수 객체 수, "forks": COW fork 수}
+
     # public façade --------------------------------------------------------
     join_variables_simple     = staticmethod(lambda l, r:
         VariableEnv._merge_by_mode(l, r, "join"))
@@ -107,6 +432,10 @@ class VariableEnv:
         """
         단일 변수를 deep-copy (Array / Struct / Mapping 서브-클래스 유지)
         """
+        if VariableEnv.PERSISTENT:
+            return _penv.copy_variable(v)
+
+        VariableEnv.copy_stats["copied"] += 1
         if isinstance(v, ArrayVariable):
             new_arr = ArrayVariable(
                 identifier=v.identifier,
@@ -149,7 +478,11 @@ class VariableEnv:
         """
         deep-copy 하되 Array / Struct / Mapping 의 서브-클래스를 유지한다.
         (원래 Engine.copy_variables 와 동일 로직)
+        PERSISTENT 이면 변수 객체는 공유하고 처음 꺼낼 때 복사한다.
         """
+        if VariableEnv.PERSISTENT:
+            return PersistentEnv.fork_of(src)
+
         dst: Dict[str, "Variables"] = {}
 
         for name, v in src.items():
@@ -192,62 +525,87 @@ class VariableEnv:
                         b: Dict[str, "Variables"] | None) -> bool:
         """
         Engine.variables_equal 와 동일.  (간단화 버전)
+
+        PersistentEnv fork 이후 쓰지 않은 변수·멤버·요소·값은 양쪽이 같은 객체를
+        그대로 공유하므로, 객체 동일성(is)을 먼저 보고 달라진 항목만 내려가 비교한다.
         """
+        if a is b:
+            return True
         if a is None or b is None:
-            return a is b
+            return False
         if a.keys() != b.keys():
             return False
 
         for k in a:
-            v1, v2 = a[k], b[k]
-            if type(v1) is not type(v2):
+            # dict.__getitem__ : PersistentEnv 의 공유 변수를 복사하지 않고 읽기
+            if not VariableEnv._var_equal(dict.__getitem__(a, k), dict.__getitem__(b, k)):
                 return False
-
-            # ArrayVariable 특수 처리 - elements는 리스트
-            if isinstance(v1, ArrayVariable):
-                if not VariableEnv._compare_array_elements(v1.elements, v2.elements):
-                    return False
-                continue
-
-            # leaf – 값 비교
-            if hasattr(v1, "value"):
-                if hasattr(v1.value, "equals"):
-                    if type(v1.value) != type(v2.value):
-                        return False
-                    if not v1.value.equals(v2.value):
-                        return False
-                elif v1.value != v2.value:
-                    return False
-            else:
-                # 복합 타입 – 재귀 (StructVariable, MappingVariable 등)
-                attr1 = getattr(v1, "members", getattr(v1, "mapping", {}))
-                attr2 = getattr(v2, "members", getattr(v2, "mapping", {}))
-                if not VariableEnv.variables_equal(attr1, attr2):
-                    return False
         return True
 
+    @staticmethod
+    def _var_equal(v1, v2) -> bool:
+        if v1 is v2:
+            return True             # fork 이후 손대지 않은 항목
+        if type(v1) is not type(v2):
+            return False
+
+        # ArrayVariable 특수 처리 - elements는 리스트
+        if isinstance(v1, ArrayVariable):
+            return VariableEnv._compare_array_elements(v1.elements, v2.elements)
+
+        # leaf – 값 비교 (Struct / Mapping 도 value(None) 를 물려받으므로 제외)
+        if hasattr(v1, "value") and not isinstance(v1, (StructVariable, MappingVariable)):
+            return VariableEnv._value_equal(v1.value, v2.value)
+
+        # 복합 타입 – 재귀 (StructVariable, MappingVariable 등)
+        attr1 = getattr(v1, "members", getattr(v1, "mapping", {}))
+        attr2 = getattr(v2, "members", getattr(v2, "mapping", {}))
+        return VariableEnv.variables_equal(attr1, attr2)
+
+    @staticmethod
+    def changed_keys(old: Dict[str, "Variables"] | None,
+                     new: Dict[str, "Variables"] | None,
+                     keys=None) -> set[str]:
+        """
+        old → new 에서 값이 달라진(추가·삭제 포함) 변수 이름 집합.
+        keys 를 주면 그 이름들만 본다.
+        """
+        old = old or {}
+        new = new or {}
+        if keys is None:
+            keys = old.keys() | new.keys()
+        out = set()
+        for k in keys:
+            in_old, in_new = k in old, k in new
+            if in_old != in_new:
+                out.add(k)
+            elif in_old and not VariableEnv._var_equal(dict.__getitem__(old, k),
+                                                       dict.__getitem__(new, k)):
+                out.add(k)
+        return out
+
     @staticmethod
     def _compare_array_elements(els1: list, els2: list) -> bool:
         """ArrayVariable의 elements 리스트 비교"""
+        if els1 is els2:
+            return True
         if len(els1) != len(els2):
             return False
-        for e1, e2 in zip(els1, els2):
-            if type(e1) is not type(e2):
-                return False
-            # 재귀적으로 ArrayVariable 처리
-            if isinstance(e1, ArrayVariable):
-                if not VariableEnv._compare_array_elements(e1.elements, e2.elements):
-                    return False
-            # 값 비교
-            elif hasattr(e1, "value"):
-                if hasattr(e1.value, "equals"):
-                    if type(e1.value) != type(e2.value):
-                        return False
-                    if not e1.value.equals(e2.value):
-                        return False
-                elif e1.value != e2.value:
-                    return False
-        return True
+        return all(VariableEnv._var_equal(e1, e2) for e1, e2 in zip(els1, els2))
+
+    @staticmethod
+    def _value_equal(a, b) -> bool:
+        """leaf 값 비교 (Interval / AddressSet / 그 밖의 값)"""
+        if a is b:
+            return True
+        if type(a) is not type(b):
+            return False
+        if isinstance(a, AddressSet):
+            # AddressSet.equals 는 추상 비교(BoolInterval) – 집합 자체를 비교
+            return a.is_top == b.is_top and a.ids == b.ids
+        if hasattr(a, "equals"):
+            return bool(a.equals(b))
+        return a == b
 
     @staticmethod
     def env_equal(a: dict[str, Variables] | None,
@@ -277,10 +635,12 @@ class VariableEnv:
         # ③ leaf Variables / EnumVariable
         if isinstance(v1, (Variables, EnumVariable)) and \
            not isinstance(v1, (ArrayVariable, StructVariable, MappingVariable)):
-            new = copy.copy(v1)
+            new = VariableEnv._shallow(v1) if VariableEnv.PERSISTENT else copy.copy(v1)
             # ★ v1.value가 Variables인 경우 방어 처리 (잘못된 초기화 감지)
             if isinstance(v1.value, Variables):
                 new.value = v1.value  # 그대로 유지
+            elif v1.value is v2.value and hasattr(v1.value, "equals"):
+                new.value = v1.value  # 같은 interval 객체 – x ⊔ x = x
             else:
                 new.value = VariableEnv._merge_values(v1.value, v2.value, mode)
             return new
@@ -302,6 +662,10 @@ class VariableEnv:
 
         # ⑤ Struct
         if isinstance(v1, StructVariable):
+            if VariableEnv.PERSISTENT:
+                new_st = VariableEnv._shallow(v1)
+                new_st.members = VariableEnv._merge_entries(v1.members, v2.members, mode)
+                return new_st
             new_st = copy.copy(v1)
             new_st.members = {}
             for m in v1.members.keys() | v2.members.keys():
@@ -313,6 +677,10 @@ class VariableEnv:
 
         # ⑥ Mapping
         if isinstance(v1, MappingVariable):
+            if VariableEnv.PERSISTENT:
+                new_map = VariableEnv._shallow(v1)
+                new_map.mapping = VariableEnv._merge_entries(v1.mapping, v2.mapping, mode)
+                return new_map
             new_map = copy.copy(v1)
             new_map.mapping = {}
             for k in v1.mapping.keys() | v2.mapping.keys():
@@ -324,19 +692,58 @@ class VariableEnv:
 
         return f"symbolic{mode.capitalize()}({v1},{v2})"
 
+    @staticmethod
+    def _shallow(v):
+        """copy.copy 하되 공유 표시는 떼어 낸다 (새 객체는 아직 아무도 공유하지 않음)"""
+        new = copy.copy(v)
+        new.__dict__.pop(_penv._SHARED_FLAG, None)
+        return new
+
+    @staticmethod
+    def _merge_entries(left: dict, right: dict, mode: str) -> "PersistentEnv":
+        """
+        Struct.members / Mapping.mapping 용 delta merge.
+        양쪽이 같은 객체인 항목은 merge 하지 않고 공유하며,
+        한쪽에만 있는 항목도 (기존 copy.copy 대신) 공유 표시 후 그대로 넣는다.
+        """
+        out = PersistentEnv()
+        for k, a in dict.items(left):
+            b = dict.get(right, k)
+            if b is None or a is b:
+                _penv.mark_shared(a)
+                dict.__setitem__(out, k, a)
+            else:
+                dict.__setitem__(out, k, VariableEnv._merge_values(a, b, mode))
+        for k, b in dict.items(right):
+            if k not in out:
+                _penv.mark_shared(b)
+                dict.__setitem__(out, k, b)
+        return out
+
     @staticmethod
     def _merge_by_mode(left, right, mode: str):
+        """
+        res = left 의 fork 위에 right 를 merge.
+        PERSISTENT 이면 양쪽이 같은 변수 객체를 공유하는 항목(= 어느 쪽도 fork 이후
+        쓰지 않은 변수)은 건너뛰고, 실제로 갈라진 변수만 merge 한다.
+        """
         if left is None:
             return VariableEnv.copy_variables(right or {})
         if not right:
             return VariableEnv.copy_variables(left)
 
         res = VariableEnv.copy_variables(left)
-        for name, r_var in (right or {}).items():
+        for name, r_var in dict.items(right):
             if name in res:
-                res[name] = VariableEnv._merge_values(res[name], r_var, mode)
+                l_var = dict.__getitem__(res, name)
+                if l_var is r_var:
+                    continue                    # 변하지 않은 변수 – 공유 유지
+                res[name] = VariableEnv._merge_values(l_var, r_var, mode)
+            elif VariableEnv.PERSISTENT:
+                _penv.mark_shared(r_var)
+                dict.__setitem__(res, name, r_var)
             else:
-                res[name] = VariableEnv.copy_variables({name: r_var})[name]
+                res[name] = VariableEnv.copy_single_variable(r_var)
         return res
 
     @staticmethod
@@ -348,7 +755,7 @@ class VariableEnv:
 
         def _flat(env: dict[str, Variables]) -> dict[str, str]:
             out = {}
-            for k, v in env.items():
+            for k, v in dict.items(env):
                 # 방어 코드: v가 Variables 객체가 아니면 건너뛰기
                 if not hasattr(v, 'identifier'):
                     continue
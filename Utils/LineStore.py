@@ -0,0 +1,422 @@
+"""
+라인 저장소 (ContractAnalyzer.full_code_lines / line_info / ledger 공용)
+
+라인 순서의 implicit treap 에 라인 핸들(LineHandle)을 두고, 라인 번호는
+트리 위치로만 계산한다.
+  • insert_lines / delete_lines 는 O(log n) – 뒤쪽 라인의 키를 옮기지 않는다
+  • 라인별 부가 데이터(line_info, ledger, 토큰 …)는 핸들에 붙는 column 으로
+    저장되어 라인과 함께 이동한다
+  • text() 는 편집 리비전별로 캐시되고, text(start, end) / range_items() 로
+    필요한 라인 구간만 O(log n + k) 에 꺼낼 수 있다
+  • CFGNode.src_line / Statement.src_line 은 SrcLine 디스크립터로 핸들을 잡아 두고,
+    읽을 때 현재 라인 번호로 해석한다 (편집마다 다시 쓰지 않음)
+
+dict 와 같은 의미를 유지하기 위해 텍스트가 없는 위치(hole)는 키로 보이지 않는다.
+삭제된 라인의 핸들은 삭제 시점의 번호로 고정된다.
+"""
+from __future__ import annotations
+
+import random
+from collections.abc import MutableMapping
+from typing import Callable, Iterator
+
+_MISSING = object()
+
+
+class LineHandle:
+    __slots__ = ("left", "right", "parent", "prio", "size", "text", "cols",
+                 "_store", "_pos", "_ver")
+
+    def __init__(self, store: "LineStore"):
+        self.left = self.right = self.parent = None
+        self.prio = random.random()
+        self.size = 1
+        self.text: str | None = None       # None = hole (dict 에 없는 키)
+        self.cols: dict | None = None      # column 이름 → 값
+        self._store = store                # 삭제되면 None
+        self._pos = 0
+        self._ver = -1
+
+    @property
+    def line(self) -> int:
+        """현재 라인 번호 (삭제된 핸들은 삭제 시점 번호)"""
+        store = self._store
+        return store.position(self) if store is not None else self._pos
+
+    # CFG / Statement 복사 시 핸들은 공유 (트리 전체가 복사되지 않도록)
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return f"LineHandle({self.line})"
+
+
+def _pull(n: LineHandle) -> None:
+    l, r = n.left, n.right
+    size = 1
+    if l is not None:
+        size += l.size
+        l.parent = n
+    if r is not None:
+        size += r.size
+        r.parent = n
+    n.size = size
+
+
+def _split(n: LineHandle | None, k: int):
+    """앞쪽 k 개 / 나머지로 분리"""
+    if n is None:
+        return None, None
+    ls = n.left.size if n.left else 0
+    if k <= ls:
+        a, b = _split(n.left, k)
+        n.left = b
+        _pull(n)
+        return a, n
+    a, b = _split(n.right, k - ls - 1)
+    n.right = a
+    _pull(n)
+    return n, b
+
+
+def _merge(a: LineHandle | None, b: LineHandle | None):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.prio > b.prio:
+        a.right = _merge(a.right, b)
+        _pull(a)
+        return a
+    b.left = _merge(a, b.left)
+    _pull(b)
+    return b
+
+
+def _inorder(n: LineHandle | None) -> Iterator[LineHandle]:
+    stack = []
+    while stack or n is not None:
+        while n is not None:
+            stack.append(n)
+            n = n.left
+        n = stack.pop()
+        yield n
+        n = n.right
+
+
+class LineStore(MutableMapping):
+    """라인 번호(1-base) → 라인 텍스트.  dict 처럼 쓰되 삽입/삭제가 O(log n)."""
+
+    def __init__(self):
+        self._root: LineHandle | None = None
+        self._ver = 0                      # 라인 위치가 바뀔 때마다 증가
+        self._at: dict[int, LineHandle] = {}   # 현재 _ver 에서 조회한 위치 → 핸들
+        self._count = 0                    # hole 이 아닌 라인 수
+        self._rev = 0                      # 라인 텍스트가 바뀔 때마다 증가 (dirty 판정)
+        self._text: tuple[int, str] | None = None   # (_rev, 전체 텍스트)
+        self._columns: dict[str, LineColumn] = {}
+
+    # ─────────────────────────────────────────── 위치 ↔ 핸들
+    @property
+    def size(self) -> int:
+        """hole 을 포함한 마지막 라인 번호"""
+        return self._root.size if self._root else 0
+
+    def _moved(self) -> None:
+        self._ver += 1
+        self._rev += 1
+        self._at.clear()
+
+    @property
+    def revision(self) -> int:
+        return self._rev
+
+    def handle(self, ln: int, create: bool = False) -> LineHandle | None:
+        if ln < 1:
+            return None
+        h = self._at.get(ln)
+        if h is not None:
+            return h
+        if ln > self.size:
+            if not create:
+                return None
+            self._grow(ln)
+        n, base = self._root, 0
+        while n is not None:
+            pos = base + (n.left.size if n.left else 0) + 1
+            if ln < pos:
+                n = n.left
+            elif ln == pos:
+                break
+            else:
+                base = pos
+                n = n.right
+        self._at[ln] = n
+        return n
+
+    def position(self, h: LineHandle) -> int:
+        if h._ver == self._ver:
+            return h._pos
+        pos = (h.left.size if h.left else 0) + 1
+        n = h
+        while n.parent is not None:
+            p = n.parent
+            if p.right is n:
+                pos += (p.left.size if p.left else 0) + 1
+            n = p
+        h._pos, h._ver = pos, self._ver
+        return pos
+
+    def _grow(self, ln: int) -> None:
+        # 끝에 hole 추가 – 기존 라인 위치는 그대로라 캐시를 유지한다
+        tail = None
+        for _ in range(ln - self.size):
+            tail = _merge(tail, LineHandle(self))
+        self._root = _merge(self._root, tail)
+        self._root.parent = None
+
+    # ─────────────────────────────────────────── 구조 편집
+    def insert_lines(self, ln: int, count: int) -> None:
+        """ln 앞에 빈 라인(hole) count 개 삽입 (ln 이상 라인이 count 만큼 밀림)"""
+        if count <= 0 or ln > self.size:
+            return
+        mid = None
+        for _ in range(count):
+            mid = _merge(mid, LineHandle(self))
+        a, b = _split(self._root, ln - 1)
+        self._root = _merge(_merge(a, mid), b)
+        self._root.parent = None
+        self._moved()
+
+    def delete_lines(self, start: int, end: int) -> None:
+        """[start, end] 라인과 그 column 값 제거 (뒤쪽 라인이 당겨짐)"""
+        end = min(end, self.size)
+        if start < 1 or start > end:
+            return
+        a, rest = _split(self._root, start - 1)
+        gone, b = _split(rest, end - start + 1)
+        for i, h in enumerate(_inorder(gone)):
+            if h.text is not None:
+                self._count -= 1
+            h._store, h._pos = None, start + i      # 삭제 시점 번호로 고정
+        self._root = _merge(a, b)
+        if self._root is not None:
+            self._root.parent = None
+        self._moved()
+
+    # ─────────────────────────────────────────── dict 인터페이스 (라인 텍스트)
+    def __getitem__(self, ln: int) -> str:
+        h = self.handle(ln)
+        if h is None or h.text is None:
+            raise KeyError(ln)
+        return h.text
+
+    def __setitem__(self, ln: int, text: str) -> None:
+        h = self.handle(ln, create=True)
+        if h is None:
+            raise KeyError(ln)
+        if h.text is None:
+            self._count += 1
+        elif h.text == text:
+            return
+        h.text = text
+        self._rev += 1
+
+    def __delitem__(self, ln: int) -> None:
+        h = self.handle(ln)
+        if h is None or h.text is None:
+            raise KeyError(ln)
+        h.text = None
+        self._count -= 1
+        self._rev += 1
+
+    def __contains__(self, ln) -> bool:
+        h = self.handle(ln) if isinstance(ln, int) else None
+        return h is not None and h.text is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter([ln for ln, h in self.handles() if h.text is not None])
+
+    def __len__(self) -> int:
+        return self._count
+
+    def handles(self) -> Iterator[tuple[int, LineHandle]]:
+        """(라인 번호, 핸들) – 라인 순서"""
+        return enumerate(_inorder(self._root), start=1)
+
+    def _range(self, start: int, end: int | None) -> Iterator[tuple[int, LineHandle]]:
+        """[start, end] 위치의 (라인 번호, 핸들) – 시작점까지 O(log n) 하강 후 순회"""
+        end = self.size if end is None else min(end, self.size)
+        stack, n, base = [], self._root, 0
+        while n is not None:
+            pos = base + (n.left.size if n.left else 0) + 1
+            if pos >= start:
+                stack.append((n, base))
+                n = n.left
+            else:
+                base = pos
+                n = n.right
+        while stack:
+            n, base = stack.pop()
+            pos = base + (n.left.size if n.left else 0) + 1
+            if pos > end:
+                return
+            yield pos, n
+            m = n.right
+            while m is not None:
+                stack.append((m, pos))
+                m = m.left
+
+    def range_items(self, start: int = 1, end: int | None = None) -> Iterator[tuple[int, str]]:
+        """[start, end] 구간의 (라인 번호, 텍스트) – hole 제외"""
+        return ((ln, h.text) for ln, h in self._range(start, end) if h.text is not None)
+
+    def text(self, start: int = 1, end: int | None = None) -> str:
+        """
+        hole 을 건너뛰고 라인 순서대로 이어 붙인 코드.
+        전체 텍스트는 리비전이 바뀌었을 때만 다시 조립한다.
+        """
+        if start > 1 or end is not None:
+            return "\n".join(t for _, t in self.range_items(start, end))
+        if self._text is None or self._text[0] != self._rev:
+            self._text = (self._rev, "\n".join(h.text for h in _inorder(self._root)
+                                               if h.text is not None))
+        return self._text[1]
+
+    # ─────────────────────────────────────────── column
+    def column(self, name: str, default_factory: Callable | None = None) -> "LineColumn":
+        col = self._columns.get(name)
+        if col is None:
+            col = self._columns[name] = LineColumn(self, name, default_factory)
+        return col
+
+    # ─────────────────────────────────────────── src_line 변환
+    def anchor(self, value):
+        """src_line 으로 넘길 라인 번호를 이 저장소의 핸들로 (범위 밖/None 이면 그대로)"""
+        if type(value) is not int or not 1 <= value <= self.size:
+            return value
+        return self.handle(value)
+
+
+class LineColumn(MutableMapping):
+    """라인 번호 → 값.  값은 LineHandle 에 붙어 라인 이동을 따라간다."""
+
+    def __init__(self, store: LineStore, name: str, default_factory: Callable | None = None):
+        self._store = store
+        self._name = name
+        self.default_factory = default_factory     # defaultdict 처럼 동작
+
+    def _get(self, ln, default=_MISSING):
+        h = self._store.handle(ln) if isinstance(ln, int) else None
+        if h is None or h.cols is None:
+            return default
+        return h.cols.get(self._name, default)
+
+    def __getitem__(self, ln: int):
+        v = self._get(ln)
+        if v is _MISSING:
+            if self.default_factory is None:
+                raise KeyError(ln)
+            v = self[ln] = self.default_factory()
+        return v
+
+    def __setitem__(self, ln: int, value) -> None:
+        h = self._store.handle(ln, create=True)
+        if h is None:
+            raise KeyError(ln)
+        if h.cols is None:
+            h.cols = {}
+        h.cols[self._name] = value
+
+    def __delitem__(self, ln: int) -> None:
+        h = self._store.handle(ln) if isinstance(ln, int) else None
+        if h is None or h.cols is None or self._name not in h.cols:
+            raise KeyError(ln)
+        del h.cols[self._name]
+
+    def __contains__(self, ln) -> bool:
+        return self._get(ln) is not _MISSING
+
+    def get(self, ln, default=None):
+        v = self._get(ln)
+        return default if v is _MISSING else v
+
+    def pop(self, ln, default=_MISSING):
+        v = self._get(ln)
+        if v is _MISSING:
+            if default is _MISSING:
+                raise KeyError(ln)
+            return default
+        del self[ln]
+        return v
+
+    def setdefault(self, ln, default=None):
+        v = self._get(ln)
+        if v is _MISSING:
+            self[ln] = v = default
+        return v
+
+    def __iter__(self) -> Iterator[int]:
+        name = self._name
+        return iter([ln for ln, h in self._store.handles()
+                     if h.cols is not None and name in h.cols])
+
+    def range_items(self, start: int = 1, end: int | None = None) -> Iterator[tuple[int, object]]:
+        """[start, end] 구간의 (라인 번호, 값)"""
+        name = self._name
+        return ((ln, h.cols[name]) for ln, h in self._store._range(start, end)
+                if h.cols is not None and name in h.cols)
+
+    def __len__(self) -> int:
+        name = self._name
+        return sum(1 for _, h in self._store.handles() if h.cols is not None and name in h.cols)
+
+    def _handles(self, lines) -> Iterator[LineHandle]:
+        if lines is None:
+            return (h for _, h in self._store.handles())
+        return (h for h in map(self._store.handle, lines) if h is not None)
+
+    def snapshot(self, copy_value: Callable = lambda v: v,
+                 lines=None) -> list[tuple[LineHandle, object]]:
+        """(핸들, copy_value(값)) 목록 – 라인이 움직여도 restore 가 같은 라인에 되돌린다
+        (lines 를 주면 그 라인들만)"""
+        name = self._name
+        return [(h, copy_value(h.cols[name])) for h in self._handles(lines)
+                if h.cols is not None and name in h.cols]
+
+    def restore(self, snap: list[tuple[LineHandle, object]], lines=None) -> None:
+        """snapshot() 시점의 값으로 되돌린다 (그 뒤에 생긴 값은 지운다 – lines 를 주면 그 라인들만)"""
+        name = self._name
+        for h in self._handles(lines):
+            if h.cols is not None:
+                h.cols.pop(name, None)
+        for h, v in snap:
+            if h.cols is None:
+                h.cols = {}
+            h.cols[name] = v
+
+    def __repr__(self):
+        return f"LineColumn({self._name!r}, {dict(self.items())!r})"
+
+
+class SrcLine:
+    """
+    CFGNode / Statement 의 src_line 디스크립터.
+    대입한 값(LineStore.anchor() 핸들 또는 정수)을 그대로 저장하고, 읽을 때 현재 번호를 돌려준다.
+    핸들은 만든 저장소의 라인 이동만 따라가므로, 분석기마다 자기 LineStore 로 anchor 해서 넘긴다.
+    """
+
+    def __set_name__(self, owner, name):
+        self._attr = f"_{name}_ref"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        ref = obj.__dict__.get(self._attr)
+        return ref.line if isinstance(ref, LineHandle) else ref
+
+    def __set__(self, obj, value) -> None:
+        obj.__dict__[self._attr] = value
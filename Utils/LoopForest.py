@@ -0,0 +1,169 @@
+"""
+Dominator tree + loop-nesting forest (FunctionCFG.loop_forest)
+
+FunctionCFG 마다 한 번 계산해 두고, 그래프가 바뀌면(VersionedDiGraph.version)
+다시 계산한다.  fixpoint / 동적 CFG 빌더가 매번 그래프를 역·순방향으로
+훑던 루프 질의를 캐시 조회로 바꾼다.
+
+  • idom / dominates(a, b)   : 지배 트리 + pre/post 번호 → O(1)
+  • Loop(header, body, parent, depth)
+        back-edge u→h (h 가 u 를 지배) 마다 자연 루프, 같은 header 는 합침
+  • innermost[n]             : n 을 포함하는 가장 안쪽 루프 → enclosing(n) 은 O(depth)
+  • join / cond              : 루프의 fixpoint_evaluation_node / 루프 조건 노드
+                               (while·for 는 header 가 join, do-while 은 body 끝의 φ)
+  • region(head)             : Engine.traverse_loop_nodes 의 결과
+                               (head 에서 loop_exit_node 를 넘지 않고 닿는 노드) 캐시
+"""
+from __future__ import annotations
+
+import networkx as nx
+
+LOOP_COND_TYPES = {"while", "for", "doWhile", "do_while"}
+
+
+class Loop:
+    __slots__ = ("header", "body", "parent", "children", "depth", "join", "cond")
+
+    def __init__(self, header, body: frozenset):
+        self.header = header
+        self.body = body
+        self.parent: "Loop | None" = None
+        self.children: list["Loop"] = []
+        self.depth = 1
+        self.join = None          # fixpoint_evaluation_node
+        self.cond = None          # while / for / do-while 조건 노드
+
+
+class LoopForest:
+    """그래프 G 의 entry 기준 지배 트리 / 루프 중첩 forest.  version 은 계산 시점의 G.version."""
+
+    def __init__(self, G, entry, version: int = 0):
+        self.version = version
+        self._G = G
+
+        # ── 지배 트리 ------------------------------------------------
+        self.idom: dict = dict(nx.immediate_dominators(G, entry)) if entry in G else {}
+        children: dict = {}
+        for n, d in self.idom.items():
+            if n is not d:
+                children.setdefault(d, []).append(n)
+        self._pre: dict = {}
+        self._post: dict = {}
+        if entry in self.idom:
+            clock = 0
+            stack = [(entry, False)]
+            while stack:
+                n, done = stack.pop()
+                if done:
+                    self._post[n] = clock; clock += 1
+                    continue
+                self._pre[n] = clock; clock += 1
+                stack.append((n, True))
+                stack.extend((c, False) for c in children.get(n, ()))
+
+        # ── 자연 루프 ------------------------------------------------
+        latches: dict = {}
+        for u, h in G.edges:
+            if u in self.idom and h in self.idom and self.dominates(h, u):
+                latches.setdefault(h, []).append(u)
+
+        self.loops: dict = {}                     # header → Loop
+        for h, us in latches.items():
+            body = {h}
+            stack = [u for u in us if u is not h]
+            while stack:
+                n = stack.pop()
+                if n in body:
+                    continue
+                body.add(n)
+                stack.extend(p for p in G.predecessors(n) if p in self.idom)
+            self.loops[h] = Loop(h, frozenset(body))
+
+        # ── 중첩 (작은 루프부터 – 먼저 자리 잡은 안쪽 루프가 innermost) ----
+        self.innermost: dict = {}
+        for loop in sorted(self.loops.values(), key=lambda l: len(l.body)):
+            for n in loop.body:
+                inner = self.innermost.get(n)
+                if inner is None:
+                    self.innermost[n] = loop
+                else:
+                    # 바로 바깥 루프 = inner 를 담는 가장 작은 루프
+                    top = inner
+                    while top.parent is not None:
+                        top = top.parent
+                    if top is not loop:
+                        top.parent = loop
+                        loop.children.append(top)
+        for loop in sorted(self.loops.values(), key=lambda l: -len(l.body)):
+            loop.depth = loop.parent.depth + 1 if loop.parent is not None else 1
+
+        for n, loop in self.innermost.items():
+            if getattr(n, "fixpoint_evaluation_node", False) and loop.join is None:
+                loop.join = n
+            if getattr(n, "condition_node", False) and loop.cond is None and \
+                    getattr(n, "condition_node_type", "") in LOOP_COND_TYPES:
+                loop.cond = n
+
+        self._regions: dict = {}
+        self._exits: dict = {}
+
+    # ─────────────────────────────────────────── 지배
+    def dominates(self, a, b) -> bool:
+        """a 가 b 를 지배하는지 (entry 에서 닿지 않는 노드는 False)"""
+        pa, pb = self._pre.get(a), self._pre.get(b)
+        if pa is None or pb is None:
+            return False
+        return pa <= pb and self._post[b] <= self._post[a]
+
+    # ─────────────────────────────────────────── 루프 질의
+    def loop_of(self, node) -> Loop | None:
+        """node 를 포함하는 가장 안쪽 루프"""
+        return self.innermost.get(node)
+
+    def enclosing(self, node):
+        """안쪽 → 바깥 순서로 node 를 감싸는 루프들 (O(depth))"""
+        loop = self.innermost.get(node)
+        while loop is not None:
+            yield loop
+            loop = loop.parent
+
+    def loop_join(self, node):
+        """node 를 감싸는 가장 안쪽 루프의 fixpoint join (없으면 None)"""
+        for loop in self.enclosing(node):
+            if loop.join is not None:
+                return loop.join
+        return None
+
+    def loop_condition(self, node):
+        """node 를 감싸는 가장 안쪽 루프의 조건 노드 (없으면 None)"""
+        for loop in self.enclosing(node):
+            if loop.cond is not None:
+                return loop.cond
+        return None
+
+    # ─────────────────────────────────────────── Engine.fixpoint 용 캐시
+    def region(self, head) -> frozenset:
+        """head 에서 loop_exit_node 를 넘지 않고 닿는 노드 집합 (head 별 캐시)"""
+        reg = self._regions.get(head)
+        if reg is None:
+            G = self._G
+            visited = set()
+            stack = [head]
+            while stack:
+                cur = stack.pop()
+                if cur in visited:
+                    continue
+                visited.add(cur)
+                for succ in G.successors(cur):
+                    # 루프 바깥으로 나가는 exit 노드는 확장하지 않음
+                    if getattr(succ, "loop_exit_node", False):
+                        continue
+                    stack.append(succ)
+            reg = self._regions[head] = frozenset(visited)
+        return reg
+
+    def cached_exit(self, head, compute):
+        """head 의 loop-exit 노드 – 처음 한 번만 compute(head)"""
+        if head not in self._exits:
+            self._exits[head] = compute(head)
+        return self._exits[head]
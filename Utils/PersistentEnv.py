@@ -0,0 +1,175 @@
+"""
+copy-on-write 변수 환경 (dict[str, Variables] 대체)
+
+VariableEnv.copy_variables 는 매 단계 환경 전체를 deep-copy 했다.
+PersistentEnv 는 dict 를 그대로 상속하되, fork() 는 변수 객체를 복사하지 않고
+공유(shared) 표시만 한다.  공유된 변수는 어느 쪽 환경에서든 처음 꺼낼 때
+(__getitem__ / get / items / values …) 그 환경 전용 사본으로 바뀐다.
+  • 복사 비용은 문장이 실제로 건드린 변수 수에 비례
+  • Struct.members / Mapping.mapping 도 PersistentEnv 로 복사되므로
+    큰 매핑의 한 키만 바뀌면 그 키만 복사된다
+  • leaf 의 interval / AddressSet / SolType 처럼 제자리 수정되지 않는 값은 공유
+
+공유 표시는 변수 객체 자체(_cow_shared)에 남기므로, 같은 객체를 들고 있는
+다른 환경(예: callee 로 넘긴 caller_env)도 수정 전에 복사한다.
+읽기 전용 비교·merge 는 dict.__getitem__ / dict.items 로 복사 없이 본다.
+"""
+from __future__ import annotations
+
+import copy
+
+from Domain.Interval import Interval
+from Domain.AddressSet import AddressSet
+from Domain.BytesSet import BytesSet
+from Domain.Type import SolType
+from Domain.Variable import (Variables, ArrayVariable, StructVariable, MappingVariable)
+
+_SHARED_FLAG = "_cow_shared"
+
+# 변수 안에서 제자리 수정되지 않는 값 타입 → 복사 없이 공유
+_IMMUTABLE = (type(None), bool, int, float, str, Interval, AddressSet, BytesSet, SolType)
+
+# 복사된 변수 객체 수 / fork 횟수 (VariableEnv.copy_stats 와 같은 dict)
+stats = {"copied": 0, "forks": 0}
+
+
+def is_shared(v) -> bool:
+    d = getattr(v, "__dict__", None)
+    return d is not None and d.get(_SHARED_FLAG, False)
+
+
+def mark_shared(v) -> None:
+    if isinstance(v, Variables):
+        v.__dict__[_SHARED_FLAG] = True
+
+
+def _copy_leaf(v):
+    new = copy.copy(v)
+    d = new.__dict__
+    d.pop(_SHARED_FLAG, None)
+    for k, x in d.items():
+        if not isinstance(x, _IMMUTABLE):
+            d[k] = copy.deepcopy(x)      # usage_sites(set), enum members 등
+    return new
+
+
+def copy_variable(v):
+    """
+    단일 변수 사본 (VariableEnv.copy_single_variable 의 persistent 버전).
+    Struct / Mapping 의 하위 dict 는 fork 로 공유, Array 요소는 즉시 복사.
+    """
+    stats["copied"] += 1
+    if isinstance(v, ArrayVariable):
+        new_arr = ArrayVariable(
+            identifier=v.identifier,
+            base_type=copy.deepcopy(v.typeInfo.arrayBaseType),
+            array_length=v.typeInfo.arrayLength,
+            is_dynamic=v.typeInfo.isDynamicArray,
+            scope=v.scope
+        )
+        new_arr.elements = [copy_variable(e) for e in v.elements]
+        return new_arr
+
+    if isinstance(v, StructVariable):
+        new_st = StructVariable(
+            identifier=v.identifier,
+            struct_type=v.typeInfo.structTypeName,
+            scope=v.scope
+        )
+        new_st.members = PersistentEnv.fork_of(v.members)
+        return new_st
+
+    if isinstance(v, MappingVariable):
+        new_mp = MappingVariable(
+            identifier=v.identifier,
+            key_type=copy.deepcopy(v.typeInfo.mappingKeyType),
+            value_type=copy.deepcopy(v.typeInfo.mappingValueType),
+            scope=v.scope,
+            struct_defs=v.struct_defs,
+            enum_defs=v.enum_defs
+        )
+        new_mp.mapping = PersistentEnv.fork_of(v.mapping)
+        return new_mp
+
+    if isinstance(v, Variables):
+        return _copy_leaf(v)
+    return copy.deepcopy(v)
+
+
+class PersistentEnv(dict):
+    """이름 → 변수.  fork() 는 O(변수 수) 표시만 하고, 실제 복사는 처음 꺼낼 때."""
+
+    __slots__ = ()
+
+    # ─────────────────────────────────────────── 생성
+    @classmethod
+    def fork_of(cls, src) -> "PersistentEnv":
+        """src(PersistentEnv 또는 일반 dict)의 copy-on-write 사본"""
+        if isinstance(src, PersistentEnv):
+            return src.fork()
+        # 일반 dict 는 소유자가 제자리 수정할 수 있으므로 바로 복사
+        out = cls()
+        for k, v in src.items():
+            dict.__setitem__(out, k, copy_variable(v))
+        return out
+
+    def fork(self) -> "PersistentEnv":
+        stats["forks"] += 1
+        for v in dict.values(self):
+            mark_shared(v)
+        out = PersistentEnv()
+        dict.update(out, self)
+        for k, v in dict.items(out):
+            if not isinstance(v, (Variables, *_IMMUTABLE)):
+                dict.__setitem__(out, k, copy.deepcopy(v))
+        return out
+
+    # ─────────────────────────────────────────── copy-on-access
+    def _own(self, key, v):
+        if is_shared(v):
+            v = copy_variable(v)
+            dict.__setitem__(self, key, v)
+        return v
+
+    def __getitem__(self, key):
+        return self._own(key, dict.__getitem__(self, key))
+
+    def get(self, key, default=None):
+        if key in self:
+            return self._own(key, dict.__getitem__(self, key))
+        return default
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self._own(key, dict.__getitem__(self, key))
+        dict.__setitem__(self, key, default)
+        return default
+
+    def pop(self, key, *default):
+        if key in self:
+            v = self._own(key, dict.__getitem__(self, key))
+            dict.__delitem__(self, key)
+            return v
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        k, v = dict.popitem(self)
+        return k, (copy_variable(v) if is_shared(v) else v)
+
+    def items(self):
+        return [(k, self._own(k, v)) for k, v in dict.items(self)]
+
+    def values(self):
+        return [self._own(k, v) for k, v in dict.items(self)]
+
+    def copy(self) -> "PersistentEnv":
+        return self.fork()
+
+    def __copy__(self):
+        return self.fork()
+
+    def __deepcopy__(self, memo):
+        out = PersistentEnv()
+        for k, v in dict.items(self):
+            dict.__setitem__(out, k, copy.deepcopy(v, memo))
+        return out
@@ -0,0 +1,224 @@
+"""
+중괄호 scope 인덱스 (ContractAnalyzer.find_*_context 용)
+
+라인 번호 순서의 implicit treap 에 라인별 "축약된" 괄호 수를 저장한다.
+한 라인의 '{' / '}' 나열은 항상  '}' × rc  +  '{' × ro  로 줄어든다
+(예: "} else {" → rc=1, ro=1 ,  "function f() {}" → rc=0, ro=0).
+
+  depth(x)      : x 라인 끝에서 열려 있는 scope 수 (= Σ ro − rc)
+  low(y)        : y 라인의 '}' 를 처리한 직후의 깊이 (= depth(y−1) − rc(y))
+  opener(x, e)  : x 이하에서 low(y) < e 인 가장 큰 y
+                  = x 라인 끝에서 깊이 e 인 scope 를 연 라인
+  floor(x)      : min(0, min_{k≤x} low(k)) – 짝 없는 '}' 는 무시 (깊이는 floor 위에서만 센다)
+
+서브트리마다 (Σ(ro−rc), min low) 를 유지하므로 갱신·삽입·삭제·조회가 모두 O(log n).
+scope 는 (opener 라인, 깊이) 쌍으로 식별한다.
+"""
+from __future__ import annotations
+
+import random
+from typing import Iterator, NamedTuple
+
+class Scope(NamedTuple):
+    line: int    # '{' 가 있는 라인
+    depth: int   # Σ(ro − rc) 기준 깊이 (균형 잡힌 코드면 1 = 최상위)
+
+
+class _Node:
+    __slots__ = ("left", "right", "prio", "size", "rc", "ro", "sum", "minlow")
+
+    def __init__(self, rc: int = 0, ro: int = 0):
+        self.left = self.right = None
+        self.prio = random.random()
+        self.rc, self.ro = rc, ro
+        self.size = 1
+        self.sum = ro - rc
+        self.minlow = -rc
+
+
+def _pull(n: _Node) -> None:
+    l, r = n.left, n.right
+    s_l = l.sum if l else 0
+    n.size = 1 + (l.size if l else 0) + (r.size if r else 0)
+    n.sum = s_l + n.ro - n.rc + (r.sum if r else 0)
+    m = s_l - n.rc
+    if l and l.minlow < m:
+        m = l.minlow
+    if r:
+        mr = s_l + n.ro - n.rc + r.minlow
+        if mr < m:
+            m = mr
+    n.minlow = m
+
+
+def _split(n: _Node | None, k: int):
+    """앞쪽 k 개 / 나머지로 분리"""
+    if n is None:
+        return None, None
+    ls = n.left.size if n.left else 0
+    if k <= ls:
+        a, b = _split(n.left, k)
+        n.left = b
+        _pull(n)
+        return a, n
+    a, b = _split(n.right, k - ls - 1)
+    n.right = a
+    _pull(n)
+    return n, b
+
+
+def _merge(a: _Node | None, b: _Node | None):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.prio > b.prio:
+        a.right = _merge(a.right, b)
+        _pull(a)
+        return a
+    b.left = _merge(a, b.left)
+    _pull(b)
+    return b
+
+
+def _build(count: int) -> _Node | None:
+    """빈 라인 count 개짜리 treap"""
+    root = None
+    for _ in range(count):
+        root = _merge(root, _Node())
+    return root
+
+
+def reduce_braces(code: str) -> tuple[int, int]:
+    """라인의 '{' '}' 나열을 (앞쪽 미매칭 '}', 뒤쪽 미매칭 '{') 로 축약"""
+    if "}" not in code:
+        return 0, code.count("{")
+    rc = ro = 0
+    for ch in code:
+        if ch == "{":
+            ro += 1
+        elif ch == "}":
+            if ro:
+                ro -= 1
+            else:
+                rc += 1
+    return rc, ro
+
+
+class ScopeIndex:
+    def __init__(self):
+        self._root: _Node | None = None
+
+    def __len__(self) -> int:
+        return self._root.size if self._root else 0
+
+    # ─────────────────────────────────────────── 갱신
+    def _ensure(self, ln: int) -> None:
+        if ln > len(self):
+            self._root = _merge(self._root, _build(ln - len(self)))
+
+    def set_line(self, ln: int, code: str) -> None:
+        self.set_counts(ln, *reduce_braces(code))
+
+    def set_counts(self, ln: int, rc: int, ro: int) -> None:
+        self._ensure(ln)
+        a, rest = _split(self._root, ln - 1)
+        mid, b = _split(rest, 1)
+        mid.rc, mid.ro = rc, ro
+        _pull(mid)
+        self._root = _merge(_merge(a, mid), b)
+
+    def insert_lines(self, ln: int, count: int) -> None:
+        """ln 앞에 빈 라인 count 개 삽입 (ln 이상 라인이 count 만큼 밀림)"""
+        if count <= 0 or ln > len(self):
+            return
+        a, b = _split(self._root, ln - 1)
+        self._root = _merge(_merge(a, _build(count)), b)
+
+    def delete_lines(self, start: int, end: int) -> None:
+        """[start, end] 라인 제거 (뒤쪽 라인이 당겨짐)"""
+        if start > len(self):
+            return
+        a, rest = _split(self._root, start - 1)
+        _, b = _split(rest, end - start + 1)
+        self._root = _merge(a, b)
+
+    # ─────────────────────────────────────────── 조회
+    def depth(self, x: int) -> int:
+        """x 라인 끝의 깊이"""
+        n, acc, left_of = self._root, 0, 0
+        while n is not None:
+            ls = n.left.size if n.left else 0
+            pos = left_of + ls + 1
+            if x < pos:
+                n = n.left
+            else:
+                acc += (n.left.sum if n.left else 0) + n.ro - n.rc
+                if x == pos:
+                    break
+                left_of = pos
+                n = n.right
+        return acc
+
+    def floor(self, x: int) -> int:
+        """x 라인까지의 최저 low (0 이상이면 0) – 짝 없는 '}' 로 내려간 바닥"""
+        n, acc, left_of, best = self._root, 0, 0, 0
+        while n is not None:
+            ls = n.left.size if n.left else 0
+            pos = left_of + ls + 1
+            if x < pos:
+                n = n.left
+                continue
+            s_l = n.left.sum if n.left else 0
+            if n.left and acc + n.left.minlow < best:
+                best = acc + n.left.minlow
+            if acc + s_l - n.rc < best:
+                best = acc + s_l - n.rc
+            acc += s_l + n.ro - n.rc
+            if x == pos:
+                break
+            left_of = pos
+            n = n.right
+        return best
+
+    def opener(self, x: int, e: int) -> int | None:
+        """x 이하에서 low(y) < e 인 가장 큰 y"""
+        return self._rightmost(self._root, 0, 0, min(x, len(self)), e)
+
+    def _rightmost(self, n, base_pos, base_sum, x, e):
+        if n is None or base_pos >= x or base_sum + n.minlow >= e:
+            return None
+        ls = n.left.size if n.left else 0
+        s_l = n.left.sum if n.left else 0
+        pos = base_pos + ls + 1
+        if pos < x:
+            hit = self._rightmost(n.right, pos, base_sum + s_l + n.ro - n.rc, x, e)
+            if hit is not None:
+                return hit
+        if pos <= x and base_sum + s_l - n.rc < e:
+            return pos
+        return self._rightmost(n.left, base_pos, base_sum, x, e)
+
+    def scope_at(self, x: int) -> Scope | None:
+        """x 라인 끝에서 가장 안쪽 scope (없으면 None)"""
+        x = min(x, len(self))
+        if x <= 0:
+            return None
+        d = self.depth(x)
+        if d <= self.floor(x):
+            return None
+        y = self.opener(x, d)
+        return Scope(y, d) if y is not None else None
+
+    def parent(self, scope: Scope) -> Scope | None:
+        if scope.depth - 1 <= self.floor(scope.line):
+            return None
+        y = self.opener(scope.line, scope.depth - 1)
+        return Scope(y, scope.depth - 1) if y is not None else None
+
+    def ancestors(self, x: int) -> Iterator[Scope]:
+        """x 라인 끝에서 안쪽 → 바깥쪽 순서의 scope 들"""
+        s = self.scope_at(x)
+        while s is not None:
+            yield s
+            s = self.parent(s)
@@ -1,19 +1,50 @@
 import copy
 from collections.abc import Callable
+from typing import NamedTuple
+
+
+class SnapshotMark(NamedTuple):
+    """snapshot() 이 돌려주는 표시 – undo log 의 위치"""
+    pos: int
+
 
 class SnapshotManager:
     """
     * register(obj, serializer)              : 객체별 최초 스냅
     * restore(obj, deserializer)             : 단일 객체 롤백   (기존 인터페이스)
-    * snapshot() -> dict                     : 전체 스냅          (새로 추가)
-    * restore(snap_dict)                     : 전체 롤백          (새로 추가, 오버로드)
+    * snapshot() -> SnapshotMark             : 전체 스냅 표시
+    * restore_from_snap(mark)                : 표시 이후 store 변경 되돌리기
+    * discard(mark)                          : 되돌리지 않고 표시 해제
+    * restore(snap_dict)                     : 전체 롤백          (오버로드)
+
+    store 는 register 로만 바뀐다 (항목은 한 번 들어가면 고치지 않음).
+    열린 스냅 표시가 있는 동안 store / ref 쓰기는 _set 을 거쳐 undo log 에
+    (oid, 이전 항목, 이전 참조) 로 남고, restore_from_snap 은 그 표시 이후의
+    log 만 거꾸로 되돌린다 → flush 비용이 등록된 전체 상태 크기가 아니라
+    flush 중 바뀐 항목 수에 비례.
+
+    UNDO_LOG = False 면 예전처럼 store 전체를 deepcopy 한다 (비교용).
     """
 
+    UNDO_LOG = True
+    _MISSING = object()
+
     def __init__(self) -> None:
         # id(obj) -> { "__dict__": deep-copied dict, "serializer": fn }
         self.store: dict[int, dict] = {}
         # id(obj) -> 실객체 참조 (전역 롤백 시 필요)
         self.ref:   dict[int, object] = {}
+        # 열린 스냅 표시가 있을 때의 store 변경 기록 (oid, 이전 store 항목, 이전 ref)
+        self._undo: list[tuple[int, object, object]] = []
+        self._open = 0
+
+    # ───────────────────────────────────────── write barrier
+    def _set(self, oid: int, entry: dict, obj: object) -> None:
+        if self._open:
+            self._undo.append((oid, self.store.get(oid, self._MISSING),
+                               self.ref.get(oid, self._MISSING)))
+        self.store[oid] = entry
+        self.ref[oid] = obj
 
     # ───────────────────────────────────────── register
     def register(self, obj: object, serializer: Callable[[object], dict]) -> None:
@@ -23,11 +54,10 @@ class SnapshotManager:
         """
         oid = id(obj)
         if oid not in self.store:
-            self.store[oid] = {
+            self._set(oid, {
                 "snap": copy.deepcopy(serializer(obj)),
                 "serializer": serializer,
-            }
-            self.ref[oid] = obj
+            }, obj)
 
     # ───────────────────────────────────────── 단일 객체 롤백 (기존용)
     def restore(self, target, deserializer: Callable[[object, dict], None] | None = None):
@@ -53,10 +83,37 @@ class SnapshotManager:
             obj.__dict__.update(copy.deepcopy(saved_state))
 
     # ───────────────────────────────────────── 전체 스냅
-    # 전체 스냅-샷을 반환
+    # 전체 스냅 표시를 반환 (UNDO_LOG=False 면 store 의 deepcopy)
     def snapshot(self):
-        return copy.deepcopy(self.store)
+        if not self.UNDO_LOG:
+            return copy.deepcopy(self.store)
+        self._open += 1
+        return SnapshotMark(len(self._undo))
 
-    # 외부에서 받은 snap(dict) 전체를 되돌린다
+    # snapshot() 이후의 store 변경을 전부 되돌린다
     def restore_from_snap(self, snap):
-        self.store = snap
\ No newline at end of file
+        if not isinstance(snap, SnapshotMark):
+            self.store = snap
+            return
+        undo = self._undo
+        while len(undo) > snap.pos:
+            oid, old_entry, old_ref = undo.pop()
+            if old_entry is self._MISSING:
+                self.store.pop(oid, None)
+            else:
+                self.store[oid] = old_entry
+            if old_ref is self._MISSING:
+                self.ref.pop(oid, None)
+            else:
+                self.ref[oid] = old_ref
+        self._close()
+
+    # 되돌리지 않고 표시만 닫는다 (변경 유지)
+    def discard(self, snap) -> None:
+        if isinstance(snap, SnapshotMark):
+            self._close()
+
+    def _close(self) -> None:
+        self._open = max(0, self._open - 1)
+        if not self._open:
+            self._undo.clear()
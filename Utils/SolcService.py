@@ -0,0 +1,134 @@
+"""
+solc 컴파일 서비스 (compile_check / delete strict 검증 공용)
+
+  • 설치된 solc 버전 목록과 실행 파일 경로를 한 번만 조회해 memoize
+  • standard-JSON 입력으로 solc 를 호출 (abi 만 요청 → 타입 검사까지만, codegen 생략)
+  • 결과를 (소스 sha256, 버전) 키의 LRU 캐시에 보관 → 같은 소스 재검사는 즉시 반환
+
+solc 에는 상주(server) 모드가 없으므로 "warm" 은 버전/경로 해석과
+결과 캐시를 프로세스 수명 동안 유지하는 것을 뜻한다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import subprocess
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+
+class SolcUnavailable(RuntimeError):
+    """py-solc-x 가 없거나 요청한 solc 버전이 설치되어 있지 않음"""
+
+
+@dataclass
+class CompileResult:
+    ok: bool
+    errors: list[dict] = field(default_factory=list)     # severity == "error"
+    warnings: list[dict] = field(default_factory=list)
+    version: str = ""
+    elapsed_s: float = 0.0
+
+    def error_message(self) -> str:
+        return "\n".join(e.get("formattedMessage", e.get("message", "")) for e in self.errors)
+
+
+class SolcService:
+    DEFAULT_VERSION = "0.8.0"
+    SOURCE_NAME = "<stdin>"
+
+    def __init__(self, version: str = DEFAULT_VERSION, cache_size: int = 64):
+        self.version = version
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[tuple[str, str], CompileResult]" = OrderedDict()
+        self._installed: set[str] | None = None       # memoized get_installed_solc_versions()
+        self._executables: dict[str, str] = {}         # version → solc 경로
+        self.stats = {"hits": 0, "misses": 0, "compile_s": 0.0}
+
+    # ─────────────────────────────────────────── 버전 / 실행 파일
+    def installed_versions(self, refresh: bool = False) -> set[str]:
+        if self._installed is None or refresh:
+            try:
+                from solcx import get_installed_solc_versions
+            except ImportError as e:
+                raise SolcUnavailable("py-solc-x is not installed") from e
+            self._installed = {str(v) for v in get_installed_solc_versions()}
+        return self._installed
+
+    def ensure_version(self, version: str | None = None, install: bool = False) -> str:
+        """version 의 solc 실행 파일 경로를 반환 (install=True 면 없을 때 설치)."""
+        version = version or self.version
+        exe = self._executables.get(version)
+        if exe is not None:
+            return exe
+
+        if version not in self.installed_versions():
+            if not install:
+                raise SolcUnavailable(f"solc {version} is not installed")
+            from solcx import install_solc
+            print(f"[info] installing solc {version} …")
+            install_solc(version)  # 네트워크·권한 오류나면 여기서 예외 발생
+            self.installed_versions(refresh=True)
+
+        from solcx import get_executable
+        exe = str(get_executable(version))
+        self._executables[version] = exe
+        return exe
+
+    # ─────────────────────────────────────────── 컴파일
+    @staticmethod
+    def source_key(source: str) -> str:
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    def _standard_input(self, source: str) -> dict:
+        return {
+            "language": "Solidity",
+            "sources": {self.SOURCE_NAME: {"content": source}},
+            "settings": {"outputSelection": {"*": {"*": ["abi"]}}},
+        }
+
+    def compile(self, source: str, version: str | None = None,
+                install: bool = False) -> CompileResult:
+        version = version or self.version
+        key = (self.source_key(source), version)
+        hit = self._cache.get(key)
+        if hit is not None:
+            self._cache.move_to_end(key)
+            self.stats["hits"] += 1
+            return hit
+
+        exe = self.ensure_version(version, install=install)
+
+        # solcx.wrapper 는 호출마다 `solc --version` 을 추가로 띄우므로 직접 1회 실행
+        t0 = time.perf_counter()
+        proc = subprocess.run([exe, "--standard-json"],
+                              input=json.dumps(self._standard_input(source)),
+                              capture_output=True, text=True)
+        if proc.returncode != 0 or not proc.stdout:
+            raise SolcUnavailable(f"solc {version} failed: {proc.stderr.strip()}")
+        out = json.loads(proc.stdout)
+        diags = out.get("errors", [])
+        result = CompileResult(
+            ok=not any(d.get("severity") == "error" for d in diags),
+            errors=[d for d in diags if d.get("severity") == "error"],
+            warnings=[d for d in diags if d.get("severity") != "error"],
+            version=version,
+            elapsed_s=time.perf_counter() - t0,
+        )
+        self.stats["misses"] += 1
+        self.stats["compile_s"] += result.elapsed_s
+
+        if self.cache_size > 0:
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+        self.stats.update(hits=0, misses=0, compile_s=0.0)
+
+
+# 프로세스 전역 서비스 (ContractAnalyzer 인스턴스 간 캐시 공유)
+solc_service = SolcService()
@@ -0,0 +1,175 @@
+"""
+콜드 스타트 보조 유틸 (WebSocketServer 첫 응답 지연 단축용)
+
+  • prewarm()          : 생성된 파서 / solc / networkx 를 미리 import 하고
+                         대표 fragment 들을 파싱해 공유 DFA 를 데워 둔다.
+                         background=True 면 데몬 스레드에서 수행
+                         (파서 풀 · 공유 DFA · 파스 캐시는 ParserHelpers._LOCK 으로
+                         요청 처리 스레드와 직렬화된다).
+  • profile_startup()  : `python -X importtime` 결과를 모듈별로 집계한 리포트.
+
+Utils.Helper / ContractAnalyzer 는 파서·solc 를 첫 사용 시점에 import 하므로
+prewarm 을 하지 않아도 동작은 같고, 첫 편집 이벤트가 그 비용을 부담할 뿐이다.
+"""
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 편집 trace 에 자주 나오는 형태 (규칙별로 최소 1개)
+WARMUP_FRAGMENTS: list[tuple[str, str]] = [
+    ("contract Warmup {\n}", "contract"),
+    ("uint256 public totalSupply;", "stateVariableDeclaration"),
+    ("mapping (address => mapping (address => uint)) public allowance;", "stateVariableDeclaration"),
+    ("struct Info {\n}", "struct"),
+    ("uint256 amount;", "structMember"),
+    ("function transferFrom(address src, address dst, uint wad) public returns (bool) {\n}",
+     "functionDefinition"),
+    ("require(balanceOf[src] >= wad, \"insufficient-balance\");", "simpleStatement"),
+    ("balanceOf[src] = sub(balanceOf[src], wad);", "simpleStatement"),
+    ("uint256 bal = balances[msg.sender] * 2 + 1;", "simpleStatement"),
+    ("if (src != msg.sender && allowance[src][msg.sender] != uint(-1)) {\n}", "if"),
+    ("for (uint256 i = 0; i < n; i++) {\n}", "for"),
+    ("return true;", "return"),
+    ("// @GlobalVar msg.sender = symbolicAddress 0;", "debugUnit"),
+    ("// @StateVar balanceOf[src] = [1000,1000];", "debugUnit"),
+    ("// @LocalVar wad = [50,50];", "debugUnit"),
+]
+
+DEFAULT_PROFILE_TARGETS = (
+    "Analyzer.ContractAnalyzer",
+    "Analyzer.EnhancedSolidityVisitor",
+    "Parser.SolidityParser",
+    "solcx",
+    "networkx",
+)
+
+_warm_thread: threading.Thread | None = None
+_warm_done = threading.Event()
+_warm_stats: dict[str, float] = {}
+
+
+# ─────────────────────────────────────────────────────────────── prewarm
+def _prewarm_impl(include_solc: bool) -> None:
+    from Utils.Helper import ParserHelpers
+
+    t0 = time.perf_counter()
+    import networkx  # noqa: F401  (CFG 첫 생성 시 필요)
+    import Analyzer.EnhancedSolidityVisitor  # noqa: F401  (생성된 SolidityParser 포함)
+    _warm_stats["import_s"] = time.perf_counter() - t0
+
+    if include_solc:
+        t0 = time.perf_counter()
+        from Utils.SolcService import solc_service, SolcUnavailable
+        try:
+            solc_service.installed_versions()     # solcx import + 설치 버전 조회 memoize
+        except SolcUnavailable:
+            pass
+        _warm_stats["solc_import_s"] = time.perf_counter() - t0
+
+    # 캐시·통계를 건드리지 않도록 내부 파서 경로를 직접 사용
+    t0 = time.perf_counter()
+    mode = ParserHelpers.get_prediction_mode()
+    for code, ctx in WARMUP_FRAGMENTS:
+        rule = ParserHelpers.map_context_type(ctx) or 'interactiveSourceUnit'
+        ParserHelpers._parse(code, rule, False, mode)
+    _warm_stats["dfa_warmup_s"] = time.perf_counter() - t0
+    _warm_done.set()
+
+
+def prewarm(background: bool = True, include_solc: bool = True) -> threading.Thread | None:
+    """
+    파서·의존성 import 와 DFA 워밍업을 수행한다.
+    background=True 면 데몬 스레드를 띄우고 즉시 반환 (이미 진행 중이면 그 스레드 반환).
+    """
+    global _warm_thread
+    if _warm_done.is_set():
+        return None
+    if not background:
+        _prewarm_impl(include_solc)
+        return None
+    if _warm_thread is None:
+        _warm_thread = threading.Thread(target=_prewarm_impl, args=(include_solc,),
+                                        name="solqdebug-prewarm", daemon=True)
+        _warm_thread.start()
+    return _warm_thread
+
+
+def wait_warm(timeout: float | None = None) -> bool:
+    """백그라운드 prewarm 완료를 기다린다 (완료 여부 반환)."""
+    return _warm_done.wait(timeout)
+
+
+def prewarm_stats() -> dict[str, float]:
+    return dict(_warm_stats)
+
+
+# ─────────────────────────────────────────────────────────────── profile
+def _importtime(module: str) -> list[tuple[str, int, int]]:
+    """새 인터프리터에서 module 을 import 하고 (name, self_us, cumulative_us) 목록을 반환."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cum_us, name = (part.strip() for part in
+                                     line.replace("import time:", "|", 1).split("|"))
+        rows.append((name, int(self_us), int(cum_us)))
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr.strip().splitlines()[-1]}")
+    return rows
+
+
+def profile_startup(targets=DEFAULT_PROFILE_TARGETS, top: int = 15, out=None) -> dict[str, list]:
+    """
+    target 모듈마다 새 프로세스에서 import 시간을 측정하고
+    총 시간 + self 시간 상위 top 개 모듈을 출력한다.
+    """
+    out = out or sys.stdout
+    report: dict[str, list] = {}
+
+    print(f"\n{'='*64}", file=out)
+    print("Startup profile (python -X importtime, fresh interpreter per target)", file=out)
+    print(f"{'='*64}", file=out)
+
+    for mod in targets:
+        try:
+            rows = _importtime(mod)
+        except RuntimeError as e:
+            print(f"\n{mod}: {e}", file=out)
+            continue
+        report[mod] = rows
+        total = next((cum for name, _, cum in rows if name == mod), 0)
+        print(f"\n{mod}  — total {total / 1000:.1f} ms", file=out)
+        print(f"  {'module':44} {'self ms':>9} {'cum ms':>9}", file=out)
+        for name, self_us, cum_us in sorted(rows, key=lambda r: r[1], reverse=True)[:top]:
+            print(f"  {name:44} {self_us / 1000:>9.1f} {cum_us / 1000:>9.1f}", file=out)
+
+    # 첫 파싱(콜드 DFA) vs 두 번째 파싱(웜 DFA)
+    from Utils.Helper import ParserHelpers
+    code, ctx = WARMUP_FRAGMENTS[6]
+    rule = ParserHelpers.map_context_type(ctx)
+    t0 = time.perf_counter(); ParserHelpers._parse(code, rule)
+    cold = time.perf_counter() - t0
+    t0 = time.perf_counter(); ParserHelpers._parse(code, rule)
+    warm = time.perf_counter() - t0
+    print(f"\nfirst parse (incl. lazy parser import): {cold * 1000:.1f} ms,"
+          f" warm parse: {warm * 1000:.2f} ms", file=out)
+    print(f"{'='*64}\n", file=out)
+    return report
+
+
+if __name__ == "__main__":
+    if "--profile-startup" in sys.argv[1:]:
+        sys.path.insert(0, str(PROJECT_ROOT))
+        profile_startup()
+    else:
+        print("Usage: python -m Utils.Startup --profile-startup")
@@ -0,0 +1,201 @@
+"""
+라인 단위 증분 토큰 저장소
+
+ContractAnalyzer.full_code_lines 와 같은 라인 번호 체계로 라인별 토큰 배열을 유지한다.
+  • 편집된 라인만 다시 렉싱 (텍스트가 그대로면 재사용, 같은 텍스트는 memo 에서 재사용)
+  • 여러 줄 블록 주석(/* … */)은 라인 진입 상태(in-comment)로 추적하고,
+    상태가 바뀐 뒤쪽 라인만 연쇄적으로 다시 렉싱한다.
+  • fragment_tokens(start, end) 로 ParserHelpers.generate_parse_tree(tokens=…) 에
+    그대로 넘길 수 있는 토큰 목록을 만든다.
+
+lines 로 LineStore column 을 넘기면 라인 이동은 저장소가 처리하므로 shift 는 생략된다.
+
+Solidity 문자열은 줄을 넘지 않고 WS 는 skip, 블록 주석은 hidden 채널이므로
+라인별 렉싱 결과를 이어 붙이면 fragment 전체를 렉싱한 것과 파서 입장에서 같다.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+from antlr4.Token import Token
+
+from Utils.Helper import ParserHelpers
+
+
+class _LineEntry:
+    __slots__ = ("text", "comment_in", "comment_out", "tokens", "errors")
+
+    def __init__(self, text: str, comment_in: bool, comment_out: bool, tokens: list, errors: list):
+        self.text = text
+        self.comment_in = comment_in      # 이 라인 시작 시 블록 주석 안인지
+        self.comment_out = comment_out    # 이 라인 끝에서 블록 주석 안인지
+        self.tokens = tokens              # line=1 기준 토큰 (공유 – 내보낼 때는 clone)
+        self.errors = errors              # 렉서 오류 (SyntaxIssue, line=1 기준)
+
+
+class LineTokenStore:
+    MEMO_SIZE = 4096
+
+    def __init__(self, lines: MutableMapping | None = None):
+        # lines : 라인 번호 → _LineEntry 저장소 (None 이면 자체 dict)
+        self._shared = lines is not None
+        self._lines: MutableMapping[int, _LineEntry] = lines if lines is not None else {}
+        # (마스킹된 라인 텍스트) → (토큰, 렉서 오류) ; 렉싱은 라인 텍스트만의 함수
+        self._memo: "OrderedDict[str, tuple[list, list]]" = OrderedDict()
+        self.stats = {"lexed": 0, "memo_hits": 0, "unchanged": 0}
+
+    # ─────────────────────────────────────────── 블록 주석 추적
+    @staticmethod
+    def _mask_comments(text: str, in_comment: bool) -> tuple[str, bool]:
+        """
+        라인 밖으로 이어지는 블록 주석 구간을 공백으로 가린 텍스트와
+        라인 끝의 in-comment 상태를 반환 (라인 안에서 닫히는 주석은 렉서에 맡김).
+        """
+        if not in_comment and "/*" not in text:
+            return text, False
+
+        chars = list(text)
+        i, n = 0, len(text)
+        quote = None
+        open_at = None                    # 이 라인에서 열린 주석의 시작 위치
+        while i < n:
+            c = text[i]
+            if in_comment:
+                if text.startswith("*/", i):
+                    if open_at is None:   # 앞 라인에서 이어진 주석 → 닫는 곳까지 가림
+                        for k in range(0, i + 2):
+                            chars[k] = " "
+                    in_comment, open_at = False, None
+                    i += 2
+                    continue
+                i += 1
+            elif quote:
+                if c == "\\":
+                    i += 2
+                    continue
+                if c == quote:
+                    quote = None
+                i += 1
+            elif c in "\"'":
+                quote = c
+                i += 1
+            elif text.startswith("/*", i):
+                in_comment, open_at = True, i
+                i += 2
+            else:
+                i += 1
+
+        if in_comment:
+            for k in range(open_at or 0, n):
+                chars[k] = " "
+        return "".join(chars), in_comment
+
+    # ─────────────────────────────────────────── 렉싱
+    def _lex(self, masked: str) -> tuple[list, list]:
+        hit = self._memo.get(masked)
+        if hit is not None:
+            self._memo.move_to_end(masked)
+            self.stats["memo_hits"] += 1
+            return hit
+        errors: list = []
+        toks = ParserHelpers.lex(masked, errors) if masked.strip() else []
+        self.stats["lexed"] += 1
+        self._memo[masked] = (toks, errors)
+        if len(self._memo) > self.MEMO_SIZE:
+            self._memo.popitem(last=False)
+        return toks, errors
+
+    def _build(self, text: str, comment_in: bool) -> _LineEntry:
+        masked, comment_out = self._mask_comments(text, comment_in)
+        return _LineEntry(text, comment_in, comment_out, *self._lex(masked))
+
+    def _comment_state_before(self, ln: int) -> bool:
+        prev = self._lines.get(ln - 1)
+        return prev.comment_out if prev is not None else False
+
+    def _propagate(self, ln: int) -> None:
+        """ln 다음 라인부터 진입 상태가 달라진 라인만 다시 렉싱 (상태가 맞으면 중단)."""
+        cur = self._lines.get(ln)
+        state = cur.comment_out if cur is not None else False
+        nxt = ln + 1
+        while nxt in self._lines:
+            entry = self._lines[nxt]
+            if entry.comment_in == state:
+                break
+            entry = self._lines[nxt] = self._build(entry.text, state)
+            state = entry.comment_out
+            nxt += 1
+
+    # ─────────────────────────────────────────── 편집 연산 (full_code_lines 와 같은 순서로 호출)
+    def set_line(self, ln: int, text: str) -> None:
+        comment_in = self._comment_state_before(ln)
+        entry = self._lines.get(ln)
+        if entry is not None and entry.text == text and entry.comment_in == comment_in:
+            self.stats["unchanged"] += 1
+            return
+        self._lines[ln] = self._build(text, comment_in)
+        self._propagate(ln)
+
+    def shift(self, from_ln: int, offset: int) -> None:
+        """from_ln 이상 라인을 offset 만큼 이동 (삽입: +, 삭제: −)."""
+        if offset == 0 or self._shared:
+            return
+        moved = sorted((ln for ln in self._lines if ln >= from_ln), reverse=offset > 0)
+        for ln in moved:
+            self._lines[ln + offset] = self._lines.pop(ln)
+
+    def delete(self, start: int, end: int) -> None:
+        """공유 저장소면 라인 제거는 이미 끝난 상태로 보고 주석 경계만 맞춘다."""
+        if not self._shared:
+            for ln in range(start, end + 1):
+                self._lines.pop(ln, None)
+            self.shift(end + 1, -(end - start + 1))
+        # 삭제로 블록 주석 경계가 달라졌을 수 있음
+        nxt = self._lines.get(start)
+        if nxt is not None and nxt.comment_in != self._comment_state_before(start):
+            self._lines[start] = self._build(nxt.text, self._comment_state_before(start))
+            self._propagate(start)
+
+    # ─────────────────────────────────────────── 조회
+    def tokens(self, ln: int, default_channel_only: bool = True) -> list:
+        """ln 라인의 (공유) 토큰 – 읽기 전용으로 사용."""
+        entry = self._lines.get(ln)
+        if entry is None:
+            return []
+        if default_channel_only:
+            return [t for t in entry.tokens if t.channel == Token.DEFAULT_CHANNEL]
+        return entry.tokens
+
+    def leading_texts(self, ln: int, n: int = 2) -> list[str]:
+        """ln 라인 앞쪽 n 개 토큰 텍스트 (컨텍스트 판별용)."""
+        return [t.text for t in self.tokens(ln)[:n]]
+
+    def fragment_tokens(self, start: int, end: int) -> list | None:
+        """
+        [start, end] 라인 토큰을 fragment 기준 라인 번호로 복제해 이어 붙인다.
+        (스트림이 tokenIndex 를 덮어쓰므로 저장된 토큰은 직접 넘기지 않는다)
+        범위에 저장되지 않은 라인이 있으면 None.
+        """
+        out = []
+        for rel, ln in enumerate(range(start, end + 1), start=1):
+            entry = self._lines.get(ln)
+            if entry is None:
+                return None
+            for t in entry.tokens:
+                c = t.clone()
+                c.line = rel
+                out.append(c)
+        return out
+
+    def fragment_errors(self, start: int, end: int) -> list:
+        """[start, end] 라인의 렉서 오류 (fragment 기준 라인 번호)."""
+        out = []
+        for rel, ln in enumerate(range(start, end + 1), start=1):
+            entry = self._lines.get(ln)
+            if entry is not None:
+                out.extend(e._replace(line=rel) for e in entry.errors)
+        return out
+
+    def __len__(self) -> int:
+        return len(self._lines)
@@ -0,0 +1,179 @@
+"""
+Weak Topological Ordering (Bourdoncle, 1993) + 그 순서를 따르는 worklist
+
+FunctionCFG 마다 한 번 계산해 두고, 그래프가 바뀌면(VersionedDiGraph.version)
+다시 계산한다.
+
+  • WTO 원소는 노드 또는 WTOComponent(head, body) – body 는 다시 WTO
+    (루프 = 강연결요소, head = 바깥에서 들어오는 진입 노드)
+  • position[n] : 평탄화한 순서 (head 가 자기 body 보다 앞)
+  • WTOWorklist : position 이 가장 작은 노드부터 꺼내는 중복 없는 worklist
+    → 합류 노드는 (back-edge 를 제외한) 모든 선행 노드 뒤에 처리된다
+
+networkx 는 CFG 를 처음 만들 때 이 모듈과 함께 로드된다 (cold start 단축).
+"""
+from __future__ import annotations
+
+import heapq
+from typing import NamedTuple
+
+import networkx as nx
+
+
+class VersionedDiGraph(nx.DiGraph):
+    """노드·간선이 추가/삭제될 때마다 version 을 올리는 DiGraph (WTO 캐시 무효화용)"""
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        self.version = 0
+        super().__init__(incoming_graph_data, **attr)
+
+    def _bump(self):
+        self.version += 1
+
+    def add_node(self, node_for_adding, **attr):
+        if node_for_adding not in self._node:
+            self._bump()
+        super().add_node(node_for_adding, **attr)
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        self._bump()
+        super().add_nodes_from(nodes_for_adding, **attr)
+
+    def remove_node(self, n):
+        self._bump()
+        super().remove_node(n)
+
+    def remove_nodes_from(self, nodes):
+        self._bump()
+        super().remove_nodes_from(nodes)
+
+    def add_edge(self, u_of_edge, v_of_edge, **attr):
+        if not (u_of_edge in self._succ and v_of_edge in self._succ[u_of_edge]):
+            self._bump()
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        self._bump()
+        super().add_edges_from(ebunch_to_add, **attr)
+
+    def remove_edge(self, u, v):
+        self._bump()
+        super().remove_edge(u, v)
+
+    def remove_edges_from(self, ebunch):
+        self._bump()
+        super().remove_edges_from(ebunch)
+
+    def clear(self):
+        self._bump()
+        super().clear()
+
+    def clear_edges(self):
+        self._bump()
+        super().clear_edges()
+
+
+class WTOComponent(NamedTuple):
+    head: object
+    body: list
+
+
+class WTO:
+    """그래프 G 의 entry 기준 WTO.  version 은 계산 시점의 G.version."""
+
+    def __init__(self, G, entry, version: int = 0):
+        self.version = version
+
+        # DFS preorder – 같은 위상 안에서 순서를 결정적으로 만든다
+        order: dict = {}
+        if entry in G:
+            for n in nx.dfs_preorder_nodes(G, entry):
+                order[n] = len(order)
+        for n in G.nodes:                         # entry 에서 닿지 않는 노드는 뒤로
+            if n not in order:
+                order[n] = len(order)
+        self._order = order
+
+        self.elements: list = self._decompose(G, set(G.nodes))
+        self.position: dict = {}
+        self.heads: dict = {}                     # head → WTOComponent
+        self._flatten(self.elements)
+
+    # ─────────────────────────────────────────── 계산
+    def _decompose(self, G, nodes: set) -> list:
+        if not nodes:
+            return []
+        order = self._order
+        sub = G.subgraph(nodes)
+        sccs = list(nx.strongly_connected_components(sub))
+        cond = nx.condensation(sub, sccs)
+        first = [min(order[n] for n in c) for c in sccs]
+
+        out = []
+        for i in nx.lexicographical_topological_sort(cond, key=lambda i: first[i]):
+            c = sccs[i]
+            if len(c) == 1:
+                (n,) = c
+                if not sub.has_edge(n, n):
+                    out.append(n)
+                    continue
+            entries = [n for n in c if any(p not in c for p in G.predecessors(n))]
+            head = min(entries or c, key=order.__getitem__)
+            out.append(WTOComponent(head, self._decompose(G, c - {head})))
+        return out
+
+    def _flatten(self, elements: list) -> None:
+        for el in elements:
+            if isinstance(el, WTOComponent):
+                self.heads[el.head] = el
+                self.position[el.head] = len(self.position)
+                self._flatten(el.body)
+            else:
+                self.position[el] = len(self.position)
+
+    # ─────────────────────────────────────────── 조회
+    def worklist(self, initial=()) -> "WTOWorklist":
+        return WTOWorklist(self.position, initial)
+
+
+class WTOWorklist:
+    """WTO 위치가 가장 작은 노드부터 꺼내는 worklist (이미 들어 있는 노드는 다시 넣지 않음)"""
+
+    __slots__ = ("_pos", "_heap", "_members", "_seq")
+
+    def __init__(self, position: dict, initial=()):
+        self._pos = position
+        self._heap: list = []
+        self._members: set = set()
+        self._seq = 0
+        for n in initial:
+            self.append(n)
+
+    def append(self, node) -> None:
+        if node in self._members:
+            return
+        self._members.add(node)
+        self._seq += 1
+        # WTO 계산 뒤에 생긴 노드는 맨 뒤로
+        heapq.heappush(self._heap, (self._pos.get(node, len(self._pos)), self._seq, node))
+
+    def popleft(self):
+        _, _, node = heapq.heappop(self._heap)
+        self._members.discard(node)
+        return node
+
+    def copy(self) -> "WTOWorklist":
+        dup = WTOWorklist(self._pos)
+        dup._heap = list(self._heap)
+        dup._members = set(self._members)
+        dup._seq = self._seq
+        return dup
+
+    def __contains__(self, node) -> bool:
+        return node in self._members
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
@@ -1,15 +1,19 @@
 import json
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from typing import List
-from Analyzer.EnhancedSolidityVisitor import EnhancedSolidityVisitor
 from Analyzer.ContractAnalyzer import ContractAnalyzer
-from antlr4 import *
-from Parser.SolidityLexer import SolidityLexer
-from Parser.SolidityParser import SolidityParser
+from Utils.Helper import ParserHelpers
+from Utils import Startup
 
 app = FastAPI()
 contract_analyzer = ContractAnalyzer()
 
+
+@app.on_event("startup")
+async def _prewarm():
+    # 파서/solc import 와 DFA 워밍업을 백그라운드로 돌려 첫 편집 응답을 앞당긴다
+    Startup.prewarm(background=True)
+
 # 클라이언트 연결을 관리하는 클래스
 class ConnectionManager:
     def __init__(self):
@@ -33,74 +37,6 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
-def map_context_type(context_type):
-    context_mapping = {
-        'contract': 'interactiveSourceUnit',
-        'library': 'interactiveSourceUnit',
-        'interface': 'interactiveSourceUnit',
-        'enum': 'interactiveSourceUnit',
-        'struct': 'interactiveSourceUnit',
-        'function': 'interactiveSourceUnit',
-        'constructor': 'interactiveSourceUnit',
-        'fallback': 'interactiveSourceUnit',
-        'receive': 'interactiveSourceUnit',
-        'event': 'interactiveSourceUnit',
-        'error': 'interactiveSourceUnit',
-        'modifier': 'interactiveSourceUnit',
-        'stateVariableDeclaration': 'interactiveSourceUnit',
-        'enumMember': 'interactiveEnumUnit',
-        'structMember': 'interactiveStructUnit',
-        'simpleStatement': 'interactiveBlockUnit',
-        'if': 'interactiveBlockUnit',
-        'for': 'interactiveBlockUnit',
-        'while': 'interactiveBlockUnit',
-        'do': 'interactiveBlockUnit',
-        'try': 'interactiveBlockUnit',
-        'return': 'interactiveBlockUnit',
-        'break': 'interactiveBlockUnit',
-        'continue': 'interactiveBlockUnit',
-        'emit': 'interactiveBlockUnit',
-        'doWhileWhile': 'interactiveDoWhileUnit',
-        'catch': 'interactiveCatchClauseUnit',
-        'else_if': 'interactiveIfElseUnit',
-        'else': 'interactiveIfElseUnit',
-        'debugUnit' : 'debugUnit'
-    }
-
-    try:
-        return context_mapping[context_type]
-    except KeyError:
-        print(f"Warning: No mapping found for context_type '{context_type}'. Returning None.")
-        return None
-
-def generate_parse_tree(input_stream, context_type):
-    input_stream = InputStream(input_stream)
-    lexer = SolidityLexer(input_stream)
-    token_stream = CommonTokenStream(lexer)
-    parser = SolidityParser(token_stream)
-
-    context_rule = map_context_type(context_type)
-
-    if context_rule == 'interactiveStructUnit':
-        tree = parser.interactiveStructUnit()
-    elif context_rule == 'interactiveEnumUnit':
-        tree = parser.interactiveEnumUnit()
-    elif context_rule == 'interactiveBlockUnit':
-        tree = parser.interactiveBlockUnit()
-    elif context_rule == 'interactiveDoWhileUnit':
-        tree = parser.interactiveDoWhileUnit()
-    elif context_rule == 'interactiveIfElseUnit':
-        tree = parser.interactiveIfElseUnit()
-    elif context_rule == 'interactiveCatchClauseUnit':
-        tree = parser.interactiveCatchClauseUnit()
-    elif context_rule == 'debugUnit' :
-        tree = parser.debugUnit()
-    else:
-        tree = parser.interactiveSourceUnit()
-
-    return tree
-
-
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
@@ -117,8 +53,10 @@ async def websocket_endpoint(websocket: WebSocket):
             context_type = contract_analyzer.get_current_context_type()
 
             # Parse the received code based on context_type
-            tree = generate_parse_tree(code, context_type) # 어떤 문법규칙으로 파싱할건지
+            tree = ParserHelpers.generate_parse_tree(code, context_type,  # 어떤 문법규칙으로 파싱할건지 (LRU 캐시)
+                                                     tokens=contract_analyzer.edit_tokens())  # 증분 렉싱 결과 재사용
 
+            from Analyzer.EnhancedSolidityVisitor import EnhancedSolidityVisitor  # 생성된 파서 포함 → 지연 import
             visitor = EnhancedSolidityVisitor(contract_analyzer)
             visitor.visit(tree)
 
@@ -126,4 +64,21 @@ async def websocket_endpoint(websocket: WebSocket):
             result = contract_analyzer.get_analysis_result()
             await manager.send_personal_message(json.dumps(result), websocket)
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
\ No newline at end of file
+        manager.disconnect(websocket)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="SolQDebug WebSocket server")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8000)
+    ap.add_argument("--profile-startup", action="store_true",
+                    help="모듈별 import 시간 리포트를 출력하고 종료")
+    args = ap.parse_args()
+
+    if args.profile_startup:
+        Startup.profile_startup()
+    else:
+        import uvicorn
+        uvicorn.run(app, host=args.host, port=args.port)
@@ -48,7 +48,8 @@ def simulate_inputs(records):
         if code.strip():
             ctx = contract_analyzer.get_current_context_type()
             print(f"[test.py] Line {s}-{e}: ctx={ctx}, current_target_contract={contract_analyzer.current_target_contract}")
-            tree = ParserHelpers.generate_parse_tree(code, ctx, True)
+            tree = ParserHelpers.generate_parse_tree(code, ctx, True,
+                                                     tokens=contract_analyzer.edit_tokens())
             EnhancedSolidityVisitor(contract_analyzer).visit(tree)
 
         # ✨ ★ 여기서 바로 찍어 보기 ★ ✨
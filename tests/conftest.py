@@ -0,0 +1,109 @@
+"""
+공용 fixture – dataset/json/annotation 의 편집 trace 재생
+
+    python -m pytest -q tests
+"""
+import io
+import json
+import sys
+import contextlib
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+ANNOTATION_DIR = PROJECT_ROOT / "dataset" / "json" / "annotation"
+# 같은 trace 를 주석 입력 간격만 달리해 만든 세트 (interval_0 / 2 / 5 / 10)
+INTERVAL_DIR = PROJECT_ROOT / "Evaluation" / "RQ1_Latency" / "json_intervals"
+
+
+def load_trace(name: str, interval: int | None = None) -> list[dict]:
+    base = ANNOTATION_DIR if interval is None else INTERVAL_DIR / f"interval_{interval}"
+    with open(base / f"{name}_c_annot.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def trace_record(line: int, code: str, event: str = "add", end: int | None = None) -> dict:
+    return {"startLine": line, "endLine": end or line, "code": code, "event": event}
+
+
+# 주석 값을 고쳐 가며(modify) 매번 flush 하는 편집 – @GlobalVar 를 읽는 내부 함수 호출 포함
+GLOBAL_MODIFY = [
+    trace_record(1, "contract C {\n}", end=2),
+    trace_record(2, "    function ts(uint x) internal view returns (uint) {\n}", end=3),
+    trace_record(3, "        return block.timestamp + x;"),
+    trace_record(5, "    function f(uint n) public returns (uint) {\n}", end=6),
+    trace_record(6, "        uint a = ts(n);"),
+    trace_record(7, "        if (msg.sender == address(0)) {\n}", end=8),
+    trace_record(8, "            a = a + ts(1);"),
+    trace_record(10, "        return a;"),
+    trace_record(6, "// @Debugging BEGIN"),
+    trace_record(7, "// @GlobalVar block.timestamp = [100,100];"),
+    trace_record(8, "// @GlobalVar msg.sender = symbolicAddress 0;"),
+    trace_record(9, "// @LocalVar n = [1,5];"),
+    trace_record(10, "// @Debugging END"),
+    trace_record(7, "// @GlobalVar block.timestamp = [200,200];", "modify"),
+    trace_record(9, "// @LocalVar n = [3,3];", "modify"),
+    trace_record(8, "// @GlobalVar msg.sender = symbolicAddress 1;", "modify"),
+    trace_record(7, "// @GlobalVar block.timestamp = [150,300];", "modify"),
+]
+
+# 실제 trace 끝에 주석 modify → flush 를 이어 붙인 편집 (Dai.transferFrom 의 주석 라인 17 ~ 23)
+DAI_MODIFY = [
+    trace_record(17, "// @GlobalVar msg.sender = symbolicAddress 1;", "modify"),
+    trace_record(23, "// @LocalVar wad = [10,2000];", "modify"),
+    trace_record(21, "// @StateVar allowance[src][msg.sender] = [0,3000];", "modify"),
+    trace_record(17, "// @GlobalVar msg.sender = symbolicAddress 0;", "modify"),
+]
+
+# 엔진 동작을 바꾸는 기능의 기준 비교용 편집 trace – 켠 상태와 끈(전체 재해석) 상태의
+# 매 입력 뒤 ledger 가 같아야 한다
+EQUIV_TRACES = (
+    [p.name.replace("_c_annot.json", "") for p in sorted(ANNOTATION_DIR.glob("*_c_annot.json"))]
+    + [f"{d.name}/{p.name.replace('_c_annot.json', '')}"
+       for d in sorted(INTERVAL_DIR.iterdir()) for p in sorted(d.glob("*_c_annot.json"))]
+    + ["GLOBAL_MODIFY", "Dai+DAI_MODIFY"]
+)
+
+
+def equiv_trace(trace_id: str) -> list[dict]:
+    if trace_id == "GLOBAL_MODIFY":
+        return GLOBAL_MODIFY
+    if trace_id == "Dai+DAI_MODIFY":
+        return load_trace("Dai") + DAI_MODIFY
+    if "/" in trace_id:
+        interval, name = trace_id.split("/")
+        return load_trace(name, int(interval.replace("interval_", "")))
+    return load_trace(trace_id)
+
+
+def assert_same_ledgers(trace_id: str, got: list[dict], exp: list[dict]) -> None:
+    """replay 두 번의 결과가 매 입력 뒤마다 같은지 – 처음 어긋난 입력 번호를 알려 준다"""
+    assert len(got) == len(exp)
+    for idx, (g, e) in enumerate(zip(got, exp)):
+        assert g == e, f"{trace_id}: ledger differs after input #{idx}"
+
+
+def replay(records, contract_analyzer=None) -> list[dict]:
+    """trace 를 재생하고 매 입력 뒤의 ledger 를 {line: repr(records)} 로 모아 돌려준다"""
+    from Analyzer.ContractAnalyzer import ContractAnalyzer
+    from Analyzer.DebugUnitAnalyzer import DebugBatchManager
+    from Evaluation.RQ1_Latency.solqdebug_benchmark import simulate_inputs
+
+    ca = contract_analyzer or ContractAnalyzer()
+    bm = DebugBatchManager(ca, ca.snapman)
+    steps: list[dict] = []
+
+    def _record(idx, rec):
+        steps.append({ln: repr(v) for ln, v in sorted(ca.recorder.ledger.items())})
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulate_inputs(records, ca, bm, on_step=_record)
+    return steps
+
+
+@pytest.fixture
+def trace():
+    return load_trace
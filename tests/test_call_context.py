@@ -0,0 +1,17 @@
+"""
+CallStringManager – 재귀가 없는 호출에서는 컨텍스트 관리가 callee 를 그대로
+다시 해석한 것과 같은 ledger 를 남기는지 (편집 trace 의 매 입력마다 비교)
+"""
+import pytest
+
+from conftest import EQUIV_TRACES, assert_same_ledgers, equiv_trace, replay
+from Interpreter.CallContext import CallStringManager
+
+
+@pytest.mark.parametrize("trace_id", EQUIV_TRACES)
+def test_call_strings_match_direct_calls(trace_id, monkeypatch):
+    records = equiv_trace(trace_id)
+    managed = replay(records)
+    # 스택 · memo · 예산 없이 매번 callee 를 해석
+    monkeypatch.setattr(CallStringManager, "call", lambda self, fcfg, site, run: run())
+    assert_same_ledgers(trace_id, managed, replay(records))
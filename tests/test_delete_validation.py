@@ -0,0 +1,78 @@
+"""
+ContractAnalyzer.update_code(event="delete") – 삭제 후 코드 구문 검증
+"""
+import io
+import contextlib
+
+from conftest import load_trace, replay
+from Analyzer.ContractAnalyzer import ContractAnalyzer
+
+
+def _line_of(ca, text):
+    return next(ln for ln, code in ca.full_code_lines.items() if code.strip() == text)
+
+
+def _delete(ca, ln):
+    with contextlib.redirect_stdout(io.StringIO()):
+        ca.update_code(ln, ln, "", event="delete")
+
+
+def test_delete_code_line_with_annotations_present():
+    ca = ContractAnalyzer()
+    replay(load_trace("Dai"), ca)          # 끝에 // @ 주석 라인이 남아 있는 상태
+    assert any(c.lstrip().startswith("// @") for c in ca.full_code_lines.values())
+
+    stmt = "balanceOf[dst] = add(balanceOf[dst], wad);"
+    ln = _line_of(ca, stmt)
+    n_lines = len(ca.full_code_lines)
+    _delete(ca, ln)
+
+    assert len(ca.full_code_lines) == n_lines - 1
+    assert all(c.strip() != stmt for c in ca.full_code_lines.values())
+
+
+def test_delete_rejected_when_it_breaks_syntax():
+    ca = ContractAnalyzer()
+    replay(load_trace("Dai"), ca)
+
+    ln = _line_of(ca, "function sub(uint x, uint y) internal pure returns (uint z) {")
+    n_lines = len(ca.full_code_lines)
+    _delete(ca, ln)                        # '{' 없이 '}' 만 남는다
+
+    assert len(ca.full_code_lines) == n_lines
+
+
+def test_solc_mode_falls_back_to_fast_when_unavailable(monkeypatch):
+    from Utils.SolcService import solc_service, SolcUnavailable
+    calls = []
+
+    def unavailable(source, *a, **k):
+        calls.append(source)
+        raise SolcUnavailable("solc 0.8.0 is not installed")
+
+    ca = ContractAnalyzer(delete_validation="solc")
+    replay(load_trace("Dai"), ca)
+    monkeypatch.setattr(solc_service, "compile", unavailable)
+
+    first = _line_of(ca, "balanceOf[dst] = add(balanceOf[dst], wad);")
+    _delete(ca, first)
+    assert ca.delete_validation == "fast"          # 한 번 알리고 fast 로 전환
+    assert all(c.strip() != "balanceOf[dst] = add(balanceOf[dst], wad);"
+               for c in ca.full_code_lines.values())
+
+    _delete(ca, _line_of(ca, "balanceOf[src] = sub(balanceOf[src], wad);"))
+    assert len(calls) == 1                         # 이후 삭제는 solc 를 찾지 않는다
+
+
+def test_solc_mode_only_runs_after_fast_check(monkeypatch):
+    from Utils.SolcService import solc_service
+    calls = []
+    monkeypatch.setattr(solc_service, "compile", lambda src, *a, **k: calls.append(src))
+
+    ca = ContractAnalyzer(delete_validation="solc")
+    replay(load_trace("Dai"), ca)
+    n_lines = len(ca.full_code_lines)
+    _delete(ca, _line_of(ca, "function sub(uint x, uint y) internal pure returns (uint z) {"))
+
+    assert len(ca.full_code_lines) == n_lines
+    assert calls == []
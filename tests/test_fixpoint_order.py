@@ -0,0 +1,29 @@
+"""
+Engine.fixpoint / 메인 패스의 worklist 순서 – 순서를 바꿔도 해석 결과는 그대로여야 한다
+"""
+import re
+import pytest
+
+from conftest import EQUIV_TRACES, assert_same_ledgers, equiv_trace, load_trace, replay
+from Interpreter.Engine import Engine
+
+
+# AvatarArtMarketPlace._removeFromTokens :
+#   result = new uint256[](tokenCount) 후 루프에서 result[resultIndex] 만 쓰고 그대로 반환
+#   → widening 순서를 WTO 로 바꿨을 때 배열이 tokenCount 보다 길게(6 → 8, 11 → 13) 나왔다
+@pytest.mark.parametrize("interval, token_count", [(5, 6), (10, 11)])
+def test_returned_array_keeps_allocated_length(interval, token_count):
+    records = load_trace("AvatarArtMarketPlace", interval)
+    ledger = replay(records)[-1]
+
+    (ln,) = [ln for ln, v in ledger.items() if "'kind': 'return'" in v and "'result'" in v]
+    result = re.search(r"'result': '(\[.*?\]\])'", ledger[ln]).group(1)
+    assert len(re.findall(r"\[\d+,\d+\]", result)) == token_count
+
+
+@pytest.mark.parametrize("trace_id", EQUIV_TRACES)
+def test_wto_order_matches_fifo(trace_id, monkeypatch):
+    records = equiv_trace(trace_id)
+    wto = replay(records)
+    monkeypatch.setattr(Engine, "WTO_SCHEDULE", False)
+    assert_same_ledgers(trace_id, wto, replay(records))
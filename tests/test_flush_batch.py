@@ -0,0 +1,58 @@
+"""
+DebugBatchManager.flush_batch – 케이스 여러 개를 한 번에 돈 결과가
+케이스마다 따로 전체 재해석한 결과와 같은지 (trace 의 // @Debugging END 마다 비교)
+"""
+import io
+import re
+import contextlib
+
+import pytest
+
+from conftest import EQUIV_TRACES, equiv_trace
+from Analyzer.ContractAnalyzer import ContractAnalyzer
+from Analyzer.DebugUnitAnalyzer import DebugBatchManager
+from Evaluation.RQ1_Latency.solqdebug_benchmark import simulate_inputs
+
+
+def _bump(lines, i, d):
+    """i 번째 주석 라인의 정수를 모두 d 만큼 키운 케이스"""
+    return [(re.sub(r"\b\d+\b", lambda m: str(int(m.group()) + d), code) if j == i else code, s, e)
+            for j, (code, s, e) in enumerate(lines)]
+
+
+def _isolated(ca, bm, lines):
+    """케이스 하나만 적용하고 checkpoint 없이 전체 재해석 – 상태는 rollback"""
+    with ca.transaction():
+        ca._batch_targets.clear()
+        bm._apply(lines)
+        target = next(iter(ca._batch_targets), None)
+        if target is None:
+            return {}
+        ca.flush_reinterpret_target()
+        return bm._case_report(target)
+
+
+@pytest.mark.parametrize("trace_id", EQUIV_TRACES)
+def test_batch_matches_isolated_flushes(trace_id):
+    ca = ContractAnalyzer()
+    bm = DebugBatchManager(ca, ca.snapman)
+    checked = []
+
+    def check(ca, bm):
+        lines = list(bm._lines.values())
+        cases = [lines, lines[::-1]] + [_bump(lines, i, d) for i in range(len(lines)) for d in (1, 7)][:6]
+        expected = []
+        for case in cases:
+            try:
+                expected.append((case, _isolated(ca, bm, case)))
+            except Exception:       # 범위를 벗어난 값 등 – 따로 돌려도 실패하는 케이스는 뺀다
+                pass
+        got = bm.flush_batch([c for c, _ in expected])
+        for idx, ((case, exp), res) in enumerate(zip(expected, got)):
+            assert repr(res) == repr(exp), f"{trace_id}: case #{idx} {case}"
+        checked.append(len(expected))
+        bm.flush()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulate_inputs(equiv_trace(trace_id), ca, bm, on_end=check)
+    assert all(checked)
@@ -0,0 +1,30 @@
+"""
+DebugBatchManager.flush – 직전 flush 의 PrefixCheckpoint 에서 이어 돈 해석이
+매번 처음부터 재해석한 것과 같은 ledger 를 남기는지 (편집 trace 의 매 입력마다 비교)
+"""
+import io
+import contextlib
+
+import pytest
+
+from conftest import EQUIV_TRACES, GLOBAL_MODIFY, assert_same_ledgers, equiv_trace, replay
+from Analyzer.ContractAnalyzer import ContractAnalyzer
+from Analyzer.DebugUnitAnalyzer import DebugBatchManager
+from Evaluation.RQ1_Latency.solqdebug_benchmark import simulate_inputs
+
+
+@pytest.mark.parametrize("trace_id", EQUIV_TRACES)
+def test_resumed_flush_matches_full(trace_id, monkeypatch):
+    records = equiv_trace(trace_id)
+    resumed = replay(records)
+    monkeypatch.setattr(DebugBatchManager, "_checkpoint_for", lambda self, tx: None)
+    assert_same_ledgers(trace_id, resumed, replay(records))
+
+
+def test_modify_sequence_resumes():
+    # 위 비교가 실제로 이어 돈 flush 를 포함하는지
+    ca = ContractAnalyzer()
+    bm = DebugBatchManager(ca, ca.snapman)
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulate_inputs(GLOBAL_MODIFY, ca, bm)
+    assert bm.flush_stats["incremental"] > 0
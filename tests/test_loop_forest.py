@@ -0,0 +1,19 @@
+"""
+FunctionCFG.loop_forest – graph.version 로 캐시한 dominator tree / loop-nesting forest 가
+매번 새로 계산한 것과 같은 ledger 를 남기는지 (편집 trace 의 매 입력마다 비교)
+"""
+import pytest
+
+from conftest import EQUIV_TRACES, assert_same_ledgers, equiv_trace, replay
+from Utils.CFG import FunctionCFG
+from Utils.LoopForest import LoopForest
+
+
+@pytest.mark.parametrize("trace_id", EQUIV_TRACES)
+def test_cached_forest_matches_rebuilt(trace_id, monkeypatch):
+    records = equiv_trace(trace_id)
+    cached = replay(records)
+    monkeypatch.setattr(FunctionCFG, "loop_forest",
+                        lambda self: LoopForest(self.graph, self.entry_node,
+                                                getattr(self.graph, "version", 0)))
+    assert_same_ledgers(trace_id, cached, replay(records))
@@ -0,0 +1,23 @@
+"""
+DebugBatchManager._lower – 라인별로 저장해 둔 주석 lowering 이
+매번 새로 파싱·lowering 한 것과 같은 ledger 를 남기는지 (편집 trace 의 매 입력마다 비교)
+"""
+import pytest
+
+from conftest import EQUIV_TRACES, assert_same_ledgers, equiv_trace, replay
+from Analyzer.DebugUnitAnalyzer import DebugBatchManager
+from Analyzer.EnhancedSolidityVisitor import EnhancedSolidityVisitor
+from Utils.Helper import ParserHelpers
+
+
+def _lower_uncached(self, code, s, memo=None):
+    tree = ParserHelpers.generate_parse_tree(code, "debugUnit")
+    return tuple(EnhancedSolidityVisitor(self.analyzer).lower_debug_unit(tree))
+
+
+@pytest.mark.parametrize("trace_id", EQUIV_TRACES)
+def test_cached_lowering_matches_fresh(trace_id, monkeypatch):
+    records = equiv_trace(trace_id)
+    cached = replay(records)
+    monkeypatch.setattr(DebugBatchManager, "_lower", _lower_uncached)
+    assert_same_ledgers(trace_id, cached, replay(records))
@@ -0,0 +1,28 @@
+"""
+VariableEnv._merge_by_mode – 갈라진 변수만 merge 하는 join 이
+모든 변수를 merge 한 것과 같은 ledger 를 남기는지 (편집 trace 의 매 입력마다 비교)
+"""
+import copy
+
+import pytest
+
+from conftest import EQUIV_TRACES, assert_same_ledgers, equiv_trace, replay
+from Utils.Helper import VariableEnv
+
+
+@pytest.fixture
+def full_merge(monkeypatch):
+    """right 를 깊은 복사해 넘겨 – left 와 공유하는 변수·멤버·값이 없으니 모든 항목이 merge 된다"""
+    def patch():
+        merge = VariableEnv.__dict__["_merge_by_mode"].__func__
+        monkeypatch.setattr(VariableEnv, "_merge_by_mode", staticmethod(
+            lambda left, right, mode: merge(left, copy.deepcopy(right), mode)))
+    return patch
+
+
+@pytest.mark.parametrize("trace_id", EQUIV_TRACES)
+def test_delta_merge_matches_full_merge(trace_id, full_merge):
+    records = equiv_trace(trace_id)
+    delta = replay(records)
+    full_merge()
+    assert_same_ledgers(trace_id, delta, replay(records))
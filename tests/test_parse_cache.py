@@ -0,0 +1,35 @@
+"""
+ParserHelpers.generate_parse_tree – 파스 트리 LRU 캐시
+"""
+import io
+import contextlib
+
+import pytest
+
+from Utils.Helper import ParserHelpers
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    ParserHelpers.clear_parse_cache()
+    yield
+    ParserHelpers.clear_parse_cache()
+
+
+def _parse(src, **kw):
+    with contextlib.redirect_stderr(io.StringIO()):
+        return ParserHelpers.generate_parse_tree(src, "simpleStatement", **kw)
+
+
+def test_same_fragment_hits_cache():
+    a = _parse("uint256 x = 1;")
+    b = _parse("uint256 x = 1;")
+    assert a is b
+    assert ParserHelpers.parse_cache_stats()["hits"] == 1
+
+
+def test_leading_newlines_keep_their_error_lines():
+    plain = ParserHelpers.syntax_errors(_parse("uint256 x = ;"))
+    shifted = ParserHelpers.syntax_errors(_parse("\n\nuint256 x = ;"))
+    assert plain and shifted
+    assert [e.line + 2 for e in plain] == [e.line for e in shifted]
@@ -0,0 +1,24 @@
+"""
+VariableEnv.PERSISTENT – copy-on-write 환경이 매번 깊은 복사하던 환경과
+같은 ledger 를 남기는지 (편집 trace 의 매 입력마다 비교)
+"""
+import pytest
+
+from conftest import EQUIV_TRACES, assert_same_ledgers, equiv_trace, replay
+from Utils.Helper import VariableEnv
+
+
+@pytest.fixture
+def persistent_mode():
+    saved = VariableEnv.PERSISTENT
+    yield lambda on: setattr(VariableEnv, "PERSISTENT", on)
+    VariableEnv.PERSISTENT = saved
+
+
+@pytest.mark.parametrize("trace_id", EQUIV_TRACES)
+def test_persistent_matches_deepcopy(trace_id, persistent_mode):
+    records = equiv_trace(trace_id)
+    persistent_mode(False)
+    full = replay(records)
+    persistent_mode(True)
+    assert_same_ledgers(trace_id, replay(records), full)
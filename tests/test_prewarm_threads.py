@@ -0,0 +1,68 @@
+"""
+Utils.Startup prewarm – 백그라운드 파싱과 요청 처리 파싱이 겹칠 때
+"""
+import sys
+import threading
+
+import pytest
+
+from conftest import load_trace, replay
+from Utils.Helper import ParserHelpers, ParserPool
+from Utils.Startup import WARMUP_FRAGMENTS
+
+
+@pytest.fixture
+def contended(monkeypatch):
+    # release 마다 공유 DFA 초기화 + 잦은 스레드 전환 – 겹친 파싱이 풀·DFA 를 서로 건드리게 한다
+    monkeypatch.setattr(ParserPool, "DFA_STATE_LIMIT", 1)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    ParserHelpers.clear_parse_cache()
+    yield
+    sys.setswitchinterval(interval)
+    ParserHelpers.clear_parse_cache()
+
+
+def _warm_loop(stop: threading.Event, errors: list):
+    try:
+        while not stop.is_set():
+            for code, ctx in WARMUP_FRAGMENTS:
+                rule = ParserHelpers.map_context_type(ctx) or 'interactiveSourceUnit'
+                ParserHelpers._parse(code, rule, False, "ll")
+    except Exception as e:         # pragma: no cover – 실패 시 원인 보고용
+        errors.append(e)
+
+
+def test_parse_concurrent_with_warmup(contended):
+    records = load_trace("Dai")
+    expected = replay(records)
+
+    ParserHelpers.clear_parse_cache()
+    stop, errors = threading.Event(), []
+    t = threading.Thread(target=_warm_loop, args=(stop, errors), daemon=True)
+    t.start()
+    try:
+        got = replay(records)
+    finally:
+        stop.set()
+        t.join()
+
+    assert not errors
+    assert got == expected
+    stats = ParserHelpers.parse_cache_stats()
+    assert stats["size"] <= stats["misses"]
+
+
+def test_parse_waits_for_lock_holder():
+    done = threading.Event()
+
+    def parse():
+        ParserHelpers.generate_parse_tree("uint256 y = 2;", "simpleStatement", use_cache=False)
+        done.set()
+
+    with ParserHelpers._LOCK:
+        t = threading.Thread(target=parse, daemon=True)
+        t.start()
+        assert not done.wait(0.2)
+    t.join(5)
+    assert done.is_set()
@@ -0,0 +1,26 @@
+"""
+Engine.reinterpret_from – sparse(def-use) worklist 와 dense worklist 가
+같은 ledger 를 남기는지 (편집 trace 의 매 입력마다 비교)
+"""
+import pytest
+
+from conftest import EQUIV_TRACES, assert_same_ledgers, equiv_trace, replay
+from Interpreter.Engine import Engine
+
+
+@pytest.fixture
+def sparse_mode():
+    saved = Engine.SPARSE_REINTERPRET
+    yield lambda on: setattr(Engine, "SPARSE_REINTERPRET", on)
+    Engine.SPARSE_REINTERPRET = saved
+
+
+# 첫 방문 노드를 '안 바뀜' 으로 잘라 내던 버그는 AOC_BEP / DeltaNeutralPancakeWorker02 /
+# AvatarArtMarketPlace 에서 드러났다
+@pytest.mark.parametrize("trace_id", EQUIV_TRACES)
+def test_sparse_matches_dense(trace_id, sparse_mode):
+    records = equiv_trace(trace_id)
+    sparse_mode(False)
+    dense = replay(records)
+    sparse_mode(True)
+    assert_same_ledgers(trace_id, replay(records), dense)
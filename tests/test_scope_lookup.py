@@ -0,0 +1,165 @@
+"""
+ContractAnalyzer.find_*_context – ScopeIndex 조회 vs. 예전 선형 역방향 스캔
+(Evaluation/RQ1_Latency/context_lookup_benchmark.py 의 legacy_*)
+
+예전 스캔과 답이 다른 경우는 두 가지이고, 둘 다 괄호 짝을 잘못 맞춘 것이다.
+  ① 닫힌 블록을 건너뛰는 동안 만난 '}' 를 세지 않아, 중첩 블록(if/for 안의 if/for)
+     이 닫힌 직후 라인이 그 블록 헤더(parent) / 이미 닫힌 함수(function) /
+     이미 닫힌 컨트랙트(contract) 안에 있는 것으로 보았다.
+  ② 한 라인 안에서 짝이 맞는 '{...}' (to.call{value: v}(""), NatSpec '{Transfer}')
+     를 scope 를 여는 라인으로 보았다.
+편집 trace 위에서는 find_parent_context 만 ①/② 에 걸리고, 나머지 조회는 같은 답을 낸다.
+"""
+import json
+
+import pytest
+
+from conftest import ANNOTATION_DIR, replay
+from Analyzer.ContractAnalyzer import ContractAnalyzer
+from Evaluation.RQ1_Latency.context_lookup_benchmark import (
+    legacy_parent, legacy_contract, legacy_function, load_analyzer,
+)
+
+TRACES = sorted(p.name.replace("_c_annot.json", "") for p in ANNOTATION_DIR.glob("*_c_annot.json"))
+
+
+def legacy_struct(ca, line_number):
+    for line in range(line_number, 0, -1):
+        info = ca.line_info.get(line, {'open': 0, 'close': 0, 'cfg_nodes': []})
+        if info['open'] > 0 and info.get('cfg_nodes') and \
+                ca.determine_top_level_context(ca.full_code_lines[line]) == "struct":
+            texts = ca.line_tokens.leading_texts(line, 2)
+            return texts[1] if len(texts) == 2 else ca.full_code_lines[line].split()[1]
+    return None
+
+
+def enclosing_opener(ca, line_number):
+    """문자 단위로 괄호 짝을 맞추며 거슬러 올라간 line_number 의 scope 여는 라인 (기준 답)"""
+    depth = 0
+    for line in range(line_number, 0, -1):
+        for ch in reversed(ca.full_code_lines.get(line, "")):
+            if ch == "}":
+                depth += 1
+            elif ch == "{":
+                if depth == 0:
+                    return line
+                depth -= 1
+    return None
+
+
+def fixed_parent(ca, line_number):
+    line = enclosing_opener(ca, line_number - 1)
+    return ca.determine_top_level_context(ca.full_code_lines[line]) if line else "unknown"
+
+
+LEGACY = {
+    "find_parent_context": legacy_parent,
+    "find_contract_context": legacy_contract,
+    "find_function_context": legacy_function,
+    "find_struct_context": legacy_struct,
+}
+
+
+@pytest.mark.parametrize("name", TRACES)
+def test_lookups_match_legacy_on_traces(name, monkeypatch):
+    """trace 재생 중 analyze_context 가 부른 모든 조회를 예전 스캔과 비교"""
+    calls, diffs = [], []
+
+    def wrap(attr, new_fn):
+        def lookup(self, line_number):
+            got = new_fn(self, line_number)
+            old = LEGACY[attr](self, line_number)
+            calls.append(attr)
+            if got != old:
+                diffs.append((attr, line_number, got, old, fixed_parent(self, line_number)))
+            return got
+        return lookup
+
+    for attr in LEGACY:
+        monkeypatch.setattr(ContractAnalyzer, attr, wrap(attr, getattr(ContractAnalyzer, attr)))
+    with open(ANNOTATION_DIR / f"{name}_c_annot.json", encoding="utf-8") as f:
+        replay(json.load(f))
+
+    assert calls
+    # 달라진 곳은 find_parent_context 이고, 새 답이 괄호 짝을 제대로 맞춘 답이다 (①/②)
+    for attr, ln, got, old, fixed in diffs:
+        assert attr == "find_parent_context", (attr, ln, got, old)
+        assert got == fixed, (ln, got, old)
+
+
+# ─────────────────────────────────────────── 의도한 차이
+def _analyzer(src):
+    return load_analyzer(src.split("\n"))
+
+
+def _line(ca, text):
+    return next(ln for ln, code in ca.full_code_lines.items() if code.strip() == text)
+
+
+def test_parent_after_nested_blocks_close():          # ①
+    ca = _analyzer(
+        "contract C {\n"
+        "    function f(uint a) public {\n"
+        "        if (a > 0) {\n"
+        "            for (uint i = 0; i < a; i++) {\n"
+        "                a--;\n"
+        "            }\n"
+        "        }\n"
+        "        a = 1;\n"
+        "    }\n"
+        "}")
+    ln = _line(ca, "a = 1;")
+    assert legacy_parent(ca, ln) == "if"
+    assert ca.find_parent_context(ln) == "function"
+    assert ca.find_function_context(ln) == legacy_function(ca, ln) == "f"
+
+
+@pytest.mark.parametrize("stmt", [
+    '(bool ok, ) = to.call{value: v}("");',
+    "/// @dev emits a {Transfer} event.",
+])
+def test_parent_after_balanced_braces_on_one_line(stmt):   # ②
+    ca = _analyzer(
+        "contract C {\n"
+        "    function f(address to, uint v) public {\n"
+        f"        {stmt}\n"
+        "        v = 1;\n"
+        "    }\n"
+        "}")
+    ln = _line(ca, "v = 1;")
+    assert legacy_parent(ca, ln) != "function"
+    assert ca.find_parent_context(ln) == "function"
+
+
+def test_function_and_contract_after_nested_blocks_close():   # ①
+    ca = _analyzer(
+        "contract C {\n"
+        "    function f() public {\n"
+        "        if (true) {\n"
+        "        }\n"
+        "    }\n"
+        "    uint x;\n"
+        "    function g() public {\n"
+        "        x = 1;\n"
+        "    }\n"
+        "    struct S {\n"
+        "        uint a;\n"
+        "    }\n"
+        "}\n"
+        "\n"
+        "contract D {\n"
+        "}")
+    lines = range(1, len(ca.full_code_lines) + 1)
+    # 라인 1 ~ 16
+    function = [None, "f", "f", "f", None, None, "g", "g", None, None, None, None, None, None, None, None]
+    contract = ["C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", None, None, "D", None]
+    assert [ca.find_function_context(ln) for ln in lines] == function
+    assert [ca.find_contract_context(ln) for ln in lines] == contract
+
+    # 예전 스캔은 닫는 '}' 라인과 그 뒤를, 건너뛴 블록 안의 '}' 를 놓쳐 이미 닫힌 scope 로 보냈다
+    old_function = [legacy_function(ca, ln) for ln in lines]
+    old_contract = [legacy_contract(ca, ln) for ln in lines]
+    assert [ln for ln in lines if old_function[ln - 1] != function[ln - 1]] == [5, 6, 9, 12, 13, 14, 16]
+    assert {old_function[ln - 1] for ln in (5, 6, 9, 12, 13, 14, 16)} == {"f"}
+    assert [ln for ln in lines if old_contract[ln - 1] != contract[ln - 1]] == [13, 14, 16]
+    assert {old_contract[ln - 1] for ln in (13, 14, 16)} == {"C"}
@@ -0,0 +1,16 @@
+"""
+SnapshotManager.UNDO_LOG – flush 전후 상태를 undo log 로 되돌린 것이
+store 전체를 deepcopy 해 되돌린 것과 같은 ledger 를 남기는지 (편집 trace 의 매 입력마다 비교)
+"""
+import pytest
+
+from conftest import EQUIV_TRACES, assert_same_ledgers, equiv_trace, replay
+from Utils.Snapshot import SnapshotManager
+
+
+@pytest.mark.parametrize("trace_id", EQUIV_TRACES)
+def test_undo_log_matches_deepcopy(trace_id, monkeypatch):
+    records = equiv_trace(trace_id)
+    undo = replay(records)
+    monkeypatch.setattr(SnapshotManager, "UNDO_LOG", False)
+    assert_same_ledgers(trace_id, undo, replay(records))
@@ -0,0 +1,69 @@
+"""
+CFGNode / Statement 의 src_line – 분석기마다 자기 LineStore 의 핸들로 저장되는지
+"""
+import sys
+import threading
+
+import pytest
+
+from conftest import load_trace, replay
+from Analyzer.ContractAnalyzer import ContractAnalyzer
+from Utils.LineStore import LineHandle
+
+NAMES = ["Dai", "Edentoken", "ATIDStaking"]
+
+
+def _objects(ca):
+    for c in ca.contract_cfgs.values():
+        nodes = [c.state_variable_node]
+        for f in c.functions.values():
+            nodes += list(f.graph.nodes)
+        for n in nodes:
+            yield n
+            yield from n.statements
+
+
+def _src_lines(ca):
+    return sorted((type(o).__name__, getattr(o, "name", ""), repr(o.src_line)) for o in _objects(ca))
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_src_line_uses_own_store(name):
+    ca = ContractAnalyzer()
+    replay(load_trace(name), ca)
+
+    refs = [o.__dict__.get("_src_line_ref") for o in _objects(ca)]
+    handles = [r for r in refs if isinstance(r, LineHandle)]
+    assert handles and all(h._store is ca.lines for h in handles)
+    # 범위 안의 라인 번호는 모두 핸들로 넘어왔다 (anchor 를 빠뜨린 생성 지점이 없다)
+    assert not [r for r in refs if type(r) is int and 1 <= r <= ca.lines.size]
+
+
+def test_analyzers_interleaved_in_threads():
+    solo = {}
+    for name in NAMES:
+        ca = ContractAnalyzer()
+        solo[name] = (replay(load_trace(name), ca), _src_lines(ca))
+
+    got, errors = {}, []
+
+    def run(name):
+        try:
+            ca = ContractAnalyzer()
+            got[name] = (replay(load_trace(name), ca), _src_lines(ca))
+        except Exception as e:     # pragma: no cover – 실패 시 원인 보고용
+            errors.append(e)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=run, args=(n,), daemon=True) for n in NAMES]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert not errors
+    assert got == solo
@@ -0,0 +1,84 @@
+"""
+FunctionSummaries – 내부 함수 호출 요약 캐시가 다시 해석한 것과 같은 결과를 내는지
+"""
+import io
+import contextlib
+
+import pytest
+
+from conftest import EQUIV_TRACES, assert_same_ledgers, equiv_trace, replay
+from Analyzer.ContractAnalyzer import ContractAnalyzer
+from Analyzer.DebugUnitAnalyzer import DebugBatchManager
+from Evaluation.RQ1_Latency.solqdebug_benchmark import simulate_inputs
+from Interpreter.Semantics import Summary
+from Utils.CFG import CFGNode
+
+
+def _rec(line, code, event="add", end=None):
+    return {"startLine": line, "endLine": end or line, "code": code, "event": event}
+
+
+# callee 가 전역(block.timestamp)만 읽는 경우 – env 키는 "block.timestamp"
+GLOBAL_READ = [
+    _rec(1, "contract C {\n}", end=2),
+    _rec(2, "    function ts(uint x) internal view returns (uint) {\n}", end=3),
+    _rec(3, "        return block.timestamp + x;"),
+    _rec(5, "    function f() public returns (uint) {\n}", end=6),
+    _rec(6, "        uint a = ts(1);"),
+    _rec(7, "        return a;"),
+    _rec(6, "// @Debugging BEGIN"),
+    _rec(7, "// @GlobalVar block.timestamp = [100,100];"),
+    _rec(8, "// @Debugging END"),
+    _rec(7, "// @GlobalVar block.timestamp = [200,200];", "modify"),
+]
+
+
+def _a(ledger):
+    (v,) = [v for v in ledger.values() if "varDeclaration" in v]
+    return v
+
+
+def test_global_read_enters_summary_key():
+    ca = ContractAnalyzer()
+    steps = replay(GLOBAL_READ, ca)
+
+    assert "'a': '[101,101]'" in _a(steps[-2])
+    assert "'a': '[201,201]'" in _a(steps[-1])
+    assert "block.timestamp" in ca.summaries._entry(
+        ca.contract_cfgs["C"].functions["ts"])[1]
+
+    plain = ContractAnalyzer()
+    plain.summaries.enabled = False
+    assert replay(GLOBAL_READ, plain) == steps
+
+
+def test_lookup_does_not_rewalk_callee(monkeypatch):
+    ca = ContractAnalyzer()
+    bm = DebugBatchManager(ca, ca.snapman)
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulate_inputs(GLOBAL_READ[:-1], ca, bm)
+
+    # 그래프가 그대로면 stamp / read-set 은 저장된 것을 쓰고 callee CFG 를 다시 훑지 않는다
+    walked = []
+    collect = Summary._collect
+    monkeypatch.setattr(Summary, "_collect", lambda *a: walked.append(a) or collect(*a))
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulate_inputs(GLOBAL_READ[-1:], ca, bm)
+    assert "'a': '[201,201]'" in repr(ca.recorder.ledger.items())
+    assert not walked
+
+    # 그래프가 바뀌면 다시 훑고 그 callee 의 요약을 버린다
+    ts = ca.contract_cfgs["C"].functions["ts"]
+    before = ca.summaries.stats()["invalidations"]
+    ts.graph.add_node(CFGNode("extra"))
+    entry = ca.summaries._entry(ts)
+    assert walked and not entry[2]
+    assert ca.summaries.stats()["invalidations"] == before + 1
+
+
+@pytest.mark.parametrize("trace_id", EQUIV_TRACES)
+def test_summaries_match_reinterpretation(trace_id):
+    records = equiv_trace(trace_id)
+    plain = ContractAnalyzer()
+    plain.summaries.enabled = False
+    assert_same_ledgers(trace_id, replay(records), replay(records, plain))
@@ -0,0 +1,75 @@
+"""
+ContractAnalyzer.transaction() – flush 를 감싼 트랜잭션의 rollback
+"""
+import io
+import contextlib
+
+import pytest
+
+from conftest import EQUIV_TRACES, assert_same_ledgers, equiv_trace, load_trace, replay
+from Analyzer.ContractAnalyzer import ContractAnalyzer
+from Analyzer.DebugUnitAnalyzer import DebugBatchManager
+from Evaluation.RQ1_Latency.solqdebug_benchmark import simulate_inputs
+
+
+def _state(ca):
+    fcfgs = [f for c in ca.contract_cfgs.values() for f in c.functions.values()]
+    return (repr(sorted(ca.recorder.ledger.items())),
+            [repr(sorted(dict.items(f.related_variables))) for f in fcfgs],
+            [repr(sorted(dict.items(n.variables or {}))) for f in fcfgs for n in f.graph.nodes],
+            [repr(sorted(dict.items(c.globals))) for c in ca.contract_cfgs.values()])
+
+
+# DeltaNeutralPancakeWorker02 : 해석 중 함수 밖(// @Debugging END) 라인에도 기록이 남는다
+@pytest.mark.parametrize("name", ["Dai", "Edentoken", "DeltaNeutralPancakeWorker02"])
+def test_flush_rolled_back(name):
+    ca = ContractAnalyzer()
+    bm = DebugBatchManager(ca, ca.snapman)
+    touched = []
+
+    def check(ca, bm):
+        before = _state(ca)
+        with ca.transaction() as tx:
+            bm.flush()
+            touched.append({f.function_name for c in ca.contract_cfgs.values()
+                            for f in c.functions.values() if id(f) in tx._functions})
+        assert _state(ca) == before
+        bm.flush()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulate_inputs(load_trace(name), ca, bm, on_end=check)
+    assert touched and all(touched)
+
+
+def test_begin_saves_nothing_up_front():
+    ca = ContractAnalyzer()
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulate_inputs(load_trace("Dai"), ca, DebugBatchManager(ca, ca.snapman))
+
+    with ca.transaction() as tx:
+        assert not tx._objs and not tx._dicts and not tx._ledgers
+
+
+@pytest.mark.parametrize("trace_id", EQUIV_TRACES)
+def test_rolled_back_flush_keeps_ledgers(trace_id):
+    """flush 가 일어난 입력마다 트랜잭션 flush + rollback 을 한 번 더 – 상태도 ledger 도 그대로"""
+    records = equiv_trace(trace_id)
+    ca = ContractAnalyzer()
+    bm = DebugBatchManager(ca, ca.snapman)
+    steps, in_testcase = [], [False]
+
+    def step(idx, rec):
+        code = rec["code"].lstrip()
+        if code.startswith("// @Debugging BEGIN"):
+            in_testcase[0] = True
+        elif code.startswith("// @Debugging END") or (code.startswith("// @") and not in_testcase[0]):
+            in_testcase[0] = False
+            before = _state(ca)
+            with ca.transaction():
+                bm.flush()
+            assert _state(ca) == before, f"{trace_id}: state differs after input #{idx}"
+        steps.append({ln: repr(v) for ln, v in sorted(ca.recorder.ledger.items())})
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulate_inputs(records, ca, bm, on_step=step)
+    assert_same_ledgers(trace_id, steps, replay(records))
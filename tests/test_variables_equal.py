@@ -0,0 +1,40 @@
+"""
+VariableEnv.variables_equal – 객체 동일성(is) 으로 건너뛰는 비교가
+구조 전체를 비교한 것과 같은 ledger 를 남기는지 (편집 trace 의 매 입력마다 비교)
+"""
+import copy
+
+import pytest
+
+from conftest import EQUIV_TRACES, assert_same_ledgers, equiv_trace, replay
+from Utils.Helper import VariableEnv
+
+
+@pytest.fixture
+def structural_equal(monkeypatch):
+    """양쪽을 따로 깊은 복사해 넘겨 – 공유 객체가 없으므로 동일성 지름길이 한 번도 맞지 않는다"""
+    def patch():
+        depth = [0]
+
+        def wrap(fn):
+            def run(a, b):
+                if depth[0]:
+                    return fn(a, b)
+                depth[0] += 1
+                try:
+                    return fn(copy.deepcopy(a), copy.deepcopy(b))
+                finally:
+                    depth[0] -= 1
+            return staticmethod(run)
+
+        for name in ("variables_equal", "_var_equal", "_compare_array_elements"):
+            monkeypatch.setattr(VariableEnv, name, wrap(VariableEnv.__dict__[name].__func__))
+    return patch
+
+
+@pytest.mark.parametrize("trace_id", EQUIV_TRACES)
+def test_identity_shortcut_matches_structural(trace_id, structural_equal):
+    records = equiv_trace(trace_id)
+    fast = replay(records)
+    structural_equal()
+    assert_same_ledgers(trace_id, fast, replay(records))
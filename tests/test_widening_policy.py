@@ -0,0 +1,29 @@
+"""
+WideningPolicy – 기본 정책이 정책 도입 전의 고정 widening
+(delay = 추정 반복 횟수를 [1, 20] 로 자른 값, threshold 없음) 과 같은 ledger 를
+남기는지 (편집 trace 의 매 입력마다 비교)
+"""
+import pytest
+
+from conftest import EQUIV_TRACES, assert_same_ledgers, equiv_trace, replay
+from Interpreter.WideningPolicy import WideningPolicy
+from Utils.Helper import VariableEnv
+
+
+@pytest.fixture
+def fixed_widening(monkeypatch):
+    def patch():
+        monkeypatch.setattr(WideningPolicy, "delay_for", lambda self, engine, head, env:
+                            min(20, max(1, engine._estimate_loop_iterations(head, env))))
+        monkeypatch.setattr(WideningPolicy, "thresholds_for", lambda self, fcfg, env: [])
+        monkeypatch.setattr(WideningPolicy, "widen", lambda self, old, new, thresholds:
+                            VariableEnv.join_variables_with_widening(old, new))
+    return patch
+
+
+@pytest.mark.parametrize("trace_id", EQUIV_TRACES)
+def test_default_policy_matches_fixed_widening(trace_id, fixed_widening):
+    records = equiv_trace(trace_id)
+    policy = replay(records)
+    fixed_widening()
+    assert_same_ledgers(trace_id, policy, replay(records))